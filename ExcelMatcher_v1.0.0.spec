@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('seller_assets/user_manual_v1.0.0.html', 'seller_assets'), ('assets', 'assets'), ('presets.json', '.'), ('replacements.json', '.')]
 binaries = []
-hiddenimports = ['pandas', 'xlwings', 'openpyxl', 'xlsxwriter', 'requests', 'PIL', 'PIL.Image', 'PIL.ImageTk', 'rapidfuzz', 'calamine', 'tkinterdnd2', 'excel_io', 'excel_io_additions']
+hiddenimports = ['pandas', 'xlwings', 'openpyxl', 'xlsxwriter', 'requests', 'PIL', 'PIL.Image', 'PIL.ImageTk', 'rapidfuzz', 'calamine', 'pyarrow', 'tkinterdnd2', 'excel_io', 'excel_io_additions']
 tmp_ret = collect_all('Pillow')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('tkinterdnd2')
@@ -22,7 +22,7 @@ rm -rf dist build *.spec
 
 # 0. Pre-check & Install Critical Dependencies
 echo "[SETUP] Installing critical dependencies..."
-pip install requests Pillow pyinstaller pandas openpyxl xlsxwriter xlwings rapidfuzz python-calamine tkinterdnd2 --upgrade
+pip install requests Pillow pyinstaller pandas openpyxl xlsxwriter xlwings rapidfuzz python-calamine pyarrow tkinterdnd2 --upgrade
 
 # Build using CLI arguments (avoiding Spec file Unicode path issues)
 echo "[BUILD] PyInstaller 실행 중 (CLI Mode)..."
@@ -4,7 +4,7 @@ echo [BUILD] ExcelMatcher Windows 빌드 시작...
 
 REM PyInstaller 및 주요 의존성 확인/설치
 echo [SETUP] Installing critical dependencies...
-pip install requests Pillow pyinstaller pandas openpyxl xlsxwriter xlwings rapidfuzz python-calamine --upgrade
+pip install requests Pillow pyinstaller pandas openpyxl xlsxwriter xlwings rapidfuzz python-calamine pyarrow --upgrade
 
 REM 이전 빌드 정리
 if exist "dist" rmdir /s /q "dist"
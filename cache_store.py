@@ -0,0 +1,54 @@
+import os
+import json
+import hashlib
+
+from config import CACHE_DIR
+
+
+def cache_dir(name):
+    """Returns (and creates) a cache sub directory under APP_DATA_DIR/cache."""
+    path = os.path.join(CACHE_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_fingerprint(file_path):
+    """(absolute path, size, mtime) of a source file - changes whenever the file does."""
+    st = os.stat(file_path)
+    return [os.path.abspath(file_path), st.st_size, st.st_mtime_ns]
+
+
+def make_key(*parts):
+    """Stable hex key for any JSON-like settings (dict order does not matter)."""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def touch(path):
+    """Marks a cache entry as recently used (LRU order is file mtime)."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def evict_lru(directory, max_bytes):
+    """Deletes least recently used entries until the directory fits in max_bytes."""
+    try:
+        entries = []
+        for name in os.listdir(directory):
+            p = os.path.join(directory, name)
+            if os.path.isfile(p):
+                st = os.stat(p)
+                entries.append((st.st_mtime, st.st_size, p))
+    except OSError:
+        return
+    total = sum(e[1] for e in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(p)
+            total -= size
+        except OSError:
+            pass
@@ -29,6 +29,12 @@ APP_DATA_DIR = get_app_data_dir()
 PRESET_FILE = os.path.join(APP_DATA_DIR, "presets.json")
 REPLACE_FILE = os.path.join(APP_DATA_DIR, "replacements.json")
 
+# Disk caches (prepared targets, ...) and their size budget (LRU eviction)
+CACHE_DIR = os.path.join(APP_DATA_DIR, "cache")
+TARGET_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+PARSE_CACHE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+FUZZY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 # Prioritize local license.lic (Portable Mode)
 _local_lic = os.path.join(os.getcwd(), "license.lic")
 if os.path.exists(_local_lic):
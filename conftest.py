@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    """Every test gets its own cache directory (targets, parsed sheets, fuzzy matches), not APP_DATA_DIR/cache."""
+    import config, cache_store
+    cache = str(tmp_path / "cache")
+    monkeypatch.setattr(config, "CACHE_DIR", cache)
+    monkeypatch.setattr(cache_store, "CACHE_DIR", cache)
+    return cache
@@ -1,7 +1,25 @@
-import pandas as pd, os, csv, zipfile
+import pandas as pd, numpy as np, os, csv, json, zipfile
 import xml.etree.ElementTree as ET
 import openpyxl
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+    _NULLABLE_TYPES = {
+        pa.int64(): pd.Int64Dtype(), pa.float64(): pd.Float64Dtype(), pa.bool_(): pd.BooleanDtype(),
+        pa.string(): pd.StringDtype(), pa.large_string(): pd.StringDtype(),
+    }
+    _ARROW_STRINGS = {pa.string(): pd.StringDtype("pyarrow"), pa.large_string(): pd.StringDtype("pyarrow")}
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# compact_strings: text columns with at most this share of distinct values become categoricals
+COMPACT_CATEGORY_RATIO = 0.5
+# rows per chunk when filters are evaluated while reading (read_table_file(filters=...))
+FILTER_CHUNK_ROWS = 100000
+
 def fast_xlsx_sheets(file_path):
     """Extremely fast sheet name extractor for .xlsx using zipfile and XML parsing."""
     try:
@@ -18,6 +36,116 @@ def fast_xlsx_sheets(file_path):
     except:
         return []
 
+_XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+def _xlsx_col_index(ref):
+    """'AB12' -> 27 (0-based column of a cell reference)."""
+    idx = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        idx = idx * 26 + ord(ch.upper()) - 64
+    return idx - 1
+
+def _xlsx_text(elem):
+    # plain or rich text runs; phonetic guides (rPh) are not part of the value
+    parts = elem.findall(_XLSX_NS + 't') + elem.findall(f'{_XLSX_NS}r/{_XLSX_NS}t')
+    return "".join(t.text or "" for t in parts)
+
+def fast_xlsx_header(file_path, sheet_name=0, header_row=1):
+    """
+    Header row of an .xlsx sheet straight from the zip, like fast_xlsx_sheets: the sheet XML is
+    read up to the header row and the shared strings only up to the highest index it uses
+    (openpyxl loads all shared strings and styles first). Returns None whenever the row holds
+    anything but text (numbers/dates need the styles), so the caller falls back to openpyxl.
+    """
+    try:
+        with zipfile.ZipFile(file_path, 'r') as z:
+            with z.open('xl/workbook.xml') as f:
+                sheets = ET.parse(f).getroot().findall(f'.//{_XLSX_NS}sheet')
+            if isinstance(sheet_name, int):
+                sheet = sheets[sheet_name]
+            else:
+                sheet = next(s for s in sheets if s.get('name') == sheet_name)
+            rid = sheet.get(_XLSX_REL_NS + 'id')
+            with z.open('xl/_rels/workbook.xml.rels') as f:
+                target = next(r.get('Target') for r in ET.parse(f).getroot() if r.get('Id') == rid)
+            target = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+
+            cells, max_col, found = {}, 0, False
+            with z.open(target) as f:
+                for _, elem in ET.iterparse(f):
+                    tag = elem.tag
+                    if tag == _XLSX_NS + 'dimension':
+                        # openpyxl pads the row up to the sheet's last column
+                        last = elem.get('ref', 'A1').split(':')[-1]
+                        max_col = _xlsx_col_index(last) + 1
+                    elif tag == _XLSX_NS + 'row':
+                        if elem.get('r') is None:
+                            return None
+                        if int(elem.get('r')) == header_row:
+                            found = True
+                            for c in elem.findall(_XLSX_NS + 'c'):
+                                kind = c.get('t')
+                                col = _xlsx_col_index(c.get('r'))
+                                if kind == 'inlineStr':
+                                    cells[col] = _xlsx_text(c.find(_XLSX_NS + 'is'))
+                                elif kind in ('s', 'str'):
+                                    v = c.find(_XLSX_NS + 'v')
+                                    if v is None:
+                                        continue
+                                    cells[col] = int(v.text) if kind == 's' else (v.text or "")
+                                elif c.find(_XLSX_NS + 'v') is not None:
+                                    return None
+                            break
+                        if int(elem.get('r')) > header_row:
+                            break
+                        elem.clear()
+            if not found:
+                return None
+
+            shared_idx = [v for v in cells.values() if isinstance(v, int)]
+            if shared_idx:
+                need, strings = max(shared_idx), []
+                with z.open('xl/sharedStrings.xml') as f:
+                    for _, elem in ET.iterparse(f):
+                        if elem.tag == _XLSX_NS + 'si':
+                            strings.append(_xlsx_text(elem))
+                            elem.clear()
+                            if len(strings) > need:
+                                break
+                cells = {k: strings[v] if isinstance(v, int) else v for k, v in cells.items()}
+
+            width = max(max_col, max(cells) + 1 if cells else 0)
+            return [str(cells[i]).strip() if i in cells else f"Unnamed: {i}" for i in range(width)]
+    except Exception:
+        return None
+
+# CSV encodings tried in this order
+CSV_ENCODINGS = ['utf-8-sig', 'cp949', 'utf-8', 'euc-kr']
+
+def _csv_encodings(file_path, block_size=1 << 20):
+    """
+    CSV_ENCODINGS from the first one that decodes the whole file, like a full read_csv
+    would accept it; every encoding when none does (the parser reports the error).
+    The file is decoded in blocks, so the check does not depend on any chunk size.
+    """
+    import codecs
+    for i, enc in enumerate(CSV_ENCODINGS):
+        decoder = codecs.getincrementaldecoder(enc)()
+        try:
+            with open(file_path, 'rb') as f:
+                while True:
+                    data = f.read(block_size)
+                    decoder.decode(data, final=not data)
+                    if not data:
+                        break
+        except UnicodeDecodeError:
+            continue
+        return CSV_ENCODINGS[i:]
+    return CSV_ENCODINGS
+
 def _sniff_csv(file_path, enc):
     # ... (existing code)
     try:
@@ -32,6 +160,7 @@ def _sniff_csv(file_path, enc):
 
 import shutil
 import tempfile
+import threading
 import uuid
 
 class SafeExcelReader:
@@ -106,6 +235,9 @@ def read_header_file(file_path, sheet_name=0, header_row=1):
             header_idx = header_row - 1
             
             if ext == '.xlsx':
+                headers = fast_xlsx_header(path_to_read, sheet_name, header_row)
+                if headers is not None:
+                    return headers
                 # Use openpyxl read_only for speed
                 try:
                     wb = openpyxl.load_workbook(path_to_read, read_only=True, data_only=True)
@@ -132,7 +264,8 @@ def read_header_file(file_path, sheet_name=0, header_row=1):
                 df=pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx, nrows=0)
             elif ext=='.csv':
                 df=None
-                for enc in ['cp949','utf-8','euc-kr']:
+                # same order as the parsers: a BOM must not end up in the first header
+                for enc in CSV_ENCODINGS:
                     try:
                         sep=_sniff_csv(path_to_read, enc)
                         df=pd.read_csv(path_to_read, header=header_idx, nrows=0, encoding=enc, sep=sep, engine='python')
@@ -146,44 +279,390 @@ def read_header_file(file_path, sheet_name=0, header_row=1):
     except:
         return []
 
-def read_table_file(file_path, sheet_name, header_row, usecols):
+# header/sheet lookups for dialogs are cached per file fingerprint (path, size, mtime)
+SCAN_CACHE_ENTRIES = 4096
+# files scanned concurrently by prescan_files
+PRESCAN_WORKERS = 8
+_SCAN_CACHE = {}
+_SCAN_LOCK = threading.Lock()
+
+def _scan_cached(key, file_path, load):
+    try:
+        from cache_store import file_fingerprint
+        key = (key, *file_fingerprint(file_path))
+    except OSError:
+        return load()
+    with _SCAN_LOCK:
+        hit = _SCAN_CACHE.get(key)
+    if hit is not None:
+        return list(hit)
+    value = load()
+    # failed reads ([]) are not cached: the next dialog tries again
+    if value:
+        with _SCAN_LOCK:
+            if len(_SCAN_CACHE) >= SCAN_CACHE_ENTRIES:
+                _SCAN_CACHE.pop(next(iter(_SCAN_CACHE)))
+            _SCAN_CACHE[key] = tuple(value)
+    return value
+
+def cached_sheet_names(file_path):
+    """get_sheet_names, remembered until the file changes."""
+    return _scan_cached(("sheets",), file_path, lambda: get_sheet_names(file_path))
+
+def cached_header(file_path, sheet_name=0, header_row=1):
+    """read_header_file, remembered until the file changes."""
+    return _scan_cached(("header", sheet_name, header_row), file_path,
+                        lambda: read_header_file(file_path, sheet_name, header_row))
+
+def prescan_files(files, workers=PRESCAN_WORKERS):
+    """
+    Sheet names and header row of every file ({'path', 'sheet', 'header'} dicts, sheet None =
+    first sheet) read on a thread pool into the scan cache. Returns [(sheets, headers)] in order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _scan(f):
+        sheets = cached_sheet_names(f['path'])
+        sheet = f.get('sheet') or (sheets[0] if sheets else None)
+        headers = cached_header(f['path'], sheet, f.get('header', 1)) if sheet else []
+        return sheets, headers
+
+    if not files:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(files))), thread_name_prefix="prescan") as pool:
+        return list(pool.map(_scan, files))
+
+def read_table_file(file_path, sheet_name, header_row, usecols, use_cache=True, typed=False, compact=False,
+                    filters=None, cancel_check=lambda: False):
+    # typed=True keeps native dtypes (nullable Int64/Float64/string, datetimes) with NA masks
+    # instead of turning every cell into a str; compact=True stores text via compact_strings
+    # filters (filter_engine.CompiledFilters) are evaluated while reading, see _read_filtered;
+    # the returned frame keeps the original row positions as index and df.attrs["raw_rows"]
+    if isinstance(usecols,str): usecols=[usecols]
+    usecols=[str(c).strip() for c in (usecols or [])]
+    if filters is not None and not filters: filters=None
+    # filter-only columns are read, used for the mask and dropped again
+    read_cols = list(dict.fromkeys(usecols + filters.columns)) if filters and usecols else usecols
+
+    # Parsed sheets are cached as memory-mapped Arrow files (see _parse_cache_path)
+    cache_path = _parse_cache_path(file_path, sheet_name, header_row, typed) if use_cache else None
+    if cache_path:
+        df = _read_parse_cache(cache_path, read_cols, typed, compact, filters, cancel_check)
+        if df is not None:
+            df = _select_usecols(df, usecols)
+            return compact_strings(df) if compact else df
+
+    if filters and not typed:
+        # CSV chunk by chunk: rejected rows never reach a full frame (and are not cached);
+        # None for other files, or when chunk-wise dtype inference would stringify
+        # differently (full read below)
+        df = _read_filtered(file_path, sheet_name, header_row, read_cols, filters, cancel_check)
+        if df is not None:
+            df = _select_usecols(df, usecols)
+            return compact_strings(df) if compact else df
+
+    df, file_cols = _parse_table(file_path, sheet_name, header_row, read_cols, typed)
+    if df is None:
+        return pd.DataFrame()
+
+    if not cache_path:
+        df = _finish_frame(df, read_cols, typed, fill_missing=not filters)
+    else:
+        df.columns=[str(c).strip() for c in df.columns]
+        if not typed:
+            df=_stringify(df)
+        _write_parse_cache(cache_path, df, file_cols)
+        df = _select_usecols(df, read_cols, fill_missing=not filters)
+    if filters:
+        # typed reads are parsed whole; the mask is still applied before anything else sees them
+        raw_rows = len(df)
+        df = df[filters.mask(df, cancel_check)]
+        df.attrs["raw_rows"] = raw_rows
+        df = _select_usecols(df, usecols)
+    return compact_strings(df) if compact else df
+
+def _read_filtered(file_path, sheet_name, header_row, read_cols, filters, cancel_check, chunk_rows=None):
+    """
+    Filtered read of a CSV through iter_table_chunks: each chunk is masked and only the kept
+    rows are collected, so peak memory follows the kept rows plus one chunk.
+
+    Chunks infer dtypes on their own rows. When a column came out with different dtypes
+    in different chunks (e.g. ints, and floats in the chunk with a blank cell), its text
+    would differ from a full read ('1' vs '1.0'); None is returned and the caller parses
+    the whole table and filters after loading instead. Sheets always return None: read_excel
+    infers each column over the whole sheet ("00002" reads as 2.0 next to numbers), which
+    no chunk of rows can reproduce.
+    """
+    if os.path.splitext(file_path)[1].lower() != '.csv':
+        return None
+    parts, offset, dtypes = [], 0, {}
+    for chunk, _ in iter_table_chunks(file_path, sheet_name, header_row, read_cols,
+                                      chunk_rows or FILTER_CHUNK_ROWS, fill_missing=False, dtypes=dtypes):
+        if cancel_check(): raise InterruptedError()
+        # predicates are logged for the first chunk only
+        mask = filters.mask(chunk, cancel_check, verbose=not offset)
+        kept = chunk[mask]
+        kept.index = np.flatnonzero(mask) + offset
+        offset += len(chunk)
+        parts.append(kept)
+    if any(len(kinds) > 1 for kinds in dtypes.values()):
+        return None
+    df = pd.concat(parts) if parts else pd.DataFrame()
+    df.attrs["raw_rows"] = offset
+    return df
+
+def compact_strings(df):
+    """
+    Compact text storage: text columns with few distinct values (<= COMPACT_CATEGORY_RATIO of
+    the rows) become categoricals, the rest Arrow-backed strings (one contiguous buffer instead
+    of a Python object per cell). Columns that are already compact are left alone.
+    """
+    df = df.copy(deep=False)
+    n = len(df)
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        if s.dtype != object and not (isinstance(s.dtype, pd.StringDtype) and s.dtype.storage == "python"):
+            continue
+        try:
+            if s.nunique(dropna=False) <= n * COMPACT_CATEGORY_RATIO:
+                df.isetitem(i, s.astype("category"))
+            elif PYARROW_AVAILABLE:
+                df.isetitem(i, s.astype("string[pyarrow]"))
+        except Exception as e:
+            print(f"Compact strings skipped for {df.columns[i]}: {e}")
+    return df
+
+def _column_picker(usecols, seen):
+    """
+    usecols callable for the pandas readers: only the wanted columns are parsed,
+    and every header name offered is recorded in `seen`.
+    """
+    wanted = set(usecols)
+    def _pick(name):
+        name = str(name).strip()
+        seen[name] = None
+        return name in wanted
+    return _pick
+
+def _parse_table(file_path, sheet_name, header_row, usecols, typed=False):
+    """
+    Parses one sheet, materializing only the `usecols` columns (every column when empty).
+    Returns (df, file_cols) with file_cols listing all headers of the sheet, or (None, None) for unsupported files.
+    """
+    seen = {}
+    pick = _column_picker(usecols, seen) if usecols else None
+    kw = {"dtype_backend": "numpy_nullable"} if typed else {}
     with SafeExcelReader(file_path) as path_to_read:
         ext=os.path.splitext(path_to_read)[1].lower()
         header_idx=header_row-1
-        if isinstance(usecols,str): usecols=[usecols]
-        usecols=[str(c).strip() for c in (usecols or [])]
         if ext == '.xlsx':
             try:
                 # Breakthrough: Calamine is significantly faster for large XLSX
-                df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx, engine='calamine')
+                df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx, engine='calamine', usecols=pick, **kw)
             except:
-                df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx)
+                seen.clear()
+                df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx, usecols=pick, **kw)
         elif ext == '.xls':
-            df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx)
+            df = pd.read_excel(path_to_read, sheet_name=sheet_name, header=header_idx, usecols=pick, **kw)
         elif ext == '.csv':
             df = None
-            for enc in ['utf-8-sig', 'cp949', 'utf-8', 'euc-kr']:
+            for enc in CSV_ENCODINGS:
                 try:
+                    seen.clear()
                     sep = _sniff_csv(path_to_read, enc)
                     # Expert: Engine 'c' is faster than 'python'
-                    df = pd.read_csv(path_to_read, header=header_idx, encoding=enc, sep=sep, engine='c', low_memory=False)
+                    df = pd.read_csv(path_to_read, header=header_idx, encoding=enc, sep=sep, engine='c', low_memory=False, usecols=pick, **kw)
                     break
                 except: continue
             if df is None:
                 raise Exception("CSV 파일 인코딩/구분자를 인식하지 못했습니다.")
         else:
-            return pd.DataFrame()
-        df.columns=[str(c).strip() for c in df.columns]
-        
-        if usecols:
-            existing=[c for c in usecols if c in df.columns]
-            missing=[c for c in usecols if c not in df.columns]
-            df=df[existing] if existing else pd.DataFrame(index=df.index)
-            for c in missing: df[c]=""
+            return None, None
+    file_cols = list(seen) if usecols else [str(c).strip() for c in df.columns]
+    return df, file_cols
+
+def _finish_frame(df, usecols, typed=False, fill_missing=True):
+    """Common post-processing for loaded tables: stripped headers, usecols subset, str values."""
+    df.columns=[str(c).strip() for c in df.columns]
+    df=_select_usecols(df, usecols, fill_missing)
+    return df if typed else _stringify(df)
+
+def _select_usecols(df, usecols, fill_missing=True):
+    if usecols:
+        existing=[c for c in usecols if c in df.columns]
+        df=df[existing] if existing else pd.DataFrame(index=df.index)
+        # missing columns are added as "" by reindex
+        if fill_missing:
             df=df.reindex(columns=usecols, fill_value="")
-        
-        df=df.astype(str).replace(['nan','NaN','None','<NA>'],'')
+    return df
+
+def _stringify(df):
+    return df.astype(str).replace(['nan','NaN','None','<NA>'],'')
+
+def _parse_cache_path(file_path, sheet_name, header_row, typed=False):
+    """Cache file for one parsed sheet; the key changes whenever the file's size/mtime does."""
+    if not PYARROW_AVAILABLE:
+        return None
+    try:
+        from cache_store import cache_dir, file_fingerprint, make_key
+        parts = ["parsed-v2", file_fingerprint(file_path), sheet_name, header_row]
+        if typed: parts.append("typed")
+        key = make_key(*parts)
+        return os.path.join(cache_dir("parsed"), f"{key}.arrow")
+    except Exception:
+        return None
+
+def _read_parse_cache(cache_path, usecols, typed=False, compact=False, filters=None, cancel_check=lambda: False):
+    """
+    An entry may hold only the columns earlier reads asked for; it is a hit when it has
+    every requested column that exists in the sheet. With filters the mask is computed on the
+    filter columns alone and the table is filtered in Arrow before any other column is converted.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        from cache_store import touch
+        with pa.memory_map(cache_path) as source:
+            schema = pa.ipc.open_file(source).schema
+        names = schema.names
+        file_cols = json.loads((schema.metadata or {}).get(b"file_cols", b"null")) or names
+        need = [c for c in usecols if c in file_cols] if usecols else file_cols
+        if any(c not in names for c in need):
+            return None
+        # keep at least one column so the row count survives
+        table = feather.read_table(cache_path, columns=need or names[:1], memory_map=True)
+        table = table.select(need or names[:1])
+        # typed entries come back as the same nullable dtypes they were parsed into
+        types = dict(_NULLABLE_TYPES) if typed else {}
+        index = None
+        if filters:
+            raw_rows = table.num_rows
+            fcols = [c for c in filters.columns if c in need]
+            fdf = table.select(fcols).to_pandas(types_mapper=types.get if types else None)
+            mask = filters.mask(fdf, cancel_check)
+            del fdf
+            table = table.filter(pa.array(mask))
+            index = np.flatnonzero(mask)
+        if compact:
+            # straight from the Arrow buffers: no Python str object per cell
+            table = _dictionary_encode(table)
+            types.update(_ARROW_STRINGS)
+        df = table.to_pandas(types_mapper=types.get if types else None)
+        if not need: df = pd.DataFrame(index=df.index)
+        if index is not None:
+            df.index = index
+            df.attrs["raw_rows"] = raw_rows
+        touch(cache_path)
         return df
+    except InterruptedError:
+        raise
+    except Exception as e:
+        print(f"Parse cache read failed: {e}")
+        return None
+
+def _dictionary_encode(table):
+    """Arrow side of compact_strings: low-cardinality string columns become dictionaries (-> categoricals)."""
+    columns = []
+    for col in table.columns:
+        if (pa.types.is_string(col.type) or pa.types.is_large_string(col.type)) and \
+                pc.count_distinct(col, mode="all").as_py() <= len(col) * COMPACT_CATEGORY_RATIO:
+            col = pc.dictionary_encode(col)
+        columns.append(col)
+    return pa.table(columns, names=table.column_names)
+
+def _write_parse_cache(cache_path, df, file_cols):
+    if not df.columns.is_unique:
+        return
+    try:
+        from config import PARSE_CACHE_MAX_BYTES
+        from cache_store import evict_lru
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        # keep the columns earlier, narrower reads of the same sheet already parsed
+        if os.path.exists(cache_path):
+            try:
+                old = feather.read_table(cache_path, memory_map=False)
+                if old.num_rows == table.num_rows:
+                    for name in old.column_names:
+                        if name not in table.column_names:
+                            table = table.append_column(old.schema.field(name), old.column(name))
+                del old
+            except Exception:
+                pass
+        table = table.replace_schema_metadata({b"file_cols": json.dumps(file_cols).encode()})
+        # per process and thread: batch mode reads several files concurrently
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        # uncompressed so later reads can memory-map the columns directly
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+        evict_lru(os.path.dirname(cache_path), PARSE_CACHE_MAX_BYTES)
+    except Exception as e:
+        print(f"Parse cache write failed: {e}")
+
+def iter_table_chunks(file_path, sheet_name, header_row, usecols, chunk_rows=100000, fill_missing=True,
+                      dtypes=None):
+    """
+    Streams a table in fixed-size row chunks: CSVs are read chunk by chunk instead of whole,
+    sheets are parsed once and sliced (their values depend on the whole column).
+    Yields (DataFrame, progress) where progress is the consumed fraction (0~1) or None if unknown.
+    Each chunk is post-processed exactly like read_table_file; with fill_missing=False,
+    usecols that are not in the file are left out instead of added as "".
+    dtypes (dict) collects, per CSV column, the dtypes the chunks were parsed with (see _chunk_dtypes).
+    """
+    if isinstance(usecols,str): usecols=[usecols]
+    usecols=[str(c).strip() for c in (usecols or [])]
+    with SafeExcelReader(file_path) as path_to_read:
+        ext=os.path.splitext(path_to_read)[1].lower()
+        header_idx=header_row-1
+        if ext == '.csv':
+            size = os.path.getsize(path_to_read) or 1
+            # chunks cannot be taken back: the encoding is checked on the whole file first
+            for enc in _csv_encodings(path_to_read):
+                f = open(path_to_read, 'rb')
+                try:
+                    sep = _sniff_csv(path_to_read, enc)
+                    pick = _column_picker(usecols, {}) if usecols else None
+                    reader = pd.read_csv(f, header=header_idx, encoding=enc, sep=sep, engine='c', low_memory=False, chunksize=chunk_rows, usecols=pick)
+                    first = next(reader, None)
+                except:
+                    f.close()
+                    continue
+                break
+            else:
+                raise Exception("CSV 파일 인코딩/구분자를 인식하지 못했습니다.")
+            try:
+                chunk = first
+                while chunk is not None:
+                    _chunk_dtypes(chunk, dtypes)
+                    yield _finish_frame(chunk, usecols, fill_missing=fill_missing), min(f.tell() / size, 1.0)
+                    chunk = next(reader, None)
+            finally:
+                f.close()
+        else:
+            # sheets: read_excel infers each column over the whole sheet ("00002" reads as 2 next
+            # to numbers), which no run of rows can reproduce; the sheet (at most XLSX_MAX_ROWS
+            # rows) is parsed exactly like read_table_file, through the parse cache, and sliced
+            df = read_table_file(file_path, sheet_name, header_row, usecols if fill_missing else None)
+            if not fill_missing:
+                df = _select_usecols(df, usecols, fill_missing)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows], min((start + chunk_rows) / len(df), 1.0)
+
+def _chunk_dtypes(df, dtypes):
+    """
+    Records the dtype each column of a raw chunk was inferred as (before stringifying).
+    All-missing columns are skipped: they read as "" whatever the dtype. Datetimes also
+    record whether every value is at midnight, which decides how astype(str) prints them.
+    """
+    if dtypes is None:
+        return
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        if not s.notna().any():
+            continue
+        kind = s.dtype.str
+        if s.dtype.kind == "M":
+            kind = (kind, bool((s.dropna() == s.dropna().dt.normalize()).all()))
+        dtypes.setdefault(str(df.columns[i]).strip(), set()).add(kind)
 
 def get_unique_values(file_path, sheet_name, header_row, column_name, progress_callback=None):
     """
@@ -284,3 +763,359 @@ def write_xlsx(file_path, df, sheet_name="Sheet1"):
     except Exception as e:
         raise Exception(f"파일 저장 실패: {e}")
 
+
+# Excel's row limit per sheet (header included); write_xlsx_stream continues on a new sheet
+XLSX_MAX_ROWS = 1048576
+# cells turned into sheet XML at a time by write_xlsx_stream (rows per chunk follow the width)
+XLSX_CHUNK_CELLS = 500_000
+# longest text Excel keeps in a cell
+XLSX_MAX_TEXT = 32767
+
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>')
+# pandas' header look: bold, thin border, centered (cell style 1)
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"><color auto="1"/></left><right style="thin"><color auto="1"/></right>'
+    '<top style="thin"><color auto="1"/></top><bottom style="thin"><color auto="1"/></bottom><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="top"/></xf></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>')
+
+def _xlsx_text_cell(value, style=""):
+    """Inline-string cell XML for one (already cleaned) value: escaped, cut to Excel's limit."""
+    from xml.sax.saxutils import escape
+    text = str(value)[:XLSX_MAX_TEXT]
+    if not text:
+        return f'<c{style}/>'
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c{style} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+def _xlsx_text_cells(values):
+    """_xlsx_text_cell for many values at once (Arrow compute kernels when pyarrow is there)."""
+    if not PYARROW_AVAILABLE:
+        return [_xlsx_text_cell(v) for v in values]
+    text = pa.array(pd.Series(values, dtype=object).astype(str).to_numpy(), type=pa.large_string())
+    text = pc.utf8_slice_codeunits(text, 0, XLSX_MAX_TEXT)
+    escaped = text
+    for old, new in (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;')):
+        escaped = pc.replace_substring(escaped, old, new)
+    lit = lambda v: pa.scalar(v, pa.large_string())
+    spaced = pc.not_equal(pc.utf8_trim_whitespace(text), text)
+    start = pc.if_else(spaced, lit('<c t="inlineStr"><is><t xml:space="preserve">'), lit('<c t="inlineStr"><is><t>'))
+    cells = pc.binary_join_element_wise(start, escaped, lit('</t></is></c>'), lit(''))
+    cells = pc.if_else(pc.equal(pc.utf8_length(text), 0), lit('<c/>'), cells)
+    return cells.to_numpy(zero_copy_only=False).tolist()
+
+def _xlsx_values_cells(s):
+    """Cell XML of every row of s, built once per distinct value of the slice."""
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        # numbers stay numbers, as in to_excel
+        codes, uniques = pd.factorize(pd.to_numeric(s, errors='coerce').astype(float).to_numpy())
+        frags = [f'<c><v>{int(u) if u.is_integer() else repr(float(u))}</v></c>' if np.isfinite(u) else '<c/>'
+                 for u in uniques]
+    else:
+        codes, uniques = pd.factorize(s)
+        frags = _xlsx_text_cells(uniques)
+    # code -1 (missing) picks the trailing blank
+    return np.array(frags + ['<c/>'], dtype=object)[codes]
+
+def _xlsx_column_cells(s):
+    """
+    Chunk encoder for one column: categoricals build their cell XML once, per category.
+    Characters Excel refuses are removed here, once for the whole column (clean columns
+    are only checked, see utils.remove_illegal_chars_series).
+    """
+    from utils import remove_illegal_chars_series
+    s = remove_illegal_chars_series(s)
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        frags = np.array(_xlsx_text_cells(s.cat.categories) + ['<c/>'], dtype=object)
+        codes = s.cat.codes.to_numpy()
+        return lambda lo, hi: frags[codes[lo:hi]]
+    return lambda lo, hi: _xlsx_values_cells(s.iloc[lo:hi])
+
+def _xlsx_sheet_head(columns, freeze_header):
+    """Sheet XML up to and including the (bold) header row."""
+    pane = ('<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+            '<selection pane="bottomLeft"/>') if freeze_header else ''
+    from utils import remove_illegal_chars
+    header = "".join(_xlsx_text_cell(remove_illegal_chars(str(c)), ' s="1"') for c in columns)
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheetViews><sheetView workbookViewId="0">{pane}</sheetView></sheetViews>'
+            f'<sheetData><row r="1">{header}</row>').encode('utf-8')
+
+def _xlsx_rows_xml(columns, lo, hi, first):
+    """XML of rows lo:hi (column encoders from _xlsx_column_cells), numbered from `first`."""
+    # one (rows x columns+2) grid of fragments, joined once in row-major order
+    grid = np.empty((hi - lo, len(columns) + 2), dtype=object)
+    grid[:, 0] = [f'<row r="{r}">' for r in range(first, first + hi - lo)]
+    for j, cells in enumerate(columns):
+        grid[:, j + 1] = cells(lo, hi)
+    grid[:, -1] = '</row>'
+    return "".join(grid.ravel()).encode('utf-8')
+
+class XlsxStreamWriter:
+    """
+    .xlsx output that frames are appended to without building a workbook in memory: sheet
+    XML is generated chunk by chunk (cell XML once per distinct value, categorical codes
+    reused) and streamed into the zip, so memory stays at one chunk and speed close to
+    to_csv. Frames go to the current sheet (start_sheet); a sheet that reaches Excel's row
+    limit continues on "<name>_2", "<name>_3", ... The header row comes from the sheet's
+    first frame, bold and frozen. The workbook parts are written by close().
+    """
+
+    def __init__(self, file_path, sheet_name="Sheet1", freeze_header=True, chunk_rows=None):
+        self.file_path = file_path
+        self.freeze_header = freeze_header
+        self.chunk_rows = chunk_rows
+        self.sheet_names = []
+        self._zip = self._part = None
+        self._name, self._split, self._columns, self._rows = sheet_name, 0, None, 0
+        self._closed = False
+
+    def start_sheet(self, name):
+        """Frames written from now on go to a new sheet called name."""
+        self._close_part()
+        self._name, self._split, self._columns = name, 0, None
+
+    def _open_part(self, columns):
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1)
+        self._split += 1
+        # sheet names: at most 31 characters, the part number is kept
+        k, name = self._split, str(self._name)
+        title = name if k == 1 else f"{name[:31 - len(str(k)) - 1]}_{k}"
+        self.sheet_names.append(title[:31])
+        # the XML size is only known once written: always Zip64 (parts over 4GB)
+        self._part = self._zip.open(f'xl/worksheets/sheet{len(self.sheet_names)}.xml', 'w', force_zip64=True)
+        self._part.write(_xlsx_sheet_head(columns, self.freeze_header))
+        self._columns, self._rows = columns, 0
+
+    def _close_part(self):
+        if self._part is not None:
+            self._part.write(b'</sheetData></worksheet>')
+            self._part.close()
+            self._part = None
+
+    def write(self, df, cancel_check=lambda: False):
+        """Appends the rows of df to the current sheet (df.columns as header if it is new)."""
+        per_sheet = XLSX_MAX_ROWS - 1
+        if self._part is None:
+            self._open_part(list(df.columns))
+        rows = self.chunk_rows or max(1000, XLSX_CHUNK_CELLS // max(df.shape[1], 1))
+        columns = [_xlsx_column_cells(df.iloc[:, j]) for j in range(df.shape[1])]
+        lo = 0
+        while lo < len(df):
+            if cancel_check(): raise InterruptedError()
+            if self._rows >= per_sheet:
+                self._close_part()
+                self._open_part(self._columns)
+            hi = min(lo + rows, len(df), lo + per_sheet - self._rows)
+            self._part.write(_xlsx_rows_xml(columns, lo, hi, self._rows + 2))
+            self._rows += hi - lo
+            lo = hi
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._zip is None:
+            # nothing was written: no file, as with ColumnarWriter
+            return
+        self._close_part()
+        z, n = self._zip, len(self.sheet_names)
+        from xml.sax.saxutils import quoteattr
+        sheets_xml = "".join(f'<sheet name={quoteattr(t)} sheetId="{i}" r:id="rId{i}"/>'
+                             for i, t in enumerate(self.sheet_names, 1))
+        rels_xml = "".join(f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                           f'Target="worksheets/sheet{i}.xml"/>' for i in range(1, n + 1))
+        z.writestr('[Content_Types].xml',
+                   '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                   '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                   '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                   '<Default Extension="xml" ContentType="application/xml"/>'
+                   '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                   '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                   + "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                             'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                             for i in range(1, n + 1))
+                   + '</Types>')
+        z.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+        z.writestr('xl/workbook.xml',
+                   '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                   '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                   'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                   f'<sheets>{sheets_xml}</sheets></workbook>')
+        z.writestr('xl/_rels/workbook.xml.rels',
+                   '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                   '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                   f'{rels_xml}<Relationship Id="rId{n + 1}" '
+                   'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+                   '</Relationships>')
+        z.writestr('xl/styles.xml', _XLSX_STYLES)
+        z.close()
+        self._zip = None
+
+    def _abort(self):
+        self._closed = True
+        try:
+            if self._part is not None:
+                self._part.close()
+            if self._zip is not None:
+                self._zip.close()
+        except Exception:
+            pass
+        self._zip = self._part = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return False
+        # no half-written workbook is left behind (cancel or error)
+        self._abort()
+        try:
+            os.remove(self.file_path)
+        except OSError:
+            pass
+        return False
+
+def write_xlsx_stream(file_path, sheets, freeze_header=True, chunk_rows=None, cancel_check=lambda: False):
+    """
+    Writes [(sheet_name, df)] as .xlsx through XlsxStreamWriter. Frames longer than
+    Excel's row limit continue on "<name>_2", "<name>_3", ...
+    Every column is written as text except numeric dtypes; the header row is bold and frozen.
+    Returns the written sheet names.
+    """
+    with XlsxStreamWriter(file_path, freeze_header=freeze_header, chunk_rows=chunk_rows) as writer:
+        for name, df in sheets:
+            writer.start_sheet(name)
+            writer.write(df, cancel_check)
+    return writer.sheet_names
+
+# rows per Parquet row group / Feather record batch written by write_columnar
+COLUMNAR_CHUNK_ROWS = 100_000
+
+def _arrow_column(s, dictionary=True):
+    """
+    (arrow type, take(lo, hi) -> arrow array) for one column. Categoricals are converted
+    once (the categories) and sliced through their codes; dictionary=False decodes them.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        cats = s.cat.categories
+        values = pa.array(cats.to_numpy(dtype=object) if cats.dtype == object else cats.to_numpy())
+        codes = s.cat.codes.to_numpy()
+        indices_type = pa.from_numpy_dtype(codes.dtype)
+        def take(lo, hi):
+            part = codes[lo:hi]
+            indices = pa.array(part, type=indices_type, mask=part < 0)
+            if dictionary:
+                return pa.DictionaryArray.from_arrays(indices, values)
+            return values.take(indices)
+        return (pa.dictionary(indices_type, values.type) if dictionary else values.type), take
+    if s.dtype == object:
+        def take(lo, hi):
+            part = s.iloc[lo:hi]
+            try:
+                return pa.array(part, type=pa.string(), from_pandas=True)
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                # mixed objects: text, missing values stay missing
+                return pa.array(part.where(part.isna(), part.astype(str)), type=pa.string(), from_pandas=True)
+        return pa.string(), take
+    arrow_type = pa.Array.from_pandas(s.iloc[:0]).type
+    return arrow_type, lambda lo, hi: pa.Array.from_pandas(s.iloc[lo:hi], type=arrow_type)
+
+class ColumnarWriter:
+    """
+    Parquet or Feather (Arrow IPC file) output that frames are appended to: each frame is
+    converted to Arrow chunk_rows rows at a time (one Parquet row group / Feather record batch
+    each), so no frame is ever copied whole. The schema, with pandas metadata so the readers
+    give back the same dtypes, comes from the first frame. dictionary=False writes
+    categoricals as plain strings (frames with different categories appended to Feather).
+    Feather is written uncompressed so it can be memory-mapped.
+    """
+
+    def __init__(self, file_path, fmt="parquet", chunk_rows=None, dictionary=True):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet/Feather 저장에는 pyarrow 패키지가 필요합니다.")
+        if fmt not in ("parquet", "feather"):
+            raise ValueError(f"Unknown columnar format: {fmt}")
+        self.file_path = file_path
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows or COLUMNAR_CHUNK_ROWS
+        self.dictionary = dictionary
+        self.schema = None
+        self._sink = self._writer = None
+
+    def _open(self, df, columns):
+        fields = [pa.field(str(name), typ) for name, (typ, _) in zip(df.columns, columns)]
+        meta = pa.Schema.from_pandas(df.iloc[:0].set_axis([str(c) for c in df.columns], axis=1),
+                                     preserve_index=False).metadata
+        self.schema = pa.schema(fields).with_metadata(meta)
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.file_path, self.schema)
+        else:
+            self._sink = pa.OSFile(self.file_path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def write(self, df, cancel_check=lambda: False):
+        columns = [_arrow_column(df.iloc[:, j], self.dictionary) for j in range(df.shape[1])]
+        if self._writer is None:
+            self._open(df, columns)
+        for lo in range(0, len(df), self.chunk_rows):
+            if cancel_check(): raise InterruptedError()
+            hi = min(lo + self.chunk_rows, len(df))
+            arrays = [take(lo, hi) for _, take in columns]
+            # later frames follow the first frame's types (e.g. a column that was all blank)
+            arrays = [a if a.type == f.type else a.cast(f.type) for a, f in zip(arrays, self.schema)]
+            batch = pa.record_batch(arrays, schema=self.schema)
+            if self.fmt == "parquet":
+                self._writer.write_table(pa.Table.from_batches([batch], schema=self.schema))
+            else:
+                self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        self._writer = self._sink = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None:
+            # no half-written result is left behind (cancel or error)
+            try:
+                os.remove(self.file_path)
+            except OSError:
+                pass
+        return False
+
+def write_columnar(file_path, df, fmt="parquet", chunk_rows=None, cancel_check=lambda: False):
+    """
+    Writes df as Parquet or Feather with its dtypes kept (numbers, dates and nullable types
+    stay typed, categoricals become dictionary columns), see ColumnarWriter.
+    Parquet can be read per column / row group, Feather memory-mapped
+    (pyarrow.feather.read_table(path, memory_map=True)).
+    """
+    with ColumnarWriter(file_path, fmt, chunk_rows) as writer:
+        writer.write(df, cancel_check)
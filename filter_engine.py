@@ -0,0 +1,207 @@
+"""
+Single-pass filter engine for base/target filters.
+
+Filters are compiled once into predicates. Every predicate is evaluated on the
+distinct values of its column (categorical codes or one factorization per
+column, shared by all predicates on that column) and broadcast back through the
+codes. The predicates are AND-ed into one boolean mask and the frame is sliced
+once.
+
+Filter dicts are the ones the UI produces:
+    {"col": "지역", "op": "==", "keyword": "서울"}       # ==, >=, <=, >, <, Exist, Not Exist
+    {"col": "지역", "op": "==", "keyword": "(값 있음)"}   # (값 있음) / (값 없음)
+    {"col": "지역", "values": ["서울", "부산"]}           # dropdown (advanced) filter
+"""
+import numpy as np
+import pandas as pd
+
+# cell text (after strip) that counts as "no value"
+BLANK_TEXTS = ['nan', 'NaN', 'None', '<NA>', '']
+# keywords meaning "no filter selected"
+IGNORED_KEYWORDS = ["(값 선택)", "(데이터 없음)", None, ""]
+
+_NUMERIC_OPS = {
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    ">": np.greater,
+    "<": np.less,
+}
+
+
+class _ColumnView:
+    """Distinct values of one column plus the row -> value codes, built once per frame."""
+
+    def __init__(self, series):
+        self.series = series
+        self._codes = None
+        self._uniques = None
+        self._masks = {}
+
+    def _factorize(self):
+        s = self.series
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # categorical codes are already there; missing (-1) gets a trailing NaN slot
+            cats = list(s.cat.categories)
+            codes = s.cat.codes.to_numpy()
+            self._codes = np.where(codes < 0, len(cats), codes)
+            self._uniques = pd.Series(cats + [np.nan], dtype=object)
+        elif s.dtype == object:
+            codes, uniques = pd.factorize(s)
+            uniques = pd.Series(uniques, dtype=object)
+            na = codes < 0
+            if na.any():
+                # None / NaN / pd.NA read differently as text: one slot per kind
+                na_vals = s[na]
+                na_codes, _ = pd.factorize(na_vals.astype(str))
+                _, first = np.unique(na_codes, return_index=True)
+                codes[na] = len(uniques) + na_codes
+                uniques = pd.concat([uniques, na_vals.iloc[first]], ignore_index=True)
+            self._codes = codes
+            self._uniques = uniques
+        else:
+            codes, uniques = pd.factorize(s, use_na_sentinel=False)
+            self._codes = codes
+            self._uniques = pd.Series(uniques)
+
+    def mask(self, key, func):
+        """Row mask of a predicate evaluated once per distinct value (cached under key)."""
+        if self._codes is None:
+            self._factorize()
+        u_mask = self._masks.get(key)
+        if u_mask is None:
+            u_mask = np.asarray(func(self._uniques), dtype=bool)
+            self._masks[key] = u_mask
+        return u_mask[self._codes]
+
+    def text(self, uniques):
+        return uniques.astype(str)
+
+    def numeric(self, uniques):
+        # float64 so NA-masked (typed/compact) values compare as NaN
+        return pd.to_numeric(uniques, errors='coerce').astype(float)
+
+    def blank(self, uniques):
+        return uniques.astype(str).str.strip().isin(BLANK_TEXTS)
+
+
+class _Predicate:
+    def __init__(self, spec, col, kind, arg):
+        self.spec = spec
+        self.col = col
+        self.kind = kind
+        self.arg = arg
+
+    def evaluate(self, view):
+        kind, arg = self.kind, self.arg
+        if kind == "blank":
+            m = view.mask("blank", view.blank)
+            return m if arg else ~m
+        if kind == "eq":
+            return view.mask(("eq", arg), lambda u: view.text(u) == arg)
+        if kind == "in":
+            return view.mask(("in", arg), lambda u: view.text(u).isin(arg))
+        # numeric comparison; NaN compares False like the row-wise version
+        op = _NUMERIC_OPS[kind]
+        return view.mask((kind, arg), lambda u: op(view.numeric(u).to_numpy(), arg))
+
+
+def _compile_one(f):
+    """Filter dict -> _Predicate, or None when the filter does not restrict anything."""
+    col = f.get("col")
+    if "values" in f and "op" not in f:
+        vals = f.get("values")
+        if not vals:
+            return None
+        if "(값 있음)" in vals:
+            return _Predicate(f, col, "blank", False)
+        if "(값 없음)" in vals:
+            return _Predicate(f, col, "blank", True)
+        return _Predicate(f, col, "in", tuple(str(v) for v in vals))
+
+    op = f.get("op", "==")
+    val = f.get("keyword") or f.get("value")
+    if val in IGNORED_KEYWORDS:
+        return None
+    if op in _NUMERIC_OPS:
+        # non-numeric keyword -> ValueError, the filter is skipped by the caller
+        return _Predicate(f, col, op, float(val))
+    if op == "==":
+        if val == "(값 있음)":
+            return _Predicate(f, col, "blank", False)
+        if val == "(값 없음)":
+            return _Predicate(f, col, "blank", True)
+        return _Predicate(f, col, "eq", str(val))
+    if op == "Exist":
+        return _Predicate(f, col, "blank", False)
+    if op == "Not Exist":
+        return _Predicate(f, col, "blank", True)
+    return None
+
+
+class CompiledFilters:
+    """
+    A list of filter dicts compiled once and applied to any number of frames
+    (whole tables or streamed chunks). Filters on missing columns, unknown
+    operators and filters that fail to evaluate are skipped, as before.
+    """
+
+    def __init__(self, f_list, label="", log=None):
+        if isinstance(f_list, dict):
+            f_list = [f_list]
+        self.label = label
+        self.log = log or (lambda msg: None)
+        self.predicates = []
+        for f in (f_list or []):
+            if not f:
+                continue
+            try:
+                pred = _compile_one(f)
+            except Exception as fe:
+                self.log(f"[Warning] 필터 적용 실패 ({f.get('col')}): {fe}")
+                continue
+            if pred is not None:
+                self.predicates.append(pred)
+
+    def __bool__(self):
+        return bool(self.predicates)
+
+    @property
+    def columns(self):
+        """Columns the filters read (for column projection)."""
+        return list(dict.fromkeys(p.col for p in self.predicates))
+
+    def mask(self, df, cancel_check=lambda: False, on_filter=None, verbose=True):
+        """
+        Combined boolean mask (numpy) for df. on_filter(spec, mask) is called after
+        each applied predicate with the running mask. verbose=False skips the per-predicate
+        log line (used for every chunk after the first one of a streamed read).
+        """
+        mask = np.ones(len(df), dtype=bool)
+        views = {}
+        for pred in self.predicates:
+            if cancel_check(): raise InterruptedError()
+            if pred.col not in df.columns:
+                continue
+            try:
+                view = views.get(pred.col)
+                if view is None:
+                    view = views[pred.col] = _ColumnView(df[pred.col])
+                mask &= pred.evaluate(view)
+                spec = pred.spec
+                if verbose: self.log(f"[Filter] {self.label} ({pred.col} {spec.get('op', 'in')} {spec.get('keyword') or spec.get('value') or spec.get('values')})")
+            except Exception as fe:
+                self.log(f"[Warning] 필터 적용 실패 ({pred.col}): {fe}")
+                continue
+            if on_filter:
+                on_filter(pred.spec, mask)
+        return mask
+
+    def apply(self, df, cancel_check=lambda: False, on_filter=None):
+        """df sliced once by the combined mask."""
+        if not self.predicates:
+            return df
+        return df[self.mask(df, cancel_check, on_filter)]
+
+
+def apply_filters(df, f_list, label="", cancel_check=lambda: False, log=None):
+    return CompiledFilters(f_list, label, log).apply(df, cancel_check)
@@ -0,0 +1,454 @@
+"""
+Batched fuzzy matching on rapidfuzz score matrices.
+
+Instead of one process.extractOne call per query, blocks of queries are scored
+against the whole choice list with process.cdist (one vectorized call, spread
+over all cores) and the best choice per query is taken with argmax. Results are
+the same as extractOne: the first best-scoring choice wins and scores below the
+cutoff mean "no match". Progress and cancel are checked once per block.
+
+Jobs too big for full score matrices go through a
+BlockingIndex instead: every query is only scored against a small candidate set,
+the choices in its length window that share the most q-grams with it. That is a
+standard record-linkage blocking, not an exhaustive search: a pair sharing no
+distinctive q-gram is never scored. Big blocked jobs are spread over a process
+pool (one index per worker); cdist/cpdist already use all cores on their own.
+
+With jamo=True Korean keys are compared jamo by jamo (박희본 -> ㅂㅏㄱㅎㅢㅂㅗㄴ), so a
+one-jamo typo costs one jamo instead of a whole syllable, and the blocking index
+also groups keys by their choseong (initial consonants, 박희본 -> ㅂㅎㅂ).
+"""
+import os
+
+import numpy as np
+
+try:
+    from rapidfuzz import process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# score matrix cells per block (float64: 8M cells = 64MB); bounds memory for large choice lists
+FUZZY_BLOCK_CELLS = 8_000_000
+# upper bound on queries per block, so progress/cancel stay responsive on small choice lists
+FUZZY_BLOCK_MAX_ROWS = 5000
+# queries x choices above this are matched through a BlockingIndex instead of full score matrices
+FUZZY_DENSE_MAX_PAIRS = 50_000_000
+# BlockingIndex: q-grams found in more than this share of the choices (and more than
+# FUZZY_STOP_GRAM_MIN of them) are too common to block on
+FUZZY_STOP_GRAM_RATIO = 0.01
+FUZZY_STOP_GRAM_MIN = 1000
+# BlockingIndex: posting entries read per query (its rarest q-grams first)
+FUZZY_PROBE_BUDGET = 2000
+# BlockingIndex: candidates scored per query (the ones sharing the most q-grams)
+FUZZY_MAX_CANDIDATES = 100
+# queries per block on the BlockingIndex path
+FUZZY_BLOCKED_ROWS = 1000
+# blocked jobs with at least this many queries are spread over a process pool
+FUZZY_POOL_MIN_QUERIES = 20_000
+# share of the fuzzy cache budget (FUZZY_CACHE_MAX_BYTES) one MatchCache file may use;
+# a bigger file drops its least recently used entries when saved
+FUZZY_CACHE_FILE_SHARE = 0.5
+
+# Hangul syllables U+AC00..U+D7A3 = (choseong * 21 + jungseong) * 28 + jongseong, as compatibility jamo
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_JAMO_TABLE = {0xAC00 + i: CHOSEONG[i // 588] + JUNGSEONG[i % 588 // 28] + JONGSEONG[i % 28] for i in range(11172)}
+_CHOSEONG_TABLE = {0xAC00 + i: CHOSEONG[i // 588] for i in range(11172)}
+
+
+def to_jamo(texts):
+    """Hangul syllables decomposed into compatibility jamo; other characters unchanged."""
+    return [t.translate(_JAMO_TABLE) for t in texts]
+
+
+def to_choseong(texts):
+    """Hangul syllables reduced to their choseong (initial consonant); other characters unchanged."""
+    return [t.translate(_CHOSEONG_TABLE) for t in texts]
+
+
+def best_matches(queries, choices, score_cutoff=0, scorer=None, workers=-1,
+                 progress_callback=None, cancel_check=lambda: False, jamo=False, processes=None):
+    """
+    Best choice for every query.
+
+    Returns (positions, scores): numpy arrays aligned with queries, positions[i] is the
+    index into choices of the best match (-1 when nothing reaches score_cutoff).
+    progress_callback(done, total) and cancel_check() are called once per block.
+    jamo=True scores the jamo-decomposed keys (scores are then jamo-level).
+    processes: worker processes for big blocked jobs (None: one per core, 1: none).
+    """
+    positions, scores = top_matches(queries, choices, 1, score_cutoff, scorer, workers,
+                                    progress_callback, cancel_check, jamo, processes)
+    return positions[:, 0], scores[:, 0]
+
+
+def top_matches(queries, choices, k, score_cutoff=0, scorer=None, workers=-1,
+                progress_callback=None, cancel_check=lambda: False, jamo=False, processes=None):
+    """
+    The k best choices for every query, best first (equal scores: earlier choice first).
+
+    Returns (positions, scores) of shape (len(queries), k); slots without a choice
+    reaching score_cutoff hold position -1 and score 0. Other arguments as best_matches.
+    """
+    queries = list(queries)
+    choices = list(choices)
+    keys = (None, None)
+    if jamo:
+        keys = (to_choseong(queries), to_choseong(choices))
+        queries, choices = to_jamo(queries), to_jamo(choices)
+    positions = np.full((len(queries), k), -1, dtype=np.int64)
+    scores = np.zeros((len(queries), k), dtype=np.float64)
+    if not queries or not choices:
+        return positions, scores
+
+    scorer = scorer or fuzz.token_sort_ratio
+    total = len(queries)
+    if score_cutoff and total * len(choices) > FUZZY_DENSE_MAX_PAIRS and scorer in _PROCESSORS:
+        return _blocked_matches(queries, choices, k, score_cutoff, scorer, workers, positions, scores,
+                                progress_callback, cancel_check, keys, processes)
+
+    kk = min(k, len(choices))
+    block = max(1, min(FUZZY_BLOCK_MAX_ROWS, FUZZY_BLOCK_CELLS // len(choices)))
+    for start in range(0, total, block):
+        if cancel_check(): raise InterruptedError()
+        if progress_callback:
+            progress_callback(start, total)
+        stop = min(start + block, total)
+        # float64 so cutoff comparisons match extractOne exactly
+        matrix = process.cdist(queries[start:stop], choices, scorer=scorer, dtype=np.float64,
+                               score_cutoff=score_cutoff or None, workers=workers)
+        best = matrix.argmax(axis=1)[:, None] if kk == 1 else _top_columns(matrix, kk)
+        best_scores = np.take_along_axis(matrix, best, axis=1)
+        # cdist reports scores under the cutoff as 0
+        hit = best_scores >= score_cutoff
+        positions[start:stop, :kk] = np.where(hit, best, -1)
+        scores[start:stop, :kk] = np.where(hit, best_scores, 0)
+    if progress_callback:
+        progress_callback(total, total)
+    return positions, scores
+
+
+def _top_columns(matrix, k):
+    """Columns of the k highest scores per row, best first; equal scores keep column order."""
+    if k == matrix.shape[1]:
+        return np.argsort(-matrix, axis=1, kind="stable")
+    kth = -np.partition(-matrix, k - 1, axis=1)[:, k - 1:k]
+    above = matrix > kth
+    # ties at the k-th score: the earliest columns take the remaining slots
+    tied = matrix == kth
+    need = k - above.sum(axis=1, keepdims=True)
+    rows, cols = np.nonzero(above | (tied & (np.cumsum(tied, axis=1, dtype=np.int32) <= need)))
+    order = np.lexsort((cols, -matrix[rows, cols], rows))
+    return cols[order].reshape(len(matrix), k)
+
+
+def _blocked_matches(queries, choices, k, score_cutoff, scorer, workers, positions, scores,
+                     progress_callback, cancel_check, keys=(None, None), processes=None):
+    """
+    top_matches through a BlockingIndex: each query is scored against its candidates only.
+    keys: optional (query_keys, choice_keys) blocking keys (choseong in jamo mode).
+    processes: worker processes for big jobs (None: one per core), see _pooled_blocks.
+    """
+    total = len(queries)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes > 1 and total >= FUZZY_POOL_MIN_QUERIES:
+        blocks = _pooled_blocks(queries, choices, k, score_cutoff, scorer, keys, processes, cancel_check)
+    else:
+        blocks = _local_blocks(queries, choices, k, score_cutoff, scorer, workers, keys, cancel_check)
+    done = 0
+    if progress_callback:
+        progress_callback(0, total)
+    for start, q_idx, c_idx, hit_scores, rank in blocks:
+        positions[start + q_idx, rank] = c_idx
+        scores[start + q_idx, rank] = hit_scores
+        done += min(FUZZY_BLOCKED_ROWS, total - start)
+        if progress_callback and done < total:
+            progress_callback(done, total)
+    if progress_callback:
+        progress_callback(total, total)
+    return positions, scores
+
+
+def _blocking_index(choices, score_cutoff, scorer, c_keys):
+    # jamo strings are ~2.5x longer over a small alphabet: 4-grams keep postings selective
+    return BlockingIndex(choices, score_cutoff, _PROCESSORS[scorer], q=4 if c_keys else 2, keys=c_keys)
+
+
+def _score_block(index, choice_arr, queries, q_keys, k, score_cutoff, scorer, workers):
+    """k best candidates per query of one block -> (query idx, choice idx, score, rank) of the hits."""
+    q_idx, c_idx = index.candidate_pairs(queries, q_keys)
+    if not len(q_idx):
+        return q_idx, c_idx, np.zeros(0, dtype=np.float64), q_idx
+    # every (query, candidate) pair of the block in one call
+    pair_scores = process.cpdist([queries[i] for i in q_idx], choice_arr[c_idx].tolist(),
+                                 scorer=scorer, dtype=np.float64, score_cutoff=score_cutoff, workers=workers)
+    # best first per query; among equal scores the earlier choice, like a full scan
+    order = np.lexsort((c_idx, -pair_scores, q_idx))
+    q_sorted = q_idx[order]
+    rank = np.arange(len(order)) - np.searchsorted(q_sorted, q_sorted)
+    keep = (rank < k) & (pair_scores[order] >= score_cutoff)
+    hit = order[keep]
+    return q_idx[hit], c_idx[hit], pair_scores[hit], rank[keep]
+
+
+def _local_blocks(queries, choices, k, score_cutoff, scorer, workers, keys, cancel_check):
+    """Blocks of FUZZY_BLOCKED_ROWS queries scored in this process -> (start, q_idx, c_idx, scores, rank)."""
+    q_keys, c_keys = keys
+    index = _blocking_index(choices, score_cutoff, scorer, c_keys)
+    choice_arr = np.asarray(choices, dtype=object)
+    for start in range(0, len(queries), FUZZY_BLOCKED_ROWS):
+        if cancel_check(): raise InterruptedError()
+        stop = start + FUZZY_BLOCKED_ROWS
+        yield (start,) + _score_block(index, choice_arr, queries[start:stop], q_keys[start:stop] if q_keys else None,
+                                      k, score_cutoff, scorer, workers)
+
+
+# per worker process: (BlockingIndex, choice array, k, cutoff, scorer), built once by _pool_init
+_POOL_STATE = None
+
+
+def _pool_init(choices, k, score_cutoff, scorer_name, c_keys):
+    global _POOL_STATE
+    scorer = getattr(fuzz, scorer_name)
+    _POOL_STATE = (_blocking_index(choices, score_cutoff, scorer, c_keys), np.asarray(choices, dtype=object),
+                   k, score_cutoff, scorer)
+
+
+def _pool_block(task):
+    start, queries, q_keys = task
+    index, choice_arr, k, score_cutoff, scorer = _POOL_STATE
+    return (start,) + _score_block(index, choice_arr, queries, q_keys, k, score_cutoff, scorer, 1)
+
+
+def _pooled_blocks(queries, choices, k, score_cutoff, scorer, keys, processes, cancel_check):
+    """
+    _local_blocks on a process pool: candidate generation is numpy/Python work that holds
+    the GIL, so threads do not scale it. Every worker builds the index once, blocks are
+    streamed back as they finish, and cancel terminates all workers at once.
+    """
+    import multiprocessing
+
+    q_keys, c_keys = keys
+    tasks = ((start, queries[start:start + FUZZY_BLOCKED_ROWS],
+              q_keys[start:start + FUZZY_BLOCKED_ROWS] if q_keys else None)
+             for start in range(0, len(queries), FUZZY_BLOCKED_ROWS))
+    # spawn: forking a process that runs Tk / worker threads is not safe
+    pool = multiprocessing.get_context("spawn").Pool(
+        processes, initializer=_pool_init, initargs=(choices, k, score_cutoff, scorer.__name__, c_keys))
+    try:
+        results = pool.imap_unordered(_pool_block, tasks)
+        while True:
+            if cancel_check(): raise InterruptedError()
+            try:
+                # short waits keep cancel responsive while workers are busy
+                yield results.next(timeout=0.2)
+            except multiprocessing.TimeoutError:
+                continue
+            except StopIteration:
+                break
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _sort_tokens(text):
+    # what token_sort_ratio compares (processor=None): whitespace tokens sorted and re-joined
+    return " ".join(sorted(text.split()))
+
+
+# scorers the BlockingIndex supports (its length window is a bound of the Indel ratio) -> their processing
+_PROCESSORS = {fuzz.ratio: str, fuzz.token_sort_ratio: _sort_tokens} if RAPIDFUZZ_AVAILABLE else {}
+
+
+def _grams(text, q=2):
+    # padded so the first and last characters get grams of their own (prefix/suffix buckets)
+    text = f"\x02{text}\x03"
+    return {text[i:i + q] for i in range(len(text) - q + 1)}
+
+
+class BlockingIndex:
+    """
+    Candidate generator for one choice list and cutoff (ratio-type scorers on processed text):
+    an inverted index from padded q-grams to choices, with lengths for the length window.
+    keys: optional extra blocking key per choice (e.g. to_choseong), indexed like one more gram.
+    """
+
+    def __init__(self, choices, cutoff, processor=_sort_tokens, q=2, keys=None):
+        self.cutoff = cutoff
+        self.processor = processor
+        self.q = q
+        texts = [processor(c) for c in choices]
+        self.lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        self.empty = np.flatnonzero(self.lengths == 0)
+
+        gram_ids, owners, grams = {}, [], []
+        for i, text in enumerate(texts):
+            for g in self._tokens(text, keys[i] if keys else None):
+                owners.append(i)
+                grams.append(gram_ids.setdefault(g, len(gram_ids)))
+        owners = np.asarray(owners, dtype=np.int64)
+        grams = np.asarray(grams, dtype=np.int64)
+        df = np.bincount(grams, minlength=len(gram_ids))
+        common = df > max(len(texts) * FUZZY_STOP_GRAM_RATIO, FUZZY_STOP_GRAM_MIN)
+        # common grams keep an empty posting list
+        keep = ~common[grams]
+        order = np.argsort(grams[keep], kind="stable")
+        self.postings = owners[keep][order]
+        self.starts = np.concatenate([[0], np.cumsum(np.where(common, 0, df))])
+        self.gram_ids = gram_ids
+
+    def _tokens(self, text, key=None):
+        grams = _grams(text, self.q)
+        if key:
+            # \x01 keeps keys apart from text grams
+            grams.add("\x01" + self.processor(key))
+        return grams
+
+    def candidate_pairs(self, queries, keys=None):
+        """
+        (query, choice) position pairs worth scoring for a block of raw queries: choices in the
+        query's length window that share a q-gram (or the blocking key) with it, at most
+        FUZZY_MAX_CANDIDATES per query (the ones sharing the most). Pairs come sorted by query, then choice.
+        """
+        q_of, g_of = [], []
+        texts = [self.processor(q) for q in queries]
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            for g in self._tokens(text, keys[i] if keys else None):
+                gid = self.gram_ids.get(g)
+                if gid is not None:
+                    q_of.append(i)
+                    g_of.append(gid)
+        q_lens = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        pairs = [self._empty_pairs(q_lens)]
+        if g_of:
+            q_of = np.asarray(q_of, dtype=np.int64)
+            g_of = np.asarray(g_of, dtype=np.int64)
+            sizes = self.starts[g_of + 1] - self.starts[g_of]
+            # rarest grams first, until the query has read FUZZY_PROBE_BUDGET postings (at least one gram)
+            order = np.lexsort((sizes, q_of))
+            q_of, g_of, sizes = q_of[order], g_of[order], sizes[order]
+            read = np.cumsum(sizes)
+            read_before = read - sizes - (read - sizes)[np.searchsorted(q_of, q_of)]
+            probe = (read_before < FUZZY_PROBE_BUDGET) & (sizes > 0)
+            q_of, g_of, sizes = q_of[probe], g_of[probe], sizes[probe]
+            # posting list of every (query, gram), concatenated
+            offsets = np.repeat(self.starts[g_of] - np.cumsum(sizes) + sizes, sizes)
+            c_idx = self.postings[offsets + np.arange(sizes.sum())]
+            q_idx = np.repeat(q_of, sizes)
+            keys, shared = np.unique(q_idx * len(self.lengths) + c_idx, return_counts=True)
+            q_idx, c_idx = np.divmod(keys, len(self.lengths))
+            lo, hi = self._windows(q_lens)
+            lens = self.lengths[c_idx]
+            ok = (lens >= lo[q_idx]) & (lens <= hi[q_idx])
+            q_idx, c_idx, shared = q_idx[ok], c_idx[ok], shared[ok]
+            # most shared grams first, then choice order; keep the first FUZZY_MAX_CANDIDATES per query
+            order = np.lexsort((c_idx, -shared, q_idx))
+            q_sorted = q_idx[order]
+            group_start = np.searchsorted(q_sorted, q_sorted)
+            keep = np.sort(order[np.arange(len(order)) - group_start < FUZZY_MAX_CANDIDATES])
+            pairs.append((q_idx[keep], c_idx[keep]))
+        q_idx = np.concatenate([p[0] for p in pairs])
+        c_idx = np.concatenate([p[1] for p in pairs])
+        order = np.lexsort((c_idx, q_idx))
+        return q_idx[order], c_idx[order]
+
+    def _windows(self, q_lens):
+        # partner lengths that can reach the cutoff: ratio = 200*LCS/(a+b) <= 200*min(a,b)/(a+b)
+        lo = np.ceil(q_lens * self.cutoff / (200 - self.cutoff) - 1e-9).astype(np.int64)
+        hi = np.floor(q_lens * (200 - self.cutoff) / self.cutoff + 1e-9).astype(np.int64)
+        return lo, hi
+
+    def _empty_pairs(self, q_lens):
+        # empty (processed) queries pair with the empty choices only
+        empty_q = np.flatnonzero(q_lens == 0)
+        return np.repeat(empty_q, len(self.empty)), np.tile(self.empty, len(empty_q))
+
+
+def fingerprint(*columns):
+    """Stable digest of one or more lists of values (e.g. the choice list of a fuzzy job)."""
+    import hashlib
+
+    h = hashlib.sha1()
+    for col in columns:
+        h.update("\x00".join(map(str, col)).encode("utf-8", "surrogatepass"))
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+class MatchCache:
+    """
+    Persistent match results against one choice set: lookup key -> value, e.g. (choice, score)
+    with choice None when nothing reached the cutoff, or a tuple of such candidates. One file
+    per settings (choice set fingerprint, cutoff, jamo, ...) under APP_DATA_DIR/cache/fuzzy,
+    evicted least recently used first. Entries are kept in use order, so a file over its
+    share of the budget (FUZZY_CACHE_FILE_SHARE) is trimmed to the most recently used ones
+    instead of being evicted whole. Any cache failure only costs a re-score.
+    """
+
+    def __init__(self, *settings, max_bytes=None):
+        self.entries = {}
+        self._added = 0
+        self.max_bytes = max_bytes
+        self.path = None
+        try:
+            import pickle
+            from cache_store import cache_dir, make_key, touch
+
+            self.path = os.path.join(cache_dir("fuzzy"), f"{make_key('fuzzy-match', 2, *settings)}.pkl")
+            if os.path.exists(self.path):
+                with open(self.path, "rb") as f:
+                    self.entries = pickle.load(f)
+                touch(self.path)
+        except Exception:
+            self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        if key not in self.entries:
+            return None
+        # moved to the end: the most recently used entries survive a trim (save)
+        value = self.entries[key] = self.entries.pop(key)
+        return value
+
+    def add(self, key, value):
+        self.entries[key] = value
+        self._added += 1
+
+    def save(self):
+        """
+        Writes the entries back if anything was added (atomic replace), first trimmed to the
+        file's share of the budget, then trims the cache directory.
+        """
+        if not self._added or not self.path:
+            return
+        try:
+            import pickle
+            from config import FUZZY_CACHE_MAX_BYTES
+            from cache_store import evict_lru
+
+            max_bytes = int(self.max_bytes or FUZZY_CACHE_MAX_BYTES)
+            budget = int(max_bytes * FUZZY_CACHE_FILE_SHARE)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp_path)
+            if size > budget and self.entries:
+                # keep the most recently used entries that fit (10% headroom for uneven entry sizes)
+                keep = int(len(self.entries) * budget / size * 0.9)
+                self.entries = dict(list(self.entries.items())[len(self.entries) - keep:])
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+            self._added = 0
+            evict_lru(os.path.dirname(self.path), max_bytes)
+        except Exception:
+            pass
@@ -185,4 +185,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # fuzzy matching may start worker processes (spawn); required for frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     raise SystemExit(main())
\ No newline at end of file
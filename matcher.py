@@ -3,16 +3,33 @@ from __future__ import annotations
 import os
 import datetime
 import time
+from contextlib import nullcontext
 from typing import List, Optional, Callable, Tuple, Dict
 
 import pandas as pd
 
-from utils import norm, smart_format, get_fuzzy_mapper, RAPIDFUZZ_AVAILABLE
-from excel_io import read_table_file, write_xlsx
+from utils import RAPIDFUZZ_AVAILABLE
+from excel_io import read_table_file, write_xlsx, write_xlsx_stream, write_columnar, ColumnarWriter, XlsxStreamWriter
+from filter_engine import CompiledFilters, apply_filters
 from open_excel import read_table_open, write_to_open_excel
 
 Progress = Optional[Callable[[str, Optional[int]], None]]
 
+# Combined key codes are densified before they can overflow int64
+_CODE_LIMIT = 2 ** 62
+
+# Streaming mode: base rows per chunk, and base file size that turns it on automatically
+STREAM_CHUNK_ROWS = 100000
+STREAM_AUTO_BYTES = 1024 * 1024 * 1024
+
+# Batch mode: target files loaded concurrently
+BATCH_LOAD_WORKERS = 4
+# result file formats of options["output_format"] (see _finalize_match)
+OUTPUT_FORMATS = ("xlsx", "csv", "parquet", "feather")
+
+# Compact string storage (categorical / arrow strings) turns on automatically from this file size
+COMPACT_AUTO_BYTES = 64 * 1024 * 1024
+
 
 
 # Debug Logger
@@ -33,11 +50,808 @@ def _log(progress: Progress, msg: str, value: int = None) -> None:
             progress(msg, None)
 
 
-def _load_df(cfg: Dict, sheet_cols: List[str]) -> pd.DataFrame:
+def _load_df(cfg: Dict, sheet_cols: List[str], typed: bool = False, compact: bool = False,
+             filters: CompiledFilters = None, cancel_check: Callable[[], bool] = lambda: False) -> pd.DataFrame:
+    """
+    Loads a base/target table. With filters the rows are filtered while reading (file sources)
+    or right after (open workbooks); df.attrs["raw_rows"] then holds the row count before filtering.
+    """
     _debug_log(f"Loading DF: {cfg.get('type')} - {cfg.get('path') or cfg.get('book')}")
     if cfg.get("type") == "file":
-        return read_table_file(cfg["path"], cfg["sheet"], cfg["header"], sheet_cols)
-    return read_table_open(cfg["book"], cfg["sheet"], cfg["header"], sheet_cols)
+        return read_table_file(cfg["path"], cfg["sheet"], cfg["header"], sheet_cols, typed=typed, compact=compact,
+                               filters=filters, cancel_check=cancel_check)
+    df = read_table_open(cfg["book"], cfg["sheet"], cfg["header"], sheet_cols)
+    if filters:
+        raw_rows = len(df)
+        df = filters.apply(df, cancel_check)
+        df.attrs["raw_rows"] = raw_rows
+    return df
+
+
+def _raw_rows(df: pd.DataFrame) -> int:
+    """Row count before filters pushed into _load_df (license check, fast-path choice)."""
+    return df.attrs.get("raw_rows", len(df))
+
+
+def _shared_codes(*cols: pd.Series) -> Tuple[List["np.ndarray"], pd.Index]:
+    """Map key columns (e.g. one key of base and target) onto a shared int code space.
+
+    Only the distinct values (categories) are hashed; rows are mapped through
+    their category codes. Missing values get the "null" code len(uniques) so they
+    keep matching each other like the old string keys did.
+    Returns (codes per column, uniques); the code space has len(uniques) + 1 codes.
+    """
+    import numpy as np
+
+    cats = [_as_category(c) for c in cols]
+    levels = [pd.Index(c.cat.categories) for c in cats]
+    ids, uniques = levels[0].append(levels[1:]).factorize()
+    n = len(uniques)
+    codes, start = [], 0
+    for cat, level in zip(cats, levels):
+        # trailing slot catches code -1 (NaN) -> shared "null" code n
+        lookup = np.append(ids[start:start + len(level)], n).astype(np.int64)
+        codes.append(lookup[cat.cat.codes.to_numpy()])
+        start += len(level)
+    return codes, pd.Index(uniques)
+
+
+def _combine_codes(level_codes: List["np.ndarray"], sizes: List[int], steps: List[pd.Index],
+                   build: bool = True) -> "np.ndarray":
+    """One int64 code per row from per-column codes (mixed radix).
+
+    When the code space would overflow int64 the partial codes are densified first;
+    build=True records every densify step in `steps`, build=False replays the
+    recorded steps so another frame's codes land in the same space (prefixes the
+    steps never saw, and codes of -1, give -1).
+    """
+    import numpy as np
+
+    combined, size, step = None, 1, 0
+    for codes, n in zip(level_codes, sizes):
+        if combined is None:
+            combined, size = codes, n
+            continue
+        if size * n >= _CODE_LIMIT:
+            if build:
+                combined, uniques = pd.factorize(combined)
+                partial = pd.Index(uniques)
+                steps.append(partial)
+            else:
+                partial = steps[step]
+                step += 1
+                combined = partial.get_indexer(combined)
+            size = len(partial)
+        combined = np.where(combined < 0, -1, combined * n + codes)
+        size *= n
+    return combined
+
+
+def _factorize_keys(df_b: pd.DataFrame, df_t: pd.DataFrame, key_cols: List[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Build one int64 join code per row for base and target (shared code space).
+
+    Multi-column keys are combined arithmetically (mixed radix, see _combine_codes).
+    """
+    import numpy as np
+
+    level_codes, sizes = [], []
+    for k in key_cols:
+        (cb, ct), uniques = _shared_codes(df_b[k], df_t[k])
+        level_codes.append(np.concatenate([cb, ct]))
+        sizes.append(len(uniques) + 1)
+    combined = _combine_codes(level_codes, sizes, [])
+    return combined[:len(df_b)], combined[len(df_b):]
+
+
+def _row_indexer(b_codes: "np.ndarray", t_codes: "np.ndarray") -> "np.ndarray":
+    """Position of the first target row sharing each base row's code (-1 if none)."""
+    import numpy as np
+
+    t_index = pd.Index(t_codes)
+    first_pos = None
+    if not t_index.is_unique:
+        keep = ~t_index.duplicated(keep="first")
+        first_pos = np.flatnonzero(keep)
+        t_index = t_index[keep]
+    pos = t_index.get_indexer(b_codes)
+    if first_pos is not None:
+        pos = np.where(pos >= 0, first_pos[pos], -1)
+    return pos
+
+
+def _load_batch_file(f_cfg: Dict, key_cols: List[str], replacement_rules: Dict,
+                     compact: bool = False) -> pd.DataFrame | None:
+    """
+    One batch target file read and prepared for merging (None if it lacks a key column).
+    With fetch_cols only the selected and key columns are parsed; compact=True stores
+    the prepared text columns via compact_strings.
+    """
+    from excel_io import read_table_file, read_header_file, compact_strings
+
+    p = f_cfg['path']
+    sheet = f_cfg.get('sheet')
+    # If sheet not specified, try to find first
+    if not sheet:
+        from excel_io import get_sheet_names
+        sheets = get_sheet_names(p)
+        sheet = sheets[0] if sheets else 0
+
+    header = f_cfg.get('header', 1)
+
+    fetch_cols = f_cfg.get('fetch_cols')
+    mapping = f_cfg.get('mapping', {})
+    usecols = None
+    if fetch_cols:
+        # mapping keys are original target column names
+        target_key_cols = list(mapping.keys()) if mapping else key_cols
+        # header first: asking for a column the file lacks would read it back as blanks
+        file_cols = read_header_file(p, sheet, header)
+        usecols = [c for c in dict.fromkeys(list(fetch_cols) + list(target_key_cols)) if c in file_cols]
+
+    # Load Target
+    sub_df = read_table_file(p, sheet, header, usecols or None)
+
+    # Apply replacement rules to target
+    if replacement_rules:
+        for col, rules in replacement_rules.items():
+            if col in sub_df.columns and isinstance(rules, dict):
+                sub_df[col] = sub_df[col].replace(rules)
+
+    # Column Selection (Fetch only selected columns + key columns)
+    if fetch_cols:
+        keep = list(set(fetch_cols) | set(target_key_cols))
+        keep = [c for c in keep if c in sub_df.columns]
+        sub_df = sub_df[keep]
+
+    # Column Mapping (Renaming target columns to match base keys)
+    if mapping:
+        # mapping is { TargetColName: BaseKeyName }
+        sub_df = sub_df.rename(columns=mapping)
+
+    # Verify Keys
+    missing = [k for k in key_cols if k not in sub_df.columns]
+    if missing:
+        _debug_log(f"Skipping {os.path.basename(p)}: Missing keys {missing}")
+        return None
+
+    # Deduplicate Target on Keys
+    sub_df = sub_df.drop_duplicates(subset=key_cols, keep="first")
+    return compact_strings(sub_df) if compact else sub_df
+
+
+def _batch_positions(base_index: _KeyIndex, sub_df: pd.DataFrame) -> "np.ndarray":
+    """Row of sub_df (deduplicated on the keys) matching every indexed base row, -1 if none."""
+    import numpy as np
+
+    groups = base_index.codes_for(sub_df)
+    hit = np.flatnonzero(groups >= 0)
+    group_pos = np.full(len(base_index.groups), -1, dtype=np.int64)
+    # reversed: the first target row of a key wins
+    group_pos[groups[hit][::-1]] = hit[::-1]
+    return group_pos[base_index.codes]
+
+
+def _iter_batch_files(files_list: List[Dict], key_cols: List[str], replacement_rules: Dict, workers: int,
+                      cancel_check: Callable[[], bool], compact: bool = False):
+    """
+    Yields (i, f_cfg, sub_df) in file order while the next files are loaded on a thread
+    pool (reading/parsing releases the GIL for most of the work). At most 2 x workers files
+    are loaded ahead, so prepared frames do not pile up behind a slow one. sub_df is the
+    exception instead when a file failed; cancel drops the files not started yet.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+    workers = max(1, workers)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-load")
+    pending = deque()
+    files = iter(enumerate(files_list))
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                nxt = next(files, None)
+                if nxt is None:
+                    break
+                pending.append((nxt[0], nxt[1], pool.submit(_load_batch_file, nxt[1], key_cols,
+                                                                       replacement_rules, compact)))
+            if not pending:
+                break
+            i, f_cfg, fut = pending.popleft()
+            while True:
+                if cancel_check(): raise InterruptedError()
+                try:
+                    sub_df = fut.result(timeout=0.2)
+                except FutureTimeout:
+                    continue
+                except Exception as e:
+                    sub_df = e
+                break
+            # the future would keep the frame alive until the next file is taken
+            del fut
+            yield i, f_cfg, sub_df
+            del sub_df
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _fuzzy_join_keys(b_blk: "np.ndarray", b_keys: List[str], t_blk: "np.ndarray", t_keys: List[str],
+                     jamo: bool, log_progress, cancel_check: Callable[[], bool],
+                     use_cache: bool = False, cache_max_bytes: int | None = None,
+                     processes: int | None = None, threshold: float = 80, top_k: int = 1,
+                     score_floor: float | None = None) -> Tuple[List[str | None], List[tuple | None]]:
+    """Target key matched to every (block, base key) pair, None if there is none.
+
+    Exact matches first; the remaining keys are scored only against the target keys of
+    their own block, so the cost follows the block sizes instead of base x target. A
+    single key is one block holding every target key.
+    Every scored key keeps its top_k candidates down to score_floor (default: threshold);
+    the best one is joined if it reaches threshold.
+    use_cache: candidates are kept in a fuzzy_engine.MatchCache for this target key set, so
+    later runs (with any threshold >= score_floor) only score keys they have not seen.
+    processes: worker processes for big blocks (fuzzy_engine.top_matches).
+
+    Returns (join keys, candidates): candidates[i] is a tuple of (target key, score),
+    best first, for scored keys and None for exact matches.
+    """
+    import numpy as np
+
+    floor = threshold if score_floor is None else min(score_floor, threshold)
+    # target rows grouped by block (stable: first target row wins ties, as before);
+    # a block is identified by its first target row, which does not depend on the base
+    t_order = np.argsort(t_blk, kind="stable")
+    t_sorted = t_blk[t_order]
+
+    join = [None] * len(b_keys)
+    candidates = [None] * len(b_keys)
+    exact = set(zip(t_blk.tolist(), t_keys))
+    pending = {}
+    for i, (blk, key) in enumerate(zip(b_blk.tolist(), b_keys)):
+        if (blk, key) in exact:
+            join[i] = key
+        else:
+            pending.setdefault(blk, []).append(i)
+    if not RAPIDFUZZ_AVAILABLE:
+        log_progress("[WARN] rapidfuzz 모듈 없음. 정확한 일치만 수행합니다.")
+        return join, candidates
+
+    from fuzzy_engine import top_matches, fingerprint, MatchCache
+
+    def accept(i, cands):
+        candidates[i] = cands
+        if cands and cands[0][1] >= threshold:
+            join[i] = cands[0][0]
+
+    blocks = []
+    for blk, rows in pending.items():
+        lo, hi = np.searchsorted(t_sorted, [blk, blk + 1])
+        if hi > lo:
+            blocks.append((int(t_order[lo]), rows, [t_keys[j] for j in t_order[lo:hi]]))
+
+    cache = None
+    if use_cache and blocks:
+        _, first, inverse = np.unique(t_blk, return_index=True, return_inverse=True)
+        cache = MatchCache("join", fingerprint(t_keys, first[inverse].tolist()), floor, top_k, jamo,
+                           max_bytes=cache_max_bytes)
+        hits = 0
+        for b_id, rows, _ in blocks:
+            todo = []
+            for i in rows:
+                cached = cache.get((b_id, b_keys[i]))
+                if cached is None:
+                    todo.append(i)
+                else:
+                    accept(i, cached)
+                    hits += 1
+            rows[:] = todo
+        if hits:
+            log_progress(f"[Cache] 이전에 분석한 유사 키 {hits:,}건 재사용", 50)
+
+    total = sum(len(rows) for _, rows, _ in blocks)
+    done, shown = 0, [-1]
+
+    def progress(curr, _total):
+        # Progress 50% -> 90%, logged when the percentage moves (many small blocks)
+        pct = 50 + int(((done + curr) / total) * 40)
+        if pct != shown[0]:
+            shown[0] = pct
+            log_progress(f"Fuzzy 정밀 분석 중... ({done + curr}/{total})", pct)
+
+    try:
+        for b_id, rows, choices in blocks:
+            if cancel_check(): raise InterruptedError()
+            if not rows:
+                continue
+            pos, scores = top_matches([b_keys[i] for i in rows], choices, top_k, floor, progress_callback=progress,
+                                      cancel_check=cancel_check, jamo=jamo, processes=processes)
+            for i, p_row, s_row in zip(rows, pos.tolist(), scores.tolist()):
+                cands = tuple((choices[p], sc) for p, sc in zip(p_row, s_row) if p >= 0)
+                accept(i, cands)
+                if cache is not None:
+                    cache.add((b_id, b_keys[i]), cands)
+            done += len(rows)
+    finally:
+        # blocks finished before a cancel are kept too
+        if cache is not None:
+            cache.save()
+    return join, candidates
+
+
+def _hash_keys(df: pd.DataFrame, key_cols: List[str]) -> "np.ndarray":
+    """Vectorized uint64 row hash over the key columns (categories hashed once)."""
+    return pd.util.hash_pandas_object(df[key_cols], index=False, categorize=True).to_numpy()
+
+
+def _hash_row_indexer(df_b: pd.DataFrame, df_t: pd.DataFrame, key_cols: List[str]) -> "np.ndarray":
+    """Join on composite-key hashes, then verify the real key values of the candidates.
+
+    Rows whose candidate turns out to be a hash collision are resolved exactly
+    against the (few) target rows sharing that hash.
+    """
+    import numpy as np
+
+    b_hash = _hash_keys(df_b, key_cols)
+    t_hash = _hash_keys(df_t, key_cols)
+    pos = _row_indexer(b_hash, t_hash)
+
+    cand = np.flatnonzero(pos >= 0)
+    ok = np.ones(len(cand), dtype=bool)
+    for k in key_cols:
+        b_vals = df_b[k].to_numpy(dtype=object)[cand]
+        t_vals = df_t[k].to_numpy(dtype=object)[pos[cand]]
+        ok &= (b_vals == t_vals) | (pd.isna(b_vals) & pd.isna(t_vals))
+
+    bad = cand[~ok]
+    if len(bad):
+        _debug_log(f"[Hash] {len(bad)} colliding rows, resolving exactly")
+        bad_hashes = set(b_hash[bad].tolist())
+        t_rows = np.flatnonzero(pd.Series(t_hash).isin(bad_hashes).to_numpy())
+
+        def _row_key(df, i):
+            return tuple(None if pd.isna(v) else v for v in (df[k].iat[i] for k in key_cols))
+
+        lookup = {}
+        for i in t_rows:
+            lookup.setdefault(_row_key(df_t, i), i)
+        for i in bad:
+            pos[i] = lookup.get(_row_key(df_b, i), -1)
+    return pos
+
+
+class _KeyIndex:
+    """
+    Key lookup built once over one frame and probed by many others (e.g. base chunks).
+
+    Each key column keeps an Index of its distinct values (_shared_codes); rows are
+    combined in mixed radix (_combine_codes) and mapped to dense group ids. Probing
+    a frame only hashes that frame's distinct key values.
+    """
+
+    def __init__(self, df: pd.DataFrame, key_cols: List[str]):
+        import numpy as np
+
+        self.key_cols = list(key_cols)
+        self.levels = []
+        self.steps = []  # Index of partial codes for every densify step
+        level_codes = []
+        for k in self.key_cols:
+            (codes,), level = _shared_codes(df[k])
+            self.levels.append(level)
+            level_codes.append(codes)
+        combined = _combine_codes(level_codes, self._sizes(), self.steps)
+        self.codes, uniques = pd.factorize(combined)
+        self.groups = pd.Index(uniques)
+        # factorize numbers groups by first appearance -> first row of each group
+        is_new = np.ones(len(self.codes), dtype=bool)
+        if len(self.codes) > 1:
+            is_new[1:] = self.codes[1:] > np.maximum.accumulate(self.codes)[:-1]
+        self.first_pos = np.flatnonzero(is_new)
+
+    def _sizes(self):
+        # every level has a trailing "null" code
+        return [len(level) + 1 for level in self.levels]
+
+    def codes_for(self, other: pd.DataFrame) -> "np.ndarray":
+        """Group id (in this index) for every row of ``other``; -1 where the key is absent."""
+        import numpy as np
+
+        absent = np.zeros(len(other), dtype=bool)
+        level_codes = []
+        for k, level in zip(self.key_cols, self.levels):
+            cat = _as_category(other[k])
+            # same codes as _shared_codes gave the indexed frame (level Index hashed once)
+            lookup = np.append(level.get_indexer(cat.cat.categories), len(level)).astype(np.int64)
+            codes = lookup[cat.cat.codes.to_numpy()]
+            absent |= codes < 0
+            level_codes.append(codes)
+        combined = _combine_codes([np.where(absent, 0, c) for c in level_codes], self._sizes(), self.steps,
+                                  build=False)
+        absent |= combined < 0
+        groups = self.groups.get_indexer(np.where(absent, 0, combined))
+        return np.where(absent, -1, groups)
+
+    def positions_for(self, other: pd.DataFrame) -> "np.ndarray":
+        """First row position (in the indexed frame) for every row of ``other``; -1 if none."""
+        import numpy as np
+
+        groups = self.codes_for(other)
+        return np.where(groups >= 0, self.first_pos[np.maximum(groups, 0)], -1)
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Typed-load column (Int64, Float64, string, datetime) -> str values, NA -> ""."""
+    s = series.astype(object)
+    return s.where(s.notna(), "").astype(str)
+
+
+def _take_columns(df_t: pd.DataFrame, cols: List[str], pos: "np.ndarray", index=None, fill="") -> pd.DataFrame:
+    """Materialize target columns for every base row with one positional indexer.
+
+    Rows with pos == -1 (no match) get ``fill``.
+    """
+    import numpy as np
+
+    cols = list(dict.fromkeys(cols))
+    data = {}
+    for col in cols:
+        s = df_t[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # compact columns stay compact: only the codes are gathered
+            if fill not in s.cat.categories:
+                s = s.cat.add_categories([fill])
+            data[col] = s.array.take(pos, allow_fill=True, fill_value=fill)
+        elif isinstance(s.dtype, pd.StringDtype):
+            data[col] = s.array.take(pos, allow_fill=True, fill_value=fill)
+        else:
+            # trailing fill slot: pos -1 picks it up
+            src_col = s if s.dtype == object else _as_text(s)
+            values = np.append(src_col.to_numpy(dtype=object), fill)
+            data[col] = values[pos]
+    return pd.DataFrame(data, index=index, columns=cols)
+
+
+def _apply_multi_filters(df, f_list, label, cancel_check=lambda: False):
+    """All filters AND-ed into one mask (see filter_engine); the frame is sliced once."""
+    if not f_list: return df
+    return CompiledFilters(f_list, label, _debug_log).apply(df, cancel_check)
+
+
+def _base_filter_list(filters: Dict) -> list:
+    base_filters = filters.get("base_multi", [])
+    if not base_filters and (filters.get("base") or filters.get("base_prefix")):
+        base_filters = [filters.get("base") or filters.get("base_prefix")]
+    return base_filters
+
+
+def _target_filter_list(filters: Dict) -> list:
+    # Apply Target Filters
+    tgt_filters = filters.get("target_multi", [])
+    if not tgt_filters and filters.get("target_prefix"):
+        tgt_filters = [filters.get("target_prefix")]
+    if isinstance(tgt_filters, dict): tgt_filters = [tgt_filters]
+
+    # Target Filter: Multiple exact value match (dropdown based / old advanced)
+    advanced = [{"col": tf.get("col"), "values": tf.get("values")} for tf in filters.get("target_advanced", [])]
+    return list(tgt_filters) + advanced
+
+
+def _filter_target(df_t, filters: Dict, log_progress, cancel_check):
+    def on_filter(spec, mask):
+        if "values" in spec:
+            log_progress(f"[Filter] 대상 데이터(고급): {int(mask.sum()):,}건 (필터: {', '.join(spec['values'])})")
+
+    # one mask for both kinds, one slice
+    return CompiledFilters(_target_filter_list(filters), "대상", _debug_log).apply(df_t, cancel_check, on_filter)
+
+
+def _pushdown_filters(f_list, label, options: Dict, columns: List[str] | None = None,
+                      replacement_rules: Dict | None = None) -> CompiledFilters | None:
+    """
+    Filters to evaluate while the table is read (options["filter_pushdown"], default on), or None.
+    columns: only filters on these columns (the others never applied to the loaded frame).
+    Not pushed down when replacement rules rewrite a filtered column: filters see replaced values.
+    """
+    if not f_list or not options.get("filter_pushdown", True):
+        return None
+    if isinstance(f_list, dict): f_list = [f_list]
+    if columns is not None:
+        f_list = [f for f in f_list if f and f.get("col") in columns]
+    compiled = CompiledFilters(f_list, label, _debug_log)
+    if not compiled:
+        return None
+    if replacement_rules and any(c in replacement_rules for c in compiled.columns):
+        return None
+    return compiled
+
+
+def _apply_replacements(df, replacement_rules):
+    for col, rules in (replacement_rules or {}).items():
+        if col in df.columns and isinstance(rules, dict):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                from utils import recode_categories
+                df[col] = recode_categories(df[col], lambda u: u.replace(rules), na=None)
+                continue
+            if df[col].dtype != object and not isinstance(df[col].dtype, pd.StringDtype):
+                # typed load: rules are text -> text
+                df[col] = _as_text(df[col])
+            df[col] = df[col].replace(rules)
+    return df
+
+
+def _normalize_keys(df, key_cols):
+    from utils import apply_expert_norm
+
+    for k in key_cols:
+        if k in df.columns:
+            df[k] = apply_expert_norm(df[k]).astype('category')
+    return df
+
+
+def _check_license(options: Dict, n_base: int, n_target: int) -> None:
+    # license limit (personal)
+    lic_type = (options.get("license_type") or "personal").lower()
+    if lic_type == "personal":
+        from commercial_config import PERSONAL_MAX_ROWS
+
+        if n_base > PERSONAL_MAX_ROWS or n_target > PERSONAL_MAX_ROWS:
+            from commercial_config import CONTACT_INFO
+            raise Exception(
+                f"현재 라이선스는 {PERSONAL_MAX_ROWS:,}행 이하만 지원합니다.\n"
+                f"(현재 데이터 - 기준: {n_base:,} / 대상: {n_target:,}행)\n\n"
+                f"100만 행 이상의 대용량 데이터 처리는 커스텀 버전이 필요합니다.\n"
+                f"문의: {CONTACT_INFO}"
+            )
+
+
+def _target_cache_path(target_config, key_cols, take_cols, options, replacement_rules, filters):
+    """Cache file for a prepared target, or None if this target can't be cached."""
+    if target_config.get("type") != "file" or not options.get("target_cache", True):
+        return None
+    try:
+        from cache_store import cache_dir, file_fingerprint, make_key
+        target_filters = {k: v for k, v in (filters or {}).items() if k.startswith("target")}
+        key = make_key(
+            "target-v1", file_fingerprint(target_config["path"]),
+            target_config.get("sheet"), target_config.get("header"),
+            key_cols, take_cols, replacement_rules or {}, target_filters, bool(options.get("top10")),
+            bool(options.get("typed_load")), _use_compact(target_config, options),
+        )
+        return os.path.join(cache_dir("targets"), f"{key}.pkl")
+    except Exception as e:
+        _debug_log(f"[Cache] target cache disabled: {e}")
+        return None
+
+
+def _prepare_target(target_config, key_cols, take_cols, options, replacement_rules, filters,
+                    use_fuzzy, n_base, log_progress, cancel_check):
+    """
+    Loads the target and applies replacements, target filters, Top 10 and key
+    normalization. Without fuzzy matching the keys are also deduplicated and a
+    key index is built, and the result is cached on disk (keyed by the file
+    fingerprint and every setting above) so warm runs skip straight to the join.
+
+    Returns dict(df_t, raw_rows, dup, key_index); dup/key_index are None in fuzzy mode.
+    """
+    cache_path = None if use_fuzzy else _target_cache_path(
+        target_config, key_cols, take_cols, options, replacement_rules, filters)
+    if cache_path and os.path.exists(cache_path):
+        prepared = None
+        try:
+            prepared = pd.read_pickle(cache_path)
+        except Exception as e:
+            _debug_log(f"[Cache] target cache read failed: {e}")
+        if prepared is not None:
+            from cache_store import touch
+            touch(cache_path)
+            log_progress("[Cache] 준비된 대상 데이터 재사용 중...", 30)
+            _check_license(options, n_base, prepared["raw_rows"])
+            return prepared
+
+    # load keys for matching + takes; target filters are applied while reading when possible
+    pushdown = _pushdown_filters(_target_filter_list(filters), "대상", options, key_cols + take_cols,
+                                 replacement_rules) if filters else None
+    df_t = _load_df(target_config, key_cols + take_cols, bool(options.get("typed_load")),
+                    _use_compact(target_config, options), pushdown, cancel_check)
+    if cancel_check(): raise InterruptedError()
+    raw_rows = _raw_rows(df_t)
+    _check_license(options, n_base, raw_rows)
+    if pushdown:
+        advanced = [v for tf in filters.get("target_advanced", []) for v in (tf.get("values") or [])]
+        if advanced:
+            log_progress(f"[Filter] 대상 데이터(고급): {len(df_t):,}건 (필터: {', '.join(map(str, advanced))})")
+
+    # replacements (target only)
+    if replacement_rules:
+        log_progress("[Processing] 사용자 정의 치환 규칙 적용 중...", 20)
+        _apply_replacements(df_t, replacement_rules)
+
+    if filters and not pushdown:
+        df_t = _filter_target(df_t, filters, log_progress, cancel_check)
+
+    # Expert Option: Top 10
+    if options.get("top10") and not df_t.empty:
+        log_progress("[Expert] 상위 10개 데이터만 추출 중...", 25)
+        # If there's a numeric column to sort by, we could ask, but usually it's just first 10
+        # or we sort by the first column as a proxy for 'relevance' if it's already sorted
+        df_t = df_t.head(10).copy()
+
+    if df_t.empty:
+        raise ValueError("필터 결과 대상 데이터가 비어 있습니다. 매칭을 진행할 수 없습니다.")
+
+    _normalize_keys(df_t, key_cols)
+    prepared = {"df_t": df_t, "raw_rows": raw_rows, "dup": None, "key_index": None}
+    if use_fuzzy:
+        return prepared
+
+    prepared["dup"] = int(df_t.duplicated(subset=key_cols).sum())
+    df_t = df_t.drop_duplicates(subset=key_cols, keep="first").reset_index(drop=True)
+    prepared["df_t"] = df_t
+    prepared["key_index"] = _KeyIndex(df_t, key_cols)
+
+    if cache_path:
+        try:
+            from config import TARGET_CACHE_MAX_BYTES
+            from cache_store import evict_lru
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            pd.to_pickle(prepared, tmp_path)
+            os.replace(tmp_path, cache_path)
+            evict_lru(os.path.dirname(cache_path), int(options.get("target_cache_max_bytes") or TARGET_CACHE_MAX_BYTES))
+        except Exception as e:
+            _debug_log(f"[Cache] target cache write failed: {e}")
+    return prepared
+
+
+def _base_columns(key_cols: List[str], options: Dict, filters: Dict) -> Tuple[List[str] | None, List[str] | None]:
+    """
+    Base-side column projection. options["base_cols"] lists the base columns the output
+    should carry; only those, the keys and the filtered columns are read from the file.
+    Returns (usecols, output_cols), both None when every base column is passed through.
+    """
+    out_cols = options.get("base_cols")
+    if not out_cols:
+        return None, None
+    if isinstance(out_cols, str):
+        out_cols = [out_cols]
+    out_cols = [str(c).strip() for c in out_cols if str(c).strip()]
+    output = [k for k in key_cols if k not in out_cols] + out_cols
+    filter_cols = [str(f.get("col")).strip() for f in (_base_filter_list(filters) if filters else []) if f.get("col")]
+    return list(dict.fromkeys(output + filter_cols)), output
+
+
+def _use_compact(cfg: Dict, options: Dict) -> bool:
+    """options["compact_strings"]: True / False / "auto" (default: files of COMPACT_AUTO_BYTES and up)."""
+    compact = options.get("compact_strings", "auto")
+    if compact == "auto":
+        try:
+            return cfg.get("type") == "file" and os.path.getsize(cfg["path"]) >= COMPACT_AUTO_BYTES
+        except (OSError, KeyError, TypeError):
+            return False
+    return bool(compact)
+
+
+def _use_streaming(base_config: Dict, options: Dict) -> bool:
+    if base_config.get("type") != "file":
+        return False
+    stream = options.get("stream", "auto")
+    if stream == "auto":
+        if options.get("fuzzy"):
+            return False
+        try:
+            return os.path.getsize(base_config["path"]) >= STREAM_AUTO_BYTES
+        except (OSError, KeyError, TypeError):
+            return False
+    return bool(stream)
+
+
+def _match_streaming(base_config, target_config, key_cols, take_cols, out_dir, options,
+                     replacement_rules, filters, log_progress, cancel_check):
+    """
+    Out-of-core matching: the target lookup is built once, the base file is read
+    in fixed-size row chunks and every matched chunk is appended to the result.
+    Peak memory is roughly the target index plus one chunk (xlsx/xls bases are parsed whole
+    first, see iter_table_chunks).
+    """
+    from excel_io import iter_table_chunks
+
+    if options.get("fuzzy"):
+        log_progress("[INFO] 스트리밍 모드에서는 오타 보정이 지원되지 않아 자동 해제됩니다.", 5)
+
+    log_progress("[Stream] 대상 데이터 준비 중...", 10)
+    prepared = _prepare_target(target_config, key_cols, take_cols, options, replacement_rules, filters,
+                               False, 0, log_progress, cancel_check)
+    df_t, key_index = prepared["df_t"], prepared["key_index"]
+    if prepared["dup"]:
+        log_progress(f"[WARN] 대상 데이터에 중복 키가 {prepared['dup']:,}건 있어 첫 번째 값으로만 매칭합니다.")
+
+    # compiled once for all chunks
+    base_filters = CompiledFilters(_base_filter_list(filters), "기준", _debug_log) if filters else None
+    chunk_rows = int(options.get("chunk_rows") or STREAM_CHUNK_ROWS)
+    # chunks are appended to one file: xlsx sheet XML (extra sheets past Excel's row limit),
+    # CSV, or Parquet row groups / Feather record batches
+    out_format = _output_format(options)
+    columnar = out_format in ("parquet", "feather")
+    out_path = _result_path(base_config, out_dir, f".{out_format}")
+    if columnar:
+        # Feather files take one dictionary per column: chunk categories are written as text there
+        writer = ColumnarWriter(out_path, out_format, dictionary=out_format == "parquet")
+    elif out_format == "xlsx":
+        writer = XlsxStreamWriter(out_path, "matched")
+    else:
+        writer = nullcontext()
+    # CSV chunks are appended to a temporary file, renamed once every chunk is written
+    csv_tmp = f"{out_path}.{os.getpid()}.tmp"
+    quiet = lambda *a, **k: None
+
+    base_usecols, base_cols = _base_columns(key_cols, options, filters)
+    total = matched = seen_rows = 0
+    out_take = preview = None
+    try:
+        with writer:
+            chunks = iter_table_chunks(base_config["path"], base_config["sheet"], base_config["header"], base_usecols, chunk_rows)
+            for i, (chunk, frac) in enumerate(chunks):
+                if cancel_check(): raise InterruptedError()
+                seen_rows += len(chunk)
+                _check_license(options, seen_rows, prepared["raw_rows"])
+                prog = 25 + int((frac if frac is not None else 0) * 70)
+                log_progress(f"[Stream] 청크 {i+1} 매칭 중... (누적 {seen_rows:,}행)", prog)
+
+                if out_take is None:
+                    base_cols = base_cols or chunk.columns.tolist()
+                    out_take = [c if (c not in base_cols or c in key_cols) else f"{c}_대상" for c in take_cols]
+                if base_filters:
+                    chunk = base_filters.apply(chunk, cancel_check)
+                if chunk.empty:
+                    continue
+
+                # sheet slices and filtered chunks are views: keys are rewritten on a shallow copy
+                chunk = _normalize_keys(chunk.copy(deep=False), key_cols)
+                pos = key_index.positions_for(chunk)
+                res = _take_columns(df_t, take_cols, pos, index=chunk.index)
+                res.columns = [out_take[take_cols.index(c)] for c in res.columns]
+                joined = pd.concat([chunk[base_cols], res], axis=1)
+                joined = _format_output(joined, base_cols, out_take, quiet, keep_types=columnar)
+
+                mask_match = _match_mask(joined, out_take)
+                if options.get("match_only"):
+                    joined = joined[mask_match]
+                total += len(joined)
+                matched += int(mask_match.sum())
+                if preview is None and len(joined):
+                    preview = joined.head(5)
+
+                if out_format != "csv":
+                    writer.write(joined, cancel_check)
+                else:
+                    first = not os.path.exists(csv_tmp)
+                    joined.to_csv(csv_tmp, mode="w" if first else "a", header=first, index=False,
+                                  encoding="utf-8-sig" if first else "utf-8")
+                del joined, res, chunk
+        if os.path.exists(csv_tmp):
+            os.replace(csv_tmp, out_path)
+    except BaseException as e:
+        # no half-written CSV is left behind (cancel or error)
+        try:
+            os.remove(csv_tmp)
+        except OSError:
+            pass
+        if isinstance(e, PermissionError):
+            raise Exception(f"저장 실패: 파일이 열려있습니다.\n'{os.path.basename(out_path)}'를 닫아주세요.")
+        raise
+
+    if out_take is None or not os.path.exists(out_path):
+        raise ValueError("필터 결과 기준 데이터가 비어 있습니다. 매칭을 진행할 수 없습니다.")
+
+    if out_format == "xlsx" and len(writer.sheet_names) > 1:
+        log_progress(f"[알림] 엑셀 행 제한(1,048,576행)으로 결과를 {len(writer.sheet_names)}개 시트에 나누어 저장했습니다.", 98)
+
+    _debug_log(f"[Stream] Matched: {matched}/{total}")
+    rate = (matched / total * 100.0) if total else 0.0
+    summary = f"[SUCCESS] 총 {total:,}건 중 {matched:,}건 매칭 성공 ({rate:.1f}%)\n[FAIL] 실패: {total - matched:,}건"
+    log_progress(f"최종 결과 저장 완료: {os.path.basename(out_path)}", 97)
+    return out_path, summary, preview
 
 
 def match_universal(
@@ -85,16 +899,39 @@ def match_universal(
     needed_target = list(dict.fromkeys(key_cols + take_cols))
 
     use_fuzzy = bool(options.get("fuzzy", False))
+    # options["fuzzy_jamo"]: Korean keys are compared jamo by jamo (see fuzzy_engine)
+    use_jamo = bool(options.get("fuzzy_jamo", False))
+    # options["fuzzy_processes"]: worker processes for big fuzzy jobs (default: one per core)
+    fuzzy_processes = options.get("fuzzy_processes")
     use_color = bool(options.get("color", False))
 
-    if len(key_cols) > 1 and use_fuzzy:
-        log_progress("[INFO] 다중 키 매칭 시 오타 보정은 지원되지 않아 자동 해제됩니다.", 5)
+    # multi-key fuzzy is opt-in: options["fuzzy_key"] names the key compared fuzzily,
+    # the other keys must match exactly and split the job into blocks
+    fuzzy_key = options.get("fuzzy_key") or key_cols[-1]
+    if use_fuzzy and len(key_cols) > 1 and not options.get("fuzzy_key"):
+        log_progress("[INFO] 다중 키 매칭 시 오타 보정은 자동 해제됩니다. (오타 보정 키를 지정하면 사용할 수 있습니다)", 5)
         use_fuzzy = False
+        options = {**options, "fuzzy": False}
+    if use_fuzzy and fuzzy_key not in key_cols:
+        log_progress(f"[WARN] 오타 보정 키({fuzzy_key})가 매칭 키에 없어 마지막 키({key_cols[-1]})를 사용합니다.", 5)
+        fuzzy_key = key_cols[-1]
+
+    if not is_batch and _use_streaming(base_config, options):
+        log_progress("[Stream] 대용량 분할(Chunk) 매칭 모드 시작...", 5)
+        return _match_streaming(base_config, target_config, key_cols, take_cols, out_dir, options,
+                                replacement_rules, filters, log_progress, cancel_check)
 
     log_progress("데이터 로드 중...", 10)
-    # Load all columns from base to preserve user's original data in output
-    df_b = _load_df(base_config, None) 
-    base_cols = df_b.columns.tolist()
+    # Load all base columns to preserve user's original data in output,
+    # unless options["base_cols"] narrows the pass-through columns
+    base_usecols, base_cols = _base_columns(key_cols, options, filters)
+    # options["typed_load"]: native dtypes, only key columns become normalized text
+    # base filters are evaluated while reading (options["filter_pushdown"], see _pushdown_filters)
+    base_pushdown = _pushdown_filters(_base_filter_list(filters), "기준", options) if filters else None
+    df_b = _load_df(base_config, base_usecols, bool(options.get("typed_load")) and not is_batch,
+                    _use_compact(base_config, options) and not is_batch, base_pushdown, cancel_check)
+    base_rows = _raw_rows(df_b)
+    base_cols = base_cols or df_b.columns.tolist()
     
     if cancel_check(): raise InterruptedError()
     
@@ -104,110 +941,65 @@ def match_universal(
         # Initialize joined with base
         df_t = pd.DataFrame() 
         
-        joined = df_b.copy()
+        # no defensive copy: filtering slices once, and only df_b.columns is used afterwards
+        joined = df_b
         
-        # Apply Base Filters
-        base_filters = filters.get("base_multi", [])
-        if not base_filters and (filters.get("base") or filters.get("base_prefix")):
-            base_filters = [filters.get("base") or filters.get("base_prefix")]
-            
-        if filters:
-             def _apply_f(df, f_list):
-                if not f_list: return df
-                if isinstance(f_list, dict): f_list = [f_list]
-                res_df = df.copy()
-                for f in f_list:
-                    col = f.get("col")
-                    op = f.get("op", "==")
-                    val = f.get("keyword") or f.get("value")
-                    if col not in res_df.columns: continue
-                    if val in ["(값 선택)", "(데이터 없음)", None, ""]: continue
-                    try:
-                        if op in [">=", "<=", ">", "<"]:
-                            f_val = float(val)
-                            col_series = pd.to_numeric(res_df[col], errors='coerce')
-                        else:
-                            f_val = str(val)
-                            col_series = res_df[col].astype(str)
-                        if op == "==": 
-                             res_df = res_df[col_series == f_val]
-                        elif op == ">=": res_df = res_df[col_series >= f_val]
-                        elif op == "<=": res_df = res_df[col_series <= f_val]
-                        elif op == ">": res_df = res_df[col_series > f_val]
-                        elif op == "<": res_df = res_df[col_series < f_val]
-                    except: pass
-                return res_df
-             
-             joined = _apply_f(joined, base_filters)
+        # Apply Base Filters (same engine as the single-target path)
+        if filters and not base_pushdown:
+             joined = apply_filters(joined, _base_filter_list(filters), "기준", cancel_check, _debug_log)
              
-        # Apply replacement rules to joined base if applicable
+        # Apply replacement rules to joined base if applicable; on a shallow copy so
+        # neither df_b nor the filtered slice is written to (columns are replaced, not copied)
         if replacement_rules:
-             for col, rules in replacement_rules.items():
-                 if col in joined.columns and isinstance(rules, dict):
-                     joined[col] = joined[col].replace(rules)
+            joined = _apply_replacements(joined.copy(deep=False), replacement_rules)
 
         total_files = len(files_list)
-        for i, f_cfg in enumerate(files_list):
-            if cancel_check(): raise InterruptedError()
-            p = f_cfg['path']
-            fname = os.path.basename(p)
+        # base keys are indexed once; every file only maps its own keys onto the base rows
+        # and its new columns are gathered positionally, then all are added in one concat
+        base_index = _KeyIndex(joined, key_cols)
+        columns = set(joined.columns)
+        new_frames = []
+        # options["batch_workers"]: target files read and prepared concurrently (merged in file order)
+        workers = int(options.get("batch_workers") or BATCH_LOAD_WORKERS)
+        # options["batch_compact"]: gathered columns are kept compact (categorical codes / Arrow
+        # strings holding only the matched values) and each file is released once aligned,
+        # so memory follows the output columns, not the number or size of the files
+        batch_compact = options.get("batch_compact", True)
+        for i, f_cfg, sub_df in _iter_batch_files(files_list, key_cols, replacement_rules, workers, cancel_check,
+                                                  batch_compact):
+            fname = os.path.basename(f_cfg['path'])
             log_progress(f"[{i+1}/{total_files}] 파일 병합 중: {fname}", 15 + int((i/total_files)*60))
-            
+            if isinstance(sub_df, Exception):
+                _debug_log(f"Error merging {fname}: {sub_df}")
+                continue
+            if sub_df is None:
+                continue
+
             try:
-                from excel_io import read_table_file
-                
-                sheet = f_cfg.get('sheet')
-                # If sheet not specified, try to find first
-                if not sheet:
-                    from excel_io import get_sheet_names
-                    sheets = get_sheet_names(p)
-                    sheet = sheets[0] if sheets else 0
-                
-                header = f_cfg.get('header', 1)
-                
-                # Load Target
-                sub_df = read_table_file(p, sheet, header, None)
-                
-                # Apply replacement rules to target
-                if replacement_rules:
-                    for col, rules in replacement_rules.items():
-                        if col in sub_df.columns and isinstance(rules, dict):
-                            sub_df[col] = sub_df[col].replace(rules)
-
-                # Column Selection (Fetch only selected columns + key columns)
-                fetch_cols = f_cfg.get('fetch_cols')
-                if fetch_cols:
-                    mapping = f_cfg.get('mapping', {})
-                    # mapping keys are original target column names
-                    target_key_cols = list(mapping.keys()) if mapping else key_cols
-                    
-                    keep = list(set(fetch_cols) | set(target_key_cols))
-                    keep = [c for c in keep if c in sub_df.columns]
-                    sub_df = sub_df[keep]
-
-                # Column Mapping (Renaming target columns to match base keys)
-                mapping = f_cfg.get('mapping')
-                if mapping:
-                     # mapping is { TargetColName: BaseKeyName }
-                     sub_df = sub_df.rename(columns=mapping)
-                
-                # Verify Keys
-                missing = [k for k in key_cols if k not in sub_df.columns]
-                if missing:
-                    _debug_log(f"Skipping {fname}: Missing keys {missing}")
-                    continue
-                
-                # Deduplicate Target on Keys
-                sub_df = sub_df.drop_duplicates(subset=key_cols, keep="first")
-                
-                # Suffix for this file
+                # Suffix for this file: same names as a left merge with suffixes=("", suffix)
                 suffix = f"_{i+1}"
-                
-                # Merge
-                joined = pd.merge(joined, sub_df, on=key_cols, how="left", suffixes=("", suffix))
+                cols = [c for c in sub_df.columns if c not in key_cols]
+                names = [f"{c}{suffix}" if c in columns else c for c in cols]
+                if len(set(names)) < len(names) or columns.intersection(names):
+                    raise ValueError(f"duplicate columns after suffix {suffix}")
+
+                pos = _batch_positions(base_index, sub_df)
+                # unmatched rows stay blank, as after the merge + fillna("") of the output step
+                new = _take_columns(sub_df, cols, pos, index=joined.index).set_axis(names, axis=1)
+                if batch_compact:
+                    # categories of values no base row picked would keep the whole file alive
+                    for c in names:
+                        if isinstance(new[c].dtype, pd.CategoricalDtype):
+                            new[c] = new[c].cat.remove_unused_categories()
+                new_frames.append(new)
+                columns.update(names)
                 
             except Exception as e:
                 _debug_log(f"Error merging {fname}: {e}")
+            del sub_df
+
+        if new_frames:
+            joined = pd.concat([joined] + new_frames, axis=1)
                 
         # Final cleanup for Batch Result
         take_cols = [c for c in joined.columns if c not in df_b.columns and c not in key_cols]
@@ -215,25 +1007,11 @@ def match_universal(
 
         return _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir, log_progress, df_t)
 
-    if not is_batch:
-        df_t = _load_df(target_config, key_cols + take_cols)  # load keys for matching + takes
-        if cancel_check(): raise InterruptedError()
-    
-    # license limit (personal)
-    lic_type = (options.get("license_type") or "personal").lower()
-    if lic_type == "personal":
-        from commercial_config import PERSONAL_MAX_ROWS
-
-        if len(df_b) > PERSONAL_MAX_ROWS or len(df_t) > PERSONAL_MAX_ROWS:
-            from commercial_config import CONTACT_INFO
-            raise Exception(
-                f"현재 라이선스는 {PERSONAL_MAX_ROWS:,}행 이하만 지원합니다.\n"
-                f"(현재 데이터 - 기준: {len(df_b):,} / 대상: {len(df_t):,}행)\n\n"
-                f"100만 행 이상의 대용량 데이터 처리는 커스텀 버전이 필요합니다.\n"
-                f"문의: {CONTACT_INFO}"
-            )
+    prepared = _prepare_target(target_config, key_cols, take_cols, options, replacement_rules, filters,
+                               use_fuzzy, base_rows, log_progress, cancel_check)
+    df_t = prepared["df_t"]
 
-    rows_max = max(len(df_b), len(df_t))
+    rows_max = max(base_rows, prepared["raw_rows"])
     
     # Large Data Warning
     if rows_max > 10000:
@@ -241,98 +1019,16 @@ def match_universal(
         
     use_fast = rows_max >= 50000  # auto fast mode for big data
 
-    # replacements (target only)
-    if replacement_rules:
-        log_progress("[Processing] 사용자 정의 치환 규칙 적용 중...", 20)
-        for col, rules in replacement_rules.items():
-            if col in df_t.columns and isinstance(rules, dict):
-                df_t[col] = df_t[col].replace(rules)
-
-    # Filtering Logic
-    if filters:
+    # Filtering Logic (target filters are part of the prepared target)
+    if filters and not base_pushdown:
         log_progress("데이터 필터링 적용 중...", 22)
-        
-        def apply_multi_filters(df, f_list, label):
-            if not f_list: return df
-            if isinstance(f_list, dict): f_list = [f_list]
-            
-            res_df = df.copy()
-            for f in f_list:
-                if cancel_check(): raise InterruptedError()
-                col = f.get("col")
-                op = f.get("op", "==")
-                val = f.get("keyword") or f.get("value")
-                
-                if col not in res_df.columns: continue
-                if val in ["(값 선택)", "(데이터 없음)", None, ""]: continue
-                
-                try:
-                    # Numeric Conversion if possible
-                    if op in [">=", "<=", ">", "<"]:
-                        f_val = float(val)
-                        col_series = pd.to_numeric(res_df[col], errors='coerce')
-                    else:
-                        f_val = str(val)
-                        col_series = res_df[col].astype(str)
-                    
-                    if op == "==": 
-                        if val == "(값 있음)":
-                            res_df = res_df[res_df[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).notnull()]
-                        elif val == "(값 없음)":
-                            res_df = res_df[res_df[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).isnull()]
-                        else:
-                            res_df = res_df[col_series == f_val]
-                    elif op == ">=": res_df = res_df[col_series >= f_val]
-                    elif op == "<=": res_df = res_df[col_series <= f_val]
-                    elif op == ">": res_df = res_df[col_series > f_val]
-                    elif op == "<": res_df = res_df[col_series < f_val]
-                    elif op == "Exist":
-                        res_df = res_df[res_df[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).notnull()]
-                    elif op == "Not Exist":
-                        res_df = res_df[res_df[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).isnull()]
-                    
-                    _debug_log(f"[Filter] {label} ({col} {op} {val})")
-                except Exception as fe:
-                    _debug_log(f"[Warning] 필터 적용 실패 ({col}): {fe}")
-            return res_df
-
-        # Apply Base Filters
-        base_filters = filters.get("base_multi", [])
-        if not base_filters and (filters.get("base") or filters.get("base_prefix")):
-            base_filters = [filters.get("base") or filters.get("base_prefix")]
-        df_b = apply_multi_filters(df_b, base_filters, "기준")
-
-        # Apply Target Filters
-        tgt_filters = filters.get("target_multi", [])
-        if not tgt_filters and filters.get("target_prefix"):
-            tgt_filters = [filters.get("target_prefix")]
-        df_t = apply_multi_filters(df_t, tgt_filters, "대상")
-        
-        # Target Filter: Multiple exact value match (dropdown based / old advanced)
-        target_fs = filters.get("target_advanced", [])
-        for tf in target_fs:
-            if cancel_check(): raise InterruptedError()
-            col, vals = tf.get("col"), tf.get("values")
-            if col in df_t.columns and vals:
-                if "(값 있음)" in vals:
-                    df_t = df_t[df_t[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).notnull()].copy()
-                elif "(값 없음)" in vals:
-                    df_t = df_t[df_t[col].astype(str).str.strip().replace(['nan','NaN','None',''], None).isnull()].copy()
-                else:
-                    df_t = df_t[df_t[col].astype(str).isin(vals)].copy()
-                log_progress(f"[Filter] 대상 데이터(고급): {len(df_t):,}건 (필터: {', '.join(vals)})")
-
-    # Expert Option: Top 10
-    if options.get("top10") and not df_t.empty:
-        log_progress("[Expert] 상위 10개 데이터만 추출 중...", 25)
-        # If there's a numeric column to sort by, we could ask, but usually it's just first 10
-        # or we sort by the first column as a proxy for 'relevance' if it's already sorted
-        df_t = df_t.head(10).copy()
+        df_b = _apply_multi_filters(df_b, _base_filter_list(filters), "기준", cancel_check)
 
     if df_b.empty:
         raise ValueError("필터 결과 기준 데이터가 비어 있습니다. 매칭을 진행할 수 없습니다.")
-    if df_t.empty:
-        raise ValueError("필터 결과 대상 데이터가 비어 있습니다. 매칭을 진행할 수 없습니다.")
+    if len(base_cols) < df_b.shape[1]:
+        # filter-only columns are not part of the output
+        df_b = df_b.drop(columns=[c for c in df_b.columns if c not in base_cols])
 
     # normalize keys
     log_progress("데이터 정규화 중...", 30)
@@ -341,37 +1037,22 @@ def match_universal(
     #    Actually current logic: keep all targets? 
     import numpy as np
     import gc
-    from utils import apply_expert_norm, apply_expert_format
 
-    for k in key_cols:
-        if k in df_b.columns:
-            df_b[k] = apply_expert_norm(df_b[k]).astype('category')
-        if k in df_t.columns:
-            df_t[k] = apply_expert_norm(df_t[k]).astype('category')
+    _normalize_keys(df_b, key_cols)
             
     gc.collect()
 
-    # fuzzy (single key only)
-    if use_fuzzy and RAPIDFUZZ_AVAILABLE and len(key_cols) == 1:
-        log_progress("[AI] 오타 보정(AI Fuzzy) 분석 중...", 40)
-        k = key_cols[0]
-        if k in df_b.columns and k in df_t.columns:
-            def fuzzy_progress(curr, total):
-                log_progress(f"[AI] 오타 분석 중... ({curr}/{total})", 40 + int((curr/total)*9))
-            
-            from utils import get_fuzzy_mapper
-            mapper = get_fuzzy_mapper(df_b[k], df_t[k], threshold=90, progress_callback=fuzzy_progress)
-            if mapper:
-                log_progress(f"총 {len(mapper)}건의 유사 키를 발견하여 보정 완료.")
-                df_t[k] = df_t[k].map(mapper).fillna(df_t[k])
-
     # target dup keys
-    if set(key_cols).issubset(df_t.columns):
+    if prepared["dup"] is not None:
+        if prepared["dup"]:
+            log_progress(f"[WARN] 대상 데이터에 중복 키가 {prepared['dup']:,}건 있어 첫 번째 값으로만 매칭합니다.")
+    elif set(key_cols).issubset(df_t.columns):
         dup = int(df_t.duplicated(subset=key_cols).sum())
         if dup:
             log_progress(f"[WARN] 대상 데이터에 중복 키가 {dup:,}건 있어 첫 번째 값으로만 매칭합니다.")
         df_t = df_t.drop_duplicates(subset=key_cols, keep="first")
 
+    review = None  # fuzzy candidate review sheet (options["fuzzy_top_k"])
     if not use_fuzzy:
         # FAST MERGE (Exact)
         log_progress(f"매칭 수행 중... (키: {', '.join(key_cols)})", 50)
@@ -383,35 +1064,31 @@ def match_universal(
         if use_fast:
             log_progress("[Fast] 대용량 고속 매칭 모드 적용...", 55)
 
-            sep = "||"
             df_b = df_b.copy()
-            df_t = df_t.copy()
 
             # preserve original order
             df_b["_idx"] = df_b.index
-            # Breakthrough: Vectorized key concatenation for 1M rows (Avoids slow axis=1 agg)
-            df_b["_key"] = df_b[key_cols[0]].astype(str)
-            df_t["_key"] = df_t[key_cols[0]].astype(str)
-            for i in range(1, len(key_cols)):
-                df_b["_key"] += sep + df_b[key_cols[i]].astype(str)
-                df_t["_key"] += sep + df_t[key_cols[i]].astype(str)
 
-            # one-to-one for mapping
-            df_t = df_t.drop_duplicates(subset="_key", keep="first")
+            # options["key_mode"]: "auto" (default) joins through the prepared (cached) target key
+            # index, or shared int codes ("factorize") when there is none; "hash" (opt-in only)
+            # joins on uint64 row hashes and verifies the candidates' key values - measured no
+            # faster than the int codes, so auto never picks it
+            key_mode = options.get("key_mode", "auto")
+            if key_mode == "auto":
+                key_mode = "index" if prepared["key_index"] is not None else "factorize"
 
-            # build mapping series per take col (fast)
-            mapping = {col: pd.Series(df_t[col].values, index=df_t["_key"]) for col in take_cols}
+            # one lookup for all columns: base row -> target row position
+            log_progress(f"데이터 매칭 생성 중... ({len(take_cols)}개 컬럼)", 60)
+            if key_mode == "index" and prepared["key_index"] is not None:
+                pos = prepared["key_index"].positions_for(df_b)
+            elif key_mode == "hash":
+                pos = _hash_row_indexer(df_b, df_t, key_cols)
+            else:
+                b_codes, t_codes = _factorize_keys(df_b, df_t, key_cols)
+                pos = _row_indexer(b_codes, t_codes)
+            if cancel_check(): raise InterruptedError()
 
-            res = pd.DataFrame(index=df_b.index)
-            
-            # Progress for columns
-            total_cols = len(take_cols)
-            for i, col in enumerate(take_cols):
-                if cancel_check(): raise InterruptedError()
-                # 60% to 90%
-                prog_val = 60 + int((i / total_cols) * 30)
-                log_progress(f"데이터 매칭 생성 중... ({col})", prog_val)
-                res[col] = df_b["_key"].map(mapping[col]).fillna("")
+            res = _take_columns(df_t, take_cols, pos, index=df_b.index)
 
             log_progress("결과 병합 중...", 90)
             
@@ -458,87 +1135,108 @@ def match_universal(
             take_cols = take_cols_working
             
             log_progress("매칭 완료, 데이터 정리 중...", 90)
-    else: # Fuzzy matching (single key only, already checked)
-        k = key_cols[0]
+    else: # Fuzzy matching on fuzzy_key, exact blocks on the other keys
+        k = fuzzy_key
+        block_cols = [c for c in key_cols if c != k]
         log_progress(f"Fuzzy 매칭 중... (키: {k})", 50)
-        
-        # Prepare data
-        # Base keys (allow duplicates in base, we iterate unique for speed then map back)
-        b_series = df_b[k].astype(str)
-        b_uniques = b_series.unique()
-        
+        if block_cols:
+            log_progress(f"[Fuzzy] 정확히 일치해야 하는 키: {', '.join(block_cols)}", 50)
+
         # Target keys (deduplicated for lookup)
-        # We need a map from t_key -> t_row_data
-        df_t = df_t.drop_duplicates(subset=[k])
-        t_keys = df_t[k].astype(str).tolist()
-        
-        # We'll build a mapping: base_val -> target_val
-        # using rapidfuzz if available
-        key_map = {}
-        
-        if RAPIDFUZZ_AVAILABLE:
-            from rapidfuzz import process, fuzz
-            total_u = len(b_uniques)
-            
-            for i, b_val in enumerate(b_uniques):
-                if i % 100 == 0:
-                    if cancel_check(): raise InterruptedError()
-                    # Progress 50% -> 90%
-                    prog = 50 + int((i / total_u) * 40)
-                    log_progress(f"Fuzzy 정밀 분석 중... ({i}/{total_u})", prog)
-                
-                # Check exact first
-                if b_val in t_keys:
-                    key_map[b_val] = b_val
-                    continue
-                    
-                # Fuzzy check
-                # score_cutoff=80 (default in typical utils)
-                match = process.extractOne(b_val, t_keys, scorer=fuzz.token_sort_ratio, score_cutoff=80)
-                if match:
-                    res_key, score, _ = match
-                    key_map[b_val] = res_key
+        df_t = df_t.drop_duplicates(subset=key_cols)
+        # block code per row: equal codes <=> all other keys equal
+        if block_cols:
+            b_blk, t_blk = _factorize_keys(df_b, df_t, block_cols)
         else:
-            log_progress("[WARN] rapidfuzz 모듈 없음. 정확한 일치만 수행합니다.")
-            # Fallback exact
-            exact_set = set(t_keys)
-            for b_val in b_uniques:
-                if b_val in exact_set:
-                    key_map[b_val] = b_val
+            b_blk, t_blk = np.zeros(len(df_b), dtype=np.int64), np.zeros(len(df_t), dtype=np.int64)
+
+        # Base keys (allow duplicates in base, we iterate unique (block, key) pairs then map back)
+        b_series = df_b[k].astype(str)
+        b_codes, b_uniques = pd.MultiIndex.from_arrays([b_blk, b_series]).factorize()
+        t_keys = df_t[k].astype(str).tolist()
+
+        # join key (target key) per unique base pair, None = no match
+        # options["fuzzy_cache"]: reuse fuzzy results of earlier runs against the same target keys
+        # options["fuzzy_top_k"]: keep that many candidates per key down to options["fuzzy_review_cutoff"]
+        # and write them to a review sheet; a later run with another options["fuzzy_threshold"]
+        # re-applies it to the cached candidates without scoring again
+        threshold = float(options.get("fuzzy_threshold") or 80)
+        top_k = int(options.get("fuzzy_top_k") or 0)
+        b_join, b_cands = _fuzzy_join_keys(
+            b_uniques.get_level_values(0).to_numpy(), b_uniques.get_level_values(1).tolist(),
+            t_blk, t_keys, use_jamo, log_progress, cancel_check,
+            bool(options.get("fuzzy_cache", True)), options.get("fuzzy_cache_max_bytes"), fuzzy_processes,
+            threshold, max(top_k, 1), float(options.get("fuzzy_review_cutoff") or 60) if top_k else None)
+        if top_k:
+            review = _fuzzy_review(df_b, b_codes, b_uniques.get_level_values(1), b_cands, b_join, block_cols, k)
 
         # Apply mapping to create a join key
         log_progress("매칭 결과 병합 중...", 90)
-        df_b['_join_key'] = df_b[k].astype(str).map(key_map)
-        
-        # Prevent "ValueError: You are trying to merge on float64 and object columns"
-        # If map returns all NaNs (no matches), pandas infers float64. Target key is object (str).
-        df_b['_join_key'] = df_b['_join_key'].astype(object)
-        
+        # object dtype: with no matches at all the column would otherwise be float64
+        df_b['_join_key'] = np.asarray(b_join, dtype=object)[b_codes]
+        df_b['_blk'] = b_blk
+        df_t = df_t.assign(_blk=t_blk)
+
         # Merge
-        joined = pd.merge(df_b, df_t, left_on='_join_key', right_on=k, how='left', suffixes=('', '_tgt'))
+        joined = pd.merge(df_b, df_t, left_on=['_blk', '_join_key'], right_on=['_blk', k], how='left',
+                          suffixes=('', '_tgt'))
         
         # Cleanup
-        if '_join_key' in joined.columns:
-            joined.drop(columns=['_join_key'], inplace=True)
+        joined.drop(columns=[c for c in ('_join_key', '_blk') if c in joined.columns], inplace=True)
         # Handle key collision in columns (if k is in both, merge might rename)
         # We want to keep base key as primary?
         # Typically we keep Base Key. Target Key is redundant if matched.
 
 
     # Finalize and Save
-    return _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir, log_progress, df_t)
+    return _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir, log_progress, df_t, review)
 
-def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir, log_progress, df_t=None):
-    import pandas as pd
-    import os
-    import datetime
+
+def _fuzzy_review(df_b, b_codes, b_keys, candidates, join, block_cols, k) -> pd.DataFrame:
+    """One row per fuzzy candidate of every scored base key (keys without any candidate get one empty row)."""
+    import numpy as np
+
+    # first base row of every unique (block, key) pair, for the block key values
+    _, first = np.unique(b_codes, return_index=True)
+    rows, cols = [], {c: [] for c in block_cols + [k, "순위", "후보 키", "유사도", "채택"]}
+    for u, cands in enumerate(candidates):
+        if cands is None:
+            continue
+        for rank, (choice, score) in enumerate(cands or [("", None)], 1):
+            rows.append(first[u])
+            cols[k].append(b_keys[u])
+            cols["순위"].append(rank if score is not None else "")
+            cols["후보 키"].append(choice)
+            cols["유사도"].append(round(score, 1) if score is not None else "")
+            cols["채택"].append("O" if rank == 1 and join[u] is not None else "")
+    for c in block_cols:
+        cols[c] = df_b[c].to_numpy()[rows] if rows else []
+    return pd.DataFrame(cols)
+
+
+def _format_output(joined, base_cols, take_cols, log_progress, keep_types=False):
+    """Select output columns, fill blanks, format values and sanitize headers.
+
+    keep_types=True (columnar output) leaves typed-load columns (numbers, dates) as they
+    are, with missing values kept; only text columns are filled and formatted.
+    """
     from utils import apply_expert_format, remove_illegal_chars
-    from open_excel import write_to_open_excel
 
     # select / fill
-    # Convert Categorical columns back to objects for safe filling and formatting
-    for c in joined.select_dtypes(include=['category']).columns:
-        joined[c] = joined[c].astype(object)
+    # Categorical and string columns stay compact (a "" category is added for filling);
+    # other typed-load columns become text
+    typed = set()
+    for c in joined.columns[joined.dtypes != object]:
+        s = joined[c]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            if "" not in s.cat.categories:
+                joined[c] = s.cat.add_categories([""])
+        elif isinstance(s.dtype, pd.StringDtype):
+            continue
+        elif keep_types:
+            typed.add(c)
+        else:
+            joined[c] = _as_text(s)
         
     final_cols = []
     seen = set()
@@ -551,39 +1249,85 @@ def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir,
     for c in final_cols:
         if c not in joined.columns:
             joined[c] = ""
-    joined = joined[final_cols].fillna("")
+    text_cols = [c for c in final_cols if c not in typed]
+    joined = joined[final_cols]
+    if typed:
+        joined = joined.copy(deep=False)
+        joined[text_cols] = joined[text_cols].fillna("")
+    else:
+        joined = joined.fillna("")
 
     # formatting (All columns) - Breakthrough: Low Cardinality Mapping
     num_cols = len(final_cols)
     for i, c in enumerate(final_cols):
         if i % 5 == 0:
              log_progress(f"데이터 정규화/포맷팅 중 ({i}/{num_cols})...", 90 + int((i/num_cols)*4))
-        joined[c] = apply_expert_format(joined[c], c)
+        if c not in typed:
+            joined[c] = apply_expert_format(joined[c], c)
 
     log_progress("파일 헤더 정리 중...", 94)
     joined.columns = [remove_illegal_chars(str(c)) for c in joined.columns]
+    return joined
+
+
+def _match_mask(joined, take_cols):
+    """Rows where any take column is non-empty (vectorized)."""
+    from utils import remove_illegal_chars
+
+    mask_match = pd.Series(False, index=joined.index)
+    for c in take_cols:
+         sanitized_c = remove_illegal_chars(str(c))
+         if sanitized_c in joined.columns:
+              s = joined[sanitized_c]
+              if s.dtype == object:
+                   mask_match |= (s.astype(str).str.len() > 0)
+              elif isinstance(s.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+                   mask_match |= (s != "").to_numpy(dtype=bool, na_value=False)
+              else:
+                   # typed column kept for columnar output: missing = not matched
+                   mask_match |= s.notna().to_numpy()
+    return mask_match
+
+
+def _output_format(options):
+    """options["output_format"]: "xlsx" (default), "csv", or columnar "parquet" / "feather"."""
+    out_format = str(options.get("output_format") or "xlsx").lower().lstrip(".")
+    if out_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {out_format} ({', '.join(OUTPUT_FORMATS)})")
+    return out_format
+
+
+def _result_path(base_config, out_dir, ext):
+    os.makedirs(out_dir, exist_ok=True)
+    suffix = base_config["path"] if base_config.get("type") == "file" else base_config.get("book", "base")
+    safe = os.path.basename(str(suffix)).split(".")[0]
+    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(out_dir, f"result_{safe}_{ts}{ext}")
+
+
+def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir, log_progress, df_t=None,
+                    review=None):
+    import pandas as pd
+    import os
+    import datetime
+    from utils import apply_expert_format, remove_illegal_chars
+    from open_excel import write_to_open_excel
+
+    # options["output_format"]: "xlsx" (default, streamed - any size, extra sheets past
+    # Excel's row limit), "csv", or columnar "parquet" / "feather" (dtypes kept, see write_columnar)
+    out_format = _output_format(options)
+    save_as_csv = out_format == "csv"
+    columnar = out_format in ("parquet", "feather")
+
+    joined = _format_output(joined, base_cols, take_cols, log_progress, keep_types=columnar)
     
     total = len(joined)
-    save_as_csv = total > 50000
-
-    # Sanitize entire dataframe ONLY if saving to Excel (openpyxl/xlsxwriter requirement)
-    if not save_as_csv:
-        log_progress("데이터 저장 준비 중 (Excel 특수문자 제거)...", 95)
-        _debug_log("Sanitizing data for Excel...")
-        for col in joined.select_dtypes(include=['object']).columns:
-            joined[col] = joined[col].map(remove_illegal_chars)
-    else:
-        log_progress("대량 데이터 모드: 특수문자 제거 건너뜀 (CSV)...", 95)
 
+    # characters Excel refuses are removed by the xlsx writer itself (once per distinct
+    # value, see excel_io._xlsx_column_cells); CSV / Parquet / Feather keep the text as is
     if total:
         # vectorized matched count: any non-empty in take_cols
-        import numpy as np
-        # ... (rest of matching logic)
-        mask_match = pd.Series(False, index=joined.index)
-        for c in take_cols:
-             sanitized_c = remove_illegal_chars(str(c))
-             if sanitized_c in joined.columns:
-                  mask_match |= (joined[sanitized_c].astype(str).str.len() > 0)
+        mask_match = _match_mask(joined, take_cols)
         matched = int(mask_match.sum())
 
         # Save Condition: Match Only
@@ -600,14 +1344,11 @@ def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir,
     _debug_log(f"Matched: {matched}/{total}")
     rate = (matched / total * 100.0) if total else 0.0
     summary = f"[SUCCESS] 총 {total:,}건 중 {matched:,}건 매칭 성공 ({rate:.1f}%)\n[FAIL] 실패: {total - matched:,}건"
+    if review is not None:
+        where = "검토 시트: fuzzy_review" if out_format == "xlsx" else f"검토 파일: *_review.{out_format}"
+        summary += f"\n[REVIEW] 유사 후보 {len(review):,}건 ({where})"
 
-    os.makedirs(out_dir, exist_ok=True)
-    suffix = base_config["path"] if base_config.get("type") == "file" else base_config.get("book", "base")
-    safe = os.path.basename(str(suffix)).split(".")[0]
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    ext = ".csv" if save_as_csv else ".xlsx"
-    out_path = os.path.join(out_dir, f"result_{safe}_{ts}{ext}")
+    out_path = _result_path(base_config, out_dir, f".{out_format}")
     
     log_progress(f"최종 결과 저장 중: {os.path.basename(out_path)}", 97)
     _debug_log(f"Saving start: {out_path}")
@@ -615,15 +1356,20 @@ def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir,
     try:
         if save_as_csv:
             joined.to_csv(out_path, index=False, encoding="utf-8-sig")
+            if review is not None:
+                review.to_csv(f"{os.path.splitext(out_path)[0]}_review.csv", index=False, encoding="utf-8-sig")
+        elif columnar:
+            # row groups / record batches of COLUMNAR_CHUNK_ROWS, memory-mappable (feather)
+            write_columnar(out_path, joined, out_format)
+            if review is not None:
+                write_columnar(f"{os.path.splitext(out_path)[0]}_review.{out_format}", review, out_format)
         else:
-            try:
-                import xlsxwriter
-                with pd.ExcelWriter(out_path, engine='xlsxwriter', engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
-                    joined.to_excel(writer, sheet_name="matched", index=False)
-                    worksheet = writer.sheets['matched']
-                    worksheet.freeze_panes(1, 0)
-            except:
-                joined.to_excel(out_path, sheet_name="matched", index=False)
+            # sheet XML is streamed chunk by chunk (excel_io.write_xlsx_stream), frozen header row
+            sheets = [("matched", joined)] + ([("fuzzy_review", review)] if review is not None else [])
+            written = write_xlsx_stream(out_path, sheets)
+            n_matched = sum(1 for name in written if name.startswith("matched"))
+            if n_matched > 1:
+                log_progress(f"[알림] 엑셀 행 제한(1,048,576행)으로 결과를 {n_matched}개 시트에 나누어 저장했습니다.", 98)
         
         _debug_log("Final Save Logic Completed.")
 
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import pandas as pd
+from matcher import match_universal
+
+
+def _make_files(tmp):
+    base = pd.DataFrame({"ID": ["1", "2", "3", "4", "5"], "Name": ["a", "b", "c", "d", "e"]})
+    base.to_csv(os.path.join(tmp, "base.csv"), index=False, encoding="utf-8-sig")
+    targets = [
+        pd.DataFrame({"ID": ["1", "2", "2"], "Grade": ["A", "B", "X"]}),
+        pd.DataFrame({"Code": ["1"], "Grade": ["Z"]}),                      # no key column -> skipped
+        pd.DataFrame({"ID": [str(i) for i in range(3, 3000)], "Grade": ["C"] * 2997}),
+        pd.DataFrame({"ID": ["5"], "Grade": ["E"], "Extra": ["e5"]}),
+    ]
+    files = []
+    for i, df in enumerate(targets):
+        path = os.path.join(tmp, f"t{i}.csv")
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+        files.append({"path": path, "sheet": "CSV", "header": 1})
+    b_cfg = {"type": "file", "path": os.path.join(tmp, "base.csv"), "sheet": "CSV", "header": 1}
+    return b_cfg, {"type": "file", "files": files}
+
+
+def _run(b_cfg, t_cfg, out_dir, options):
+    out, summary, _ = match_universal(b_cfg, t_cfg, ["ID"], [], out_dir, options, None, {})
+    return pd.read_excel(out, dtype=str, keep_default_na=False)
+
+
+def test_batch_file_order():
+    print("\n--- Batch Match (file order) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        df = _run(b_cfg, t_cfg, os.path.join(tmp, "out4"), {"batch_workers": 4})
+        print(df)
+        assert list(df.columns) == ["ID", "Name", "Grade", "Grade_3", "Grade_4", "Extra"]
+        assert df["Grade"].tolist() == ["A", "B", "", "", ""]
+        assert df["Grade_3"].tolist() == ["", "", "C", "C", "C"]
+        assert df["Grade_4"].tolist() == ["", "", "", "", "E"]
+        serial = _run(b_cfg, t_cfg, os.path.join(tmp, "out1"), {"batch_workers": 1})
+        assert serial.equals(df)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Concurrent loading keeps the file order.")
+
+
+def test_batch_cancel():
+    print("\n--- Batch Match (cancel) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        calls = {"n": 0}
+
+        def cancel_check():
+            calls["n"] += 1
+            return calls["n"] > 3
+
+        try:
+            match_universal(b_cfg, t_cfg, ["ID"], [], os.path.join(tmp, "out"), {}, None, {},
+                            cancel_check=cancel_check)
+        except InterruptedError:
+            print("PASS: Cancelled while loading target files.")
+        else:
+            raise AssertionError("cancel_check was ignored")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_batch_compact_fetch_cols():
+    print("\n--- Batch Match (compact columns, fetch_cols) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        files = t_cfg["files"]
+        files[1]["fetch_cols"] = ["Grade"]                          # still no key column -> skipped
+        files[3]["fetch_cols"] = ["Extra", "Missing"]               # Grade not fetched, Missing not in file
+        compact = _run(b_cfg, t_cfg, os.path.join(tmp, "compact"), {})
+        plain = _run(b_cfg, t_cfg, os.path.join(tmp, "plain"), {"batch_compact": False})
+        assert list(compact.columns) == ["ID", "Name", "Grade", "Grade_3", "Extra"]
+        assert compact["Extra"].tolist() == ["", "", "", "", "e5"]
+        assert compact.equals(plain)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Compact batch columns give the same output.")
+
+
+def test_batch_replacements_on_filtered_base():
+    print("\n--- Batch Match (filtered base, replacement rules) ---")
+    import warnings
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        filters = {"base": {"col": "Name", "op": "==", "keyword": "b"}}
+        for pushdown in (True, False):
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", pd.errors.SettingWithCopyWarning)
+                out, _, _ = match_universal(b_cfg, t_cfg, ["ID"], [], os.path.join(tmp, f"out{pushdown}"),
+                                            {"filter_pushdown": pushdown}, {"Name": {"b": "B"}}, filters)
+            df = pd.read_excel(out, dtype=str, keep_default_na=False)
+            assert df["Name"].tolist() == ["B"] and df["Grade"].tolist() == ["B"]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Replacements applied without writing into the base frame.")
+
+
+if __name__ == "__main__":
+    test_batch_file_order()
+    test_batch_cancel()
+    test_batch_compact_fetch_cols()
+    test_batch_replacements_on_filtered_base()
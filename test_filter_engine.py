@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+from filter_engine import CompiledFilters, apply_filters
+
+DF = pd.DataFrame({
+    "지역": ["서울", "부산", "", " nan", "서울", None],
+    "Amt": ["10", "5", "x", "20", "", "7"],
+})
+
+
+def _rows(df, f_list):
+    return apply_filters(df, f_list).index.tolist()
+
+
+def test_operators():
+    print("\n--- Filter Engine Operators ---")
+    assert _rows(DF, [{"col": "지역", "op": "==", "keyword": "서울"}]) == [0, 4]
+    assert _rows(DF, [{"col": "지역", "op": "==", "keyword": "(값 있음)"}]) == [0, 1, 4]
+    assert _rows(DF, [{"col": "지역", "op": "Not Exist", "keyword": "x"}]) == [2, 3, 5]
+    assert _rows(DF, [{"col": "Amt", "op": ">=", "keyword": "7"}]) == [0, 3, 5]
+    assert _rows(DF, [{"col": "지역", "values": ["부산", "서울"]}]) == [0, 1, 4]
+    # AND of several predicates, one slice
+    assert _rows(DF, [{"col": "지역", "op": "==", "keyword": "서울"}, {"col": "Amt", "op": "<", "keyword": "100"}]) == [0]
+    print("PASS: Operators correct.")
+
+
+def test_skipped_filters():
+    print("\n--- Filter Engine Skips ---")
+    everything = list(range(len(DF)))
+    assert _rows(DF, [{"col": "없는컬럼", "op": "==", "keyword": "a"}]) == everything
+    assert _rows(DF, [{"col": "지역", "op": "==", "keyword": "(값 선택)"}]) == everything
+    assert _rows(DF, [{"col": "Amt", "op": ">", "keyword": "abc"}]) == everything
+    print("PASS: Inactive / invalid filters skipped.")
+
+
+def test_compact_columns():
+    print("\n--- Filter Engine on Compact Columns ---")
+    f_list = [{"col": "지역", "op": "==", "keyword": "(값 있음)"}, {"col": "Amt", "op": ">", "keyword": "6"}]
+    plain = CompiledFilters(f_list).mask(DF)
+    compact = DF.astype({"지역": "category", "Amt": "string[pyarrow]"})
+    assert np.array_equal(CompiledFilters(f_list).mask(compact), plain)
+    print("PASS: Categorical / arrow columns give the same mask.")
+
+
+def test_xlsx_pushdown_keys():
+    print("\n--- Filter Pushdown on xlsx Key Columns ---")
+    import os, shutil, tempfile, openpyxl
+    from excel_io import read_table_file
+    tmp = tempfile.mkdtemp()
+    try:
+        # read_excel turns the text "00002" into 2 and the booleans into 1.0/0.0 (NaN in the column)
+        path = os.path.join(tmp, "keys.xlsx")
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["사번", "재직", "구분"])
+        for row in [("00002", True, "A"), ("00013", False, "B"), ("00007", None, "A"), ("00000", True, "A")]:
+            ws.append(list(row))
+        wb.save(path)
+        filters = CompiledFilters([{"col": "구분", "op": "==", "keyword": "A"}])
+
+        full = read_table_file(path, 0, 1, None, use_cache=False)
+        after = full[filters.mask(full)]
+        assert after["사번"].tolist() == ["2", "7", "0"] and after["재직"].tolist() == ["1.0", "", "1.0"]
+        # no cache, cold cache (parses and writes the entry), warm cache
+        for use_cache in (False, True, True):
+            pushed = read_table_file(path, 0, 1, None, use_cache=use_cache, filters=filters)
+            assert pushed.equals(after) and pushed.attrs["raw_rows"] == 4
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Filtered sheet reads keep the unfiltered key text.")
+
+
+if __name__ == "__main__":
+    test_operators()
+    test_skipped_filters()
+    test_compact_columns()
+    test_xlsx_pushdown_keys()
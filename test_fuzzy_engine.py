@@ -0,0 +1,318 @@
+import os
+import random
+import shutil
+import tempfile
+import pandas as pd
+import fuzzy_engine
+from fuzzy_engine import best_matches
+from rapidfuzz import process, fuzz
+from matcher import match_universal
+
+
+def _words(rng, n):
+    return ["".join(rng.choice("abcde 김이박") for _ in range(rng.randint(0, 6))) for _ in range(n)]
+
+
+def test_same_as_extract_one():
+    print("\n--- Batched Fuzzy vs extractOne ---")
+    rng = random.Random(3)
+    queries, choices = _words(rng, 200), _words(rng, 150)
+    rows = fuzzy_engine.FUZZY_BLOCK_MAX_ROWS
+    fuzzy_engine.FUZZY_BLOCK_MAX_ROWS = 7  # many small blocks
+    try:
+        for cutoff in (0, 80):
+            pos, scores = best_matches(queries, choices, cutoff)
+            for q, p, sc in zip(queries, pos, scores):
+                m = process.extractOne(q, choices, scorer=fuzz.token_sort_ratio, score_cutoff=cutoff)
+                if m is None:
+                    assert p == -1
+                else:
+                    assert (choices[p], sc) == (m[0], m[1]) and p == m[2]
+    finally:
+        fuzzy_engine.FUZZY_BLOCK_MAX_ROWS = rows
+    print("PASS: Same best choices and scores.")
+
+
+def test_block_progress_and_cancel():
+    print("\n--- Batched Fuzzy Progress / Cancel ---")
+    rows = fuzzy_engine.FUZZY_BLOCK_MAX_ROWS
+    fuzzy_engine.FUZZY_BLOCK_MAX_ROWS = 2
+    try:
+        seen = []
+        best_matches(["a", "b", "c", "d", "e"], ["a", "c"], 80, progress_callback=lambda d, t: seen.append(d))
+        assert seen == [0, 2, 4, 5]
+        calls = {"n": 0}
+
+        def cancel_check():
+            calls["n"] += 1
+            return calls["n"] > 1
+
+        try:
+            best_matches(["a", "b", "c", "d"], ["a"], 80, cancel_check=cancel_check)
+        except InterruptedError:
+            print("PASS: Progress and cancel per block.")
+        else:
+            raise AssertionError("cancel_check was ignored")
+    finally:
+        fuzzy_engine.FUZZY_BLOCK_MAX_ROWS = rows
+
+
+def test_blocking_index():
+    print("\n--- Blocked Fuzzy (large jobs) ---")
+    choices = ["서울특별시 강남구", "부산광역시 해운대구", "대구광역시 수성구", "인천광역시 남동구", "광주광역시 북구", ""]
+    queries = ["서울특별시 강남귀", "해운대구 부산광역시", "대구광역시 수성", "전혀 다른 값", "", "광주광역시 북구"]
+    pairs = fuzzy_engine.FUZZY_DENSE_MAX_PAIRS
+    fuzzy_engine.FUZZY_DENSE_MAX_PAIRS = 0  # force the blocking index
+    try:
+        pos, scores = best_matches(queries, choices, 80)
+    finally:
+        fuzzy_engine.FUZZY_DENSE_MAX_PAIRS = pairs
+    assert pos.tolist() == [0, 1, 2, -1, 5, 4]
+    for q, p, sc in zip(queries, pos, scores):
+        if p >= 0:
+            assert sc == fuzz.token_sort_ratio(q, choices[p])
+    print("PASS: Blocked matches found and scored exactly.")
+
+
+def test_process_pool():
+    print("\n--- Blocked Fuzzy on a Process Pool ---")
+    rng = random.Random(11)
+    choices = list(dict.fromkeys("".join(rng.choice("가나다라마바사아") for _ in range(6)) for _ in range(3000)))
+    queries = [c[:-1] + "자" if rng.random() < 0.5 else c for c in rng.sample(choices, 2500)]
+    saved = fuzzy_engine.FUZZY_DENSE_MAX_PAIRS, fuzzy_engine.FUZZY_POOL_MIN_QUERIES
+    fuzzy_engine.FUZZY_DENSE_MAX_PAIRS, fuzzy_engine.FUZZY_POOL_MIN_QUERIES = 0, 1
+    try:
+        local = best_matches(queries, choices, 80, processes=1)
+        seen = []
+        pooled = best_matches(queries, choices, 80, processes=2, progress_callback=lambda d, t: seen.append(d))
+        assert (local[0] == pooled[0]).all() and (local[1] == pooled[1]).all()
+        # blocks come back in completion order: progress only has to grow to the total
+        assert seen[0] == 0 and seen[-1] == 2500 and seen == sorted(seen) and len(seen) == 4
+        try:
+            best_matches(queries, choices, 80, processes=2, cancel_check=lambda: True)
+        except InterruptedError:
+            pass
+        else:
+            raise AssertionError("cancel_check was ignored")
+    finally:
+        fuzzy_engine.FUZZY_DENSE_MAX_PAIRS, fuzzy_engine.FUZZY_POOL_MIN_QUERIES = saved
+    print("PASS: Pooled blocks equal in-process results; cancel stops the pool.")
+
+
+def test_jamo_matching():
+    print("\n--- Jamo Fuzzy (Korean keys) ---")
+    assert fuzzy_engine.to_jamo(["박희본", "A박"]) == ["ㅂㅏㄱㅎㅢㅂㅗㄴ", "Aㅂㅏㄱ"]
+    assert fuzzy_engine.to_choseong(["박희본", "A박"]) == ["ㅂㅎㅂ", "Aㅂ"]
+    choices = ["박희본", "김철수", "이영희"]
+    queries = ["박회본", "김철스", "최민수"]
+    # one vowel typo costs a whole syllable on plain text, one jamo with jamo=True
+    assert best_matches(queries, choices, 80)[0].tolist() == [-1, -1, -1]
+    pairs = fuzzy_engine.FUZZY_DENSE_MAX_PAIRS
+    try:
+        for dense_pairs in (pairs, 0):  # dense, then the blocking index
+            fuzzy_engine.FUZZY_DENSE_MAX_PAIRS = dense_pairs
+            pos, scores = best_matches(queries, choices, 80, jamo=True)
+            assert pos.tolist() == [0, 1, -1]
+            assert scores[0] == fuzz.token_sort_ratio("ㅂㅏㄱㅎㅚㅂㅗㄴ", "ㅂㅏㄱㅎㅢㅂㅗㄴ")
+    finally:
+        fuzzy_engine.FUZZY_DENSE_MAX_PAIRS = pairs
+    print("PASS: Jamo typos matched (dense and blocked).")
+
+
+def test_fuzzy_mapper():
+    print("\n--- get_fuzzy_mapper ---")
+    from utils import get_fuzzy_mapper
+    base = pd.Series(["홍길동", "김철수", "abcdefghij", None])
+    target = pd.Series(["홍길동", "abcdefghiz", "xyz", "", None, "abcdefghiz"])
+    # exact keys and blanks are left out; the typo maps, "xyz" reaches no base key
+    assert get_fuzzy_mapper(base, target, threshold=85) == {"abcdefghiz": "abcdefghij"}
+    assert get_fuzzy_mapper(base, target, threshold=95) == {}
+    # one vowel apart: too far as syllables, close as jamo
+    assert get_fuzzy_mapper(base, pd.Series(["김칠수"]), threshold=80) == {}
+    assert get_fuzzy_mapper(base, pd.Series(["김칠수"]), threshold=80, jamo=True) == {"김칠수": "김철수"}
+    print("PASS: Mapper follows top_matches (threshold, jamo).")
+
+
+def test_multi_key_fuzzy():
+    print("\n--- Multi-Key Fuzzy (exact blocks) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        base = pd.DataFrame({"사업자번호": ["1", "2", "3", "4"],
+                             "상호": ["주식회사 한빛", "대한상사", "(주)미래전자", "가나물산"]})
+        # 주식회사 한빗 is a typo inside block 1; (주)미래전자 exists only under another 사업자번호
+        target = pd.DataFrame({"사업자번호": ["2", "1", "9", "4"],
+                               "상호": ["대한상사", "주식회사 한빗", "(주)미래전자", "다라물산"],
+                               "업종": ["A", "B", "C", "D"]})
+        cfg = {}
+        for name, df in (("base", base), ("target", target)):
+            df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False, encoding="utf-8-sig")
+            cfg[name] = {"type": "file", "path": os.path.join(tmp, f"{name}.csv"), "sheet": "CSV", "header": 1}
+
+        def run(name, options):
+            messages = []
+            out, _, _ = match_universal(cfg["base"], cfg["target"], ["사업자번호", "상호"], ["업종"], os.path.join(tmp, name),
+                                        options, None, {}, lambda m, v=None: messages.append(m))
+            return pd.read_excel(out, dtype=str, keep_default_na=False), messages
+
+        df, _ = run("fuzzy", {"fuzzy": True, "fuzzy_key": "상호"})
+        assert df["업종"].tolist() == ["B", "A", "", ""]
+        assert df["상호"].tolist() == base["상호"].tolist()
+
+        # without fuzzy_key (the UI default) multi-key jobs stay exact: prepared target, cached
+        for name in ("exact", "exact_warm"):
+            df, messages = run(name, {"fuzzy": True})
+            assert df["업종"].tolist() == ["", "A", "", ""]
+            assert not any("Fuzzy 매칭" in m for m in messages)
+        assert any("[Cache]" in m for m in messages), "default multi-key run left the exact path"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Fuzzy key scored only within its exact-key block; off unless fuzzy_key is set.")
+
+
+def test_single_key_mapper_match():
+    print("\n--- Single-Key Fuzzy (every target key a typo) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        # every target key maps: Series.map keeps the categorical dtype (with other categories)
+        base = pd.DataFrame({"코드": ["abcdefghijkl", "mnopqrstuvwx"], "No": ["1", "2"]})
+        target = pd.DataFrame({"코드": ["abcdefghijkz"], "업종": ["A"]})
+        cfg = {}
+        for name, df in (("base", base), ("target", target)):
+            df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False, encoding="utf-8-sig")
+            cfg[name] = {"type": "file", "path": os.path.join(tmp, f"{name}.csv"), "sheet": "CSV", "header": 1}
+        out, _, _ = match_universal(cfg["base"], cfg["target"], ["코드"], ["업종"], os.path.join(tmp, "out"),
+                                    {"fuzzy": True, "fuzzy_cache": False}, None, {})
+        df = pd.read_excel(out, dtype=str, keep_default_na=False)
+        assert df["업종"].tolist() == ["A", ""]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Typo key joined.")
+
+
+def test_single_key_threshold():
+    print("\n--- Single-Key Fuzzy (configured threshold) ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        base = pd.DataFrame({"코드": ["abcdefghijkl"], "No": ["1"]})
+        target = pd.DataFrame({"코드": ["abcdefghijkz"], "업종": ["A"]})  # scores 91.7
+        cfg = {}
+        for name, df in (("base", base), ("target", target)):
+            df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False, encoding="utf-8-sig")
+            cfg[name] = {"type": "file", "path": os.path.join(tmp, f"{name}.csv"), "sheet": "CSV", "header": 1}
+
+        def run(name, **opts):
+            options = {"fuzzy": True, "fuzzy_cache": False, **opts}
+            out, _, _ = match_universal(cfg["base"], cfg["target"], ["코드"], ["업종"], os.path.join(tmp, name),
+                                        options, None, {})
+            return pd.read_excel(out, sheet_name=None, dtype=str, keep_default_na=False)
+
+        assert run("t90", fuzzy_threshold=90)["matched"]["업종"].tolist() == ["A"]
+        assert run("t95", fuzzy_threshold=95)["matched"]["업종"].tolist() == [""]
+        sheets = run("review", fuzzy_threshold=95, fuzzy_top_k=3)
+        assert sheets["matched"]["업종"].tolist() == [""]
+        review = sheets["fuzzy_review"]
+        assert review["후보 키"].tolist() == ["abcdefghijkz"] and review["채택"].tolist() == [""]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Key correction follows fuzzy_threshold; review sheet keeps the candidate.")
+
+
+def test_fuzzy_cache_warm_run():
+    print("\n--- Fuzzy Match Cache ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        # the cache starts empty (conftest.py), so the first run is always cold
+        rng = random.Random(5)
+        names = ["".join(rng.choice("가나다라마바사아자차") for _ in range(8)) for _ in range(30)]
+        base = pd.DataFrame({"No": range(30), "상호": [n[:-1] + "카" for n in names[:20]] + names[20:]})
+        target = pd.DataFrame({"상호": names, "업종": [str(i) for i in range(30)]})
+        cfg = {}
+        for name, df in (("base", base), ("target", target)):
+            df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False, encoding="utf-8-sig")
+            cfg[name] = {"type": "file", "path": os.path.join(tmp, f"{name}.csv"), "sheet": "CSV", "header": 1}
+
+        def run(name):
+            messages = []
+            out, _, _ = match_universal(cfg["base"], cfg["target"], ["상호"], ["업종"], os.path.join(tmp, name),
+                                        {"fuzzy": True}, None, {}, lambda m, v=None: messages.append(m))
+            return pd.read_excel(out, dtype=str, keep_default_na=False), messages
+
+        cold, cold_msgs = run("cold")
+        warm, warm_msgs = run("warm")
+        assert not any("이전에 분석한" in m for m in cold_msgs)
+        assert any("이전에 분석한 유사 키 20건" in m for m in warm_msgs)
+        assert not any("정밀 분석 중" in m for m in warm_msgs)
+        assert cold["업종"].tolist() == warm["업종"].tolist() == [str(i) for i in range(30)]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Warm run reused cached fuzzy matches.")
+
+
+def test_fuzzy_review_and_threshold():
+    print("\n--- Fuzzy Review Sheet / Threshold Re-apply ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        rng = random.Random(7)
+        names = ["".join(rng.choice("가나다라마바사아자차") for _ in range(8)) for _ in range(30)]
+        base = pd.DataFrame({"No": range(30), "상호": [n[:-1] + "카" for n in names[:20]] + names[20:]})
+        target = pd.DataFrame({"상호": names, "업종": [str(i) for i in range(30)]})
+        cfg = {}
+        for name, df in (("base", base), ("target", target)):
+            df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False, encoding="utf-8-sig")
+            cfg[name] = {"type": "file", "path": os.path.join(tmp, f"{name}.csv"), "sheet": "CSV", "header": 1}
+
+        def run(name, threshold):
+            messages = []
+            options = {"fuzzy": True, "fuzzy_top_k": 3, "fuzzy_threshold": threshold}
+            out, summary, _ = match_universal(cfg["base"], cfg["target"], ["상호"], ["업종"], os.path.join(tmp, name),
+                                              options, None, {}, lambda m, v=None: messages.append(m))
+            sheets = pd.read_excel(out, sheet_name=None, dtype=str, keep_default_na=False)
+            return sheets, messages
+
+        sheets, _ = run("t80", 80)
+        review = sheets["fuzzy_review"]
+        assert list(review.columns) == ["상호", "순위", "후보 키", "유사도", "채택"]
+        top = review[review["순위"] == "1"]
+        assert len(top) == 20 and (top["채택"] == "O").all()
+        assert top["후보 키"].tolist() == names[:20] and (top["유사도"] == "87.5").all()
+        assert sheets["matched"]["업종"].ne("").sum() == 30
+
+        sheets, messages = run("t90", 90)
+        assert not any("정밀 분석 중" in m for m in messages), "threshold change re-scored the keys"
+        assert sheets["matched"]["업종"].tolist() == [""] * 20 + [str(i) for i in range(20, 30)]
+        assert (sheets["fuzzy_review"]["채택"] == "").all()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Review sheet written; new threshold applied to cached candidates.")
+
+
+def test_fuzzy_cache_budget():
+    print("\n--- Fuzzy Match Cache Budget ---")
+    from fuzzy_engine import MatchCache
+    max_bytes = 40_000  # one file may use half of it
+    cache = MatchCache("budget-test", max_bytes=max_bytes)
+    for i in range(3000):
+        cache.add(f"키{i}", (f"후보{i}", 90.0))
+    assert cache.get("키0") == ("후보0", 90.0)  # now the most recently used entry
+    cache.save()
+    assert os.path.exists(cache.path), "cache over budget was evicted whole"
+    assert os.path.getsize(cache.path) <= max_bytes * fuzzy_engine.FUZZY_CACHE_FILE_SHARE
+    reloaded = MatchCache("budget-test", max_bytes=max_bytes)
+    assert 0 < len(reloaded) < 3000
+    assert reloaded.get("키0") is not None and reloaded.get("키2999") is not None and reloaded.get("키1") is None
+    print(f"PASS: Cache trimmed to {len(reloaded)} most recently used entries, not lost.")
+
+
+if __name__ == "__main__":
+    test_same_as_extract_one()
+    test_block_progress_and_cancel()
+    test_blocking_index()
+    test_process_pool()
+    test_jamo_matching()
+    test_fuzzy_mapper()
+    test_multi_key_fuzzy()
+    test_single_key_mapper_match()
+    test_single_key_threshold()
+    test_fuzzy_cache_warm_run()
+    test_fuzzy_review_and_threshold()
+    test_fuzzy_cache_budget()
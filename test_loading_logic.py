@@ -61,16 +61,296 @@ def test_column_loading():
     else:
         print("FAIL: Columns mismatch.")
 
+def test_parse_cache():
+    print("\n--- Testing Parse Cache ---")
+    from excel_io import read_table_file, _parse_cache_path, PYARROW_AVAILABLE
+    if not PYARROW_AVAILABLE:
+        print("SKIP: pyarrow not installed.")
+        return
+    path = os.path.abspath("test_cache.csv")
+    try:
+        pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", None]}).to_csv(path, index=False)
+        first = read_table_file(path, "CSV", 1, ["B", "A"])
+        cache_path = _parse_cache_path(path, "CSV", 1)
+        start = time.time()
+        second = read_table_file(path, "CSV", 1, ["B", "A", "Missing"])
+        duration = time.time() - start
+        print(f"[CSV] Cached read: {second.values.tolist()} (Time: {duration:.4f}s)")
+        assert os.path.exists(cache_path)
+        assert second[["B", "A"]].values.tolist() == first.values.tolist() == [["x", "1"], ["y", "2"], ["", "3"]]
+        assert second["Missing"].tolist() == ["", "", ""]
+
+        # Modifying the file must invalidate the cached parse
+        time.sleep(0.01)
+        pd.DataFrame({"A": [7], "B": ["z"]}).to_csv(path, index=False)
+        third = read_table_file(path, "CSV", 1, None)
+        assert third.values.tolist() == [["7", "z"]]
+        print("PASS: Parse cache hit and invalidation correct.")
+    finally:
+        if os.path.exists(path): os.remove(path)
+
+def test_column_projection():
+    print("\n--- Testing Column Projection ---")
+    from excel_io import read_table_file, _parse_cache_path, PYARROW_AVAILABLE
+    path = os.path.abspath("test_projection.csv")
+    try:
+        pd.DataFrame({"A": [1, 2], "B": ["x", "y"], "C": ["p", None]}).to_csv(path, index=False)
+        full = read_table_file(path, "CSV", 1, None, use_cache=False)
+        narrow = read_table_file(path, "CSV", 1, ["C", "A"])
+        assert narrow.values.tolist() == full[["C", "A"]].values.tolist() == [["p", "1"], ["", "2"]]
+        if PYARROW_AVAILABLE:
+            import pyarrow.feather as feather
+            cache_path = _parse_cache_path(path, "CSV", 1)
+            assert sorted(feather.read_table(cache_path).column_names) == ["A", "C"]
+            # a wider read extends the cached entry instead of replacing it
+            read_table_file(path, "CSV", 1, ["B"])
+            assert sorted(feather.read_table(cache_path).column_names) == ["A", "B", "C"]
+        again = read_table_file(path, "CSV", 1, None)
+        assert again.values.tolist() == full.values.tolist()
+        print("PASS: Only requested columns parsed; cache entries merged.")
+    finally:
+        if os.path.exists(path): os.remove(path)
+
+def test_typed_loading():
+    print("\n--- Testing Typed Loading ---")
+    from excel_io import read_table_file
+    path = os.path.abspath("test_typed.csv")
+    try:
+        pd.DataFrame({"ID": ["1", "2", None], "Name": ["x", None, "z"], "Rate": [0.5, None, 2.0]}).to_csv(path, index=False)
+        for use_cache in (False, True, True):
+            df = read_table_file(path, "CSV", 1, None, use_cache=use_cache, typed=True)
+            assert str(df["ID"].dtype) == "Int64" and str(df["Rate"].dtype) == "Float64"
+            assert df["Name"].isna().tolist() == [False, True, False]
+        text = read_table_file(path, "CSV", 1, None)
+        assert text["Name"].tolist() == ["x", "", "z"]
+        print("PASS: Native dtypes and NA masks kept (cold and cached).")
+    finally:
+        if os.path.exists(path): os.remove(path)
+
+def test_compact_strings():
+    print("\n--- Testing Compact Strings ---")
+    from excel_io import read_table_file
+    from matcher import match_universal
+    import tempfile, shutil
+    tmp = tempfile.mkdtemp()
+    try:
+        base = os.path.join(tmp, "base.csv")
+        target = os.path.join(tmp, "target.csv")
+        pd.DataFrame({"ID": [str(i) for i in range(8)], "부서": ["영업", "인사"] * 4}).to_csv(base, index=False)
+        pd.DataFrame({"ID": ["1", "3", "5"], "지역": ["서울", "부산", "서울"]}).to_csv(target, index=False)
+        for use_cache in (False, True, True):
+            df = read_table_file(base, "CSV", 1, None, use_cache=use_cache, compact=True)
+            assert str(df["부서"].dtype) == "category" and isinstance(df["ID"].dtype, pd.StringDtype)
+            assert df["부서"].tolist() == ["영업", "인사"] * 4
+
+        results = []
+        for compact in (False, True):
+            out, summary, _ = match_universal(
+                {"type": "file", "path": base, "sheet": "CSV", "header": 1},
+                {"type": "file", "path": target, "sheet": "CSV", "header": 1},
+                ["ID"], ["지역"], os.path.join(tmp, f"out{compact}"), {"compact_strings": compact}, None, {})
+            results.append((pd.read_excel(out, dtype=str, keep_default_na=False).values.tolist(), summary))
+        assert results[0] == results[1]
+        print("PASS: Compact columns load and match like plain text.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def test_filter_pushdown():
+    print("\n--- Testing Filter Pushdown ---")
+    import excel_io, tempfile, shutil
+    from excel_io import read_table_file
+    from filter_engine import CompiledFilters
+    tmp = tempfile.mkdtemp()
+    chunk_rows = excel_io.FILTER_CHUNK_ROWS
+    excel_io.FILTER_CHUNK_ROWS = 2
+    try:
+        df = pd.DataFrame({"ID": [str(i) for i in range(7)], "지역": ["서울", "부산", "서울", "", "대구", "서울", "부산"],
+                           "Amt": ["10", "5", "30", "1", "7", "", "2"]})
+        filters = CompiledFilters([{"col": "지역", "op": "==", "keyword": "서울"}, {"col": "Amt", "op": ">", "keyword": "9"}])
+        for name in ("pushdown.csv", "pushdown.xlsx"):
+            path = os.path.join(tmp, name)
+            if name.endswith(".csv"): df.to_csv(path, index=False)
+            else: df.to_excel(path, index=False)
+            sheet = "CSV" if name.endswith(".csv") else 0
+            # cold (chunked read for CSV, whole-sheet parse for xlsx), then filtered on a cached parse
+            cold = read_table_file(path, sheet, 1, ["ID"], filters=filters)
+            read_table_file(path, sheet, 1, None)
+            warm = read_table_file(path, sheet, 1, ["ID"], filters=filters)
+            for got in (cold, warm):
+                assert got.columns.tolist() == ["ID"]
+                assert got["ID"].tolist() == ["0", "2"] and got.index.tolist() == [0, 2]
+                assert got.attrs["raw_rows"] == 7
+        print("PASS: Rows filtered while reading (chunked and cached).")
+    finally:
+        excel_io.FILTER_CHUNK_ROWS = chunk_rows
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def test_filter_pushdown_dtypes():
+    print("\n--- Testing Filter Pushdown (numeric column with a blank) ---")
+    import excel_io, tempfile, shutil
+    from excel_io import read_table_file, _read_filtered
+    from filter_engine import CompiledFilters
+    tmp = tempfile.mkdtemp()
+    chunk_rows = excel_io.FILTER_CHUNK_ROWS
+    excel_io.FILTER_CHUNK_ROWS = 5
+    try:
+        # a full read parses Code as float ('1.0'); chunks without the blank would give '1'
+        df = pd.DataFrame({"ID": range(12), "Code": pd.array([1] * 11 + [None], dtype="Int64")})
+        filters = CompiledFilters([{"col": "Code", "op": "==", "keyword": "1"}])
+        for name in ("blank.csv", "blank.xlsx"):
+            path = os.path.join(tmp, name)
+            if name.endswith(".csv"): df.to_csv(path, index=False)
+            else: df.to_excel(path, index=False)
+            sheet = "CSV" if name.endswith(".csv") else 0
+            full = read_table_file(path, sheet, 1, None, use_cache=False)
+            after = full[filters.mask(full)]
+            pushed = read_table_file(path, sheet, 1, None, use_cache=False, filters=filters)
+            assert pushed.equals(after) and pushed.attrs["raw_rows"] == 12
+            assert _read_filtered(path, sheet, 1, [], filters, lambda: False) is None
+        # stable dtypes are still filtered chunk by chunk
+        path = os.path.join(tmp, "stable.csv")
+        df.fillna(1).astype(int).to_csv(path, index=False)
+        chunked = _read_filtered(path, "CSV", 1, [], filters, lambda: False)
+        assert chunked is not None and len(chunked) == 12
+        print("PASS: Pushdown gives the same rows and values as filtering after load.")
+    finally:
+        excel_io.FILTER_CHUNK_ROWS = chunk_rows
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def test_chunk_encoding():
+    print("\n--- Testing Chunked CSV Encoding ---")
+    import tempfile, shutil
+    from excel_io import iter_table_chunks, read_table_file
+    tmp = tempfile.mkdtemp()
+    try:
+        # ASCII header and first chunks (past the parser's read buffer), cp949 Korean only at the end
+        path = os.path.join(tmp, "cp949.csv")
+        n = 60000
+        df = pd.DataFrame({"ID": [str(i) for i in range(n)], "Name": ["abcdef"] * (n - 2) + ["김철수", "이영희"]})
+        df.to_csv(path, index=False, encoding="cp949")
+        chunks = [c for c, _ in iter_table_chunks(path, "CSV", 1, None, chunk_rows=5000)]
+        got = pd.concat(chunks, ignore_index=True)
+        assert got.equals(read_table_file(path, "CSV", 1, None, use_cache=False))
+        assert got["Name"].tolist()[-2:] == ["김철수", "이영희"]
+        print("PASS: Encoding checked on the whole file, not the first chunk.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def test_header_prescan():
+    print("\n--- Testing Header Prescan ---")
+    import excel_io, tempfile, shutil, openpyxl
+    from excel_io import fast_xlsx_header, prescan_files, cached_header
+    tmp = tempfile.mkdtemp()
+    try:
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "명단"
+        ws["B1"], ws["D1"], ws["A2"], ws["F3"] = " 상호 ", "ID", "x", 5   # gaps, padded to column F
+        wb.create_sheet("숫자")["A1"] = 1
+        xlsx = os.path.join(tmp, "h.xlsx")
+        wb.save(xlsx)
+        expected = ["Unnamed: 0", "상호", "Unnamed: 2", "ID", "Unnamed: 4", "Unnamed: 5"]
+        assert fast_xlsx_header(xlsx, "명단", 1) == expected
+        assert fast_xlsx_header(xlsx, "숫자", 1) is None      # numbers need the styles: openpyxl path
+        assert read_header_file(xlsx, "숫자", 1) == ["1"]
+
+        csv_path = os.path.join(tmp, "h.csv")
+        pd.DataFrame({"ID": ["1"], "상호": ["a"]}).to_csv(csv_path, index=False, encoding="utf-8-sig")
+        files = [{"path": xlsx, "sheet": None, "header": 1}, {"path": csv_path, "sheet": None, "header": 1}]
+        assert prescan_files(files) == [(["명단", "숫자"], expected), (["CSV"], ["ID", "상호"])]
+        calls = []
+        read = excel_io.read_header_file
+        excel_io.read_header_file = lambda *a: calls.append(a) or []
+        try:
+            assert cached_header(xlsx, "명단", 1) == expected and not calls
+            os.utime(csv_path, ns=(0, 0))                      # changed file -> read again
+            cached_header(csv_path, "CSV", 1)
+            assert len(calls) == 1
+        finally:
+            excel_io.read_header_file = read
+        print("PASS: Headers prescanned concurrently and cached per file fingerprint.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def test_xlsx_stream():
+    print("\n--- Testing Streamed XLSX Writer ---")
+    import excel_io, tempfile, shutil, openpyxl
+    import numpy as np
+    from excel_io import write_xlsx_stream
+    tmp = tempfile.mkdtemp()
+    max_rows = excel_io.XLSX_MAX_ROWS
+    try:
+        df = pd.DataFrame({"상호": pd.Categorical(["a", "b", "", None, "a"]),
+                           "메모": pd.array(["x<y & z", " lead", "bad\x01char", None, "한글"], dtype="string[pyarrow]"),
+                           "유사도": [87.5, 100, np.nan, 3, 4]})
+        path = os.path.join(tmp, "out.xlsx")
+        excel_io.XLSX_MAX_ROWS = 3                      # header + 2 rows per sheet
+        assert write_xlsx_stream(path, [("matched", df), ("fuzzy_review", df.head(1))], chunk_rows=1) == \
+            ["matched", "matched_2", "matched_3", "fuzzy_review"]
+        sheets = pd.read_excel(path, sheet_name=None, dtype=str, keep_default_na=False)
+        back = pd.concat([sheets[n] for n in ("matched", "matched_2", "matched_3")], ignore_index=True)
+        assert back["상호"].tolist() == ["a", "b", "", "", "a"]
+        assert back["메모"].tolist() == ["x<y & z", " lead", "badchar", "", "한글"]
+        assert back["유사도"].tolist() == ["87.5", "100", "", "3", "4"]
+        ws = openpyxl.load_workbook(path)["matched_2"]
+        assert ws.freeze_panes == "A2" and ws["A1"].font.b and ws["C2"].value is None and ws["C3"].value == 3
+        print("PASS: Streamed xlsx split past the row limit, values and header kept.")
+    finally:
+        excel_io.XLSX_MAX_ROWS = max_rows
+        shutil.rmtree(tmp, ignore_errors=True)
+
 def clean_up():
     print("\nCleaning up...")
     if os.path.exists("test_load.xlsx"): os.remove("test_load.xlsx")
     if os.path.exists("test_load.csv"): os.remove("test_load.csv")
 
+def test_illegal_chars():
+    print("\n--- Testing Illegal Character Cleanup ---")
+    import numpy as np
+    from utils import remove_illegal_chars, remove_illegal_chars_series
+    plain = pd.Series(["a", "b", None, np.nan, 7] * 3, dtype=object)
+    assert remove_illegal_chars_series(plain) is plain  # clean columns are not copied
+    dirty = pd.Series(["a\x01b", "c", None, np.nan, 7, "\x1f"] * 3, dtype=object)
+    out = remove_illegal_chars_series(dirty)
+    assert out.tolist()[:2] == ["ab", "c"] and out[5] == "" and out[4] == 7
+    assert out.equals(dirty.map(remove_illegal_chars))
+    cat = pd.Series(["x\x02", "y", "x\x02"], dtype="category")
+    assert remove_illegal_chars_series(cat).tolist() == ["x", "y", "x"]
+    text = pd.Series(["x\x02", "y"], dtype="string")
+    assert remove_illegal_chars_series(text).tolist() == ["x", "y"]
+    compact = pd.Series(["x", None, "y"], dtype="string[pyarrow]")
+    assert remove_illegal_chars_series(compact) is compact
+    out = remove_illegal_chars_series(pd.Series(["x\x02", None, "y"], dtype="string[pyarrow]"))
+    assert out.dtype == compact.dtype and out.tolist() == ["x", pd.NA, "y"]
+    # the xlsx writer cleans through the same helper (values, categories and headers)
+    import tempfile, shutil
+    from excel_io import write_xlsx_stream
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "illegal.xlsx")
+        write_xlsx_stream(path, [("matched", pd.DataFrame({"메\x07모": dirty, "상호": cat.repeat(6).reset_index(drop=True)}))])
+        back = pd.read_excel(path, dtype=str, keep_default_na=False)
+        assert back.columns.tolist() == ["메모", "상호"]
+        assert back["메모"].tolist()[:6] == ["ab", "c", "", "", "7", ""] and back["상호"].tolist()[:3] == ["x", "x", "x"]
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Only values with illegal characters are rewritten.")
+
 if __name__ == "__main__":
     try:
         create_sample_files()
         test_sheet_loading()
         test_column_loading()
+        test_parse_cache()
+        test_column_projection()
+        test_typed_loading()
+        test_compact_strings()
+        test_filter_pushdown()
+        test_filter_pushdown_dtypes()
+        test_chunk_encoding()
+        test_header_prescan()
+        test_xlsx_stream()
+        test_illegal_chars()
     except Exception as e:
         import traceback
         traceback.print_exc()
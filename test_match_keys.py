@@ -0,0 +1,103 @@
+import pandas as pd
+import numpy as np
+import matcher
+from matcher import _factorize_keys, _row_indexer, _hash_row_indexer, _KeyIndex
+
+# Keys that collided with the old "||"-joined string key:
+#   ("b||c", "") and ("b", "||c") both became "b||c||"
+BASE = pd.DataFrame({
+    "K1": ["a", "a", "b||c", "b", "c", None],
+    "K2": ["x", "y", "", "||c", "z", "n"],
+})
+TARGET = pd.DataFrame({
+    "K1": ["b", "a", "c", "a", None],
+    "K2": ["||c", "x", "z", "x", "n"],
+})
+EXPECTED = [1, -1, -1, 0, 2, 4]
+
+
+def _cat(df):
+    return df.apply(lambda s: s.astype("category"))
+
+
+def test_factorized_keys():
+    print("\n--- Factorized Key Join ---")
+    b_codes, t_codes = _factorize_keys(_cat(BASE), _cat(TARGET), ["K1", "K2"])
+    pos = _row_indexer(b_codes, t_codes)
+    print(f"Positions: {pos.tolist()}")
+    assert pos.tolist() == EXPECTED
+    print("PASS: Factorized positions correct.")
+
+
+def test_hashed_keys():
+    print("\n--- Hashed Key Join ---")
+    pos = _hash_row_indexer(_cat(BASE), _cat(TARGET), ["K1", "K2"])
+    print(f"Positions: {pos.tolist()}")
+    assert pos.tolist() == EXPECTED
+    print("PASS: Hashed positions correct.")
+
+
+def test_hash_collisions():
+    print("\n--- Hash Collision Verification ---")
+    orig = matcher._hash_keys
+    # Force massive collisions: every row lands in one of two buckets
+    matcher._hash_keys = lambda df, cols: orig(df, cols) % np.uint64(2)
+    try:
+        pos = _hash_row_indexer(_cat(BASE), _cat(TARGET), ["K1", "K2"])
+    finally:
+        matcher._hash_keys = orig
+    print(f"Positions: {pos.tolist()}")
+    assert pos.tolist() == EXPECTED
+    print("PASS: Collisions resolved exactly.")
+
+
+def test_key_index():
+    print("\n--- Key Index (shared codes, densified) ---")
+    limit = matcher._CODE_LIMIT
+    try:
+        for code_limit in (limit, 4):  # 4: every key column past the first is densified
+            matcher._CODE_LIMIT = code_limit
+            index = _KeyIndex(_cat(TARGET), ["K1", "K2"])
+            assert index.positions_for(_cat(BASE)).tolist() == EXPECTED
+            b_codes, t_codes = _factorize_keys(_cat(BASE), _cat(TARGET), ["K1", "K2"])
+            assert _row_indexer(b_codes, t_codes).tolist() == EXPECTED
+    finally:
+        matcher._CODE_LIMIT = limit
+    print("PASS: Key index and factorized join agree.")
+
+
+def test_key_modes():
+    print("\n--- Key Modes in match_universal ---")
+    import os, shutil, tempfile
+    tmp = tempfile.mkdtemp()
+    orig = matcher._hash_row_indexer
+    calls = []
+    matcher._hash_row_indexer = lambda *a: calls.append(1) or orig(*a)
+    try:
+        n = 50000  # the fast path (and key_mode) starts here
+        keys = pd.DataFrame({"K1": [str(i % 100) for i in range(n)], "K2": [str(i // 100) for i in range(n)],
+                             "K3": ["x"] * n})
+        keys.to_csv(os.path.join(tmp, "base.csv"), index=False)
+        keys.iloc[::2].assign(V=[str(i) for i in range(0, n, 2)]).to_csv(os.path.join(tmp, "target.csv"), index=False)
+        cfg = lambda name: {"type": "file", "path": os.path.join(tmp, name), "sheet": "CSV", "header": 1}
+        results = {}
+        for mode in ("auto", "factorize", "hash"):
+            out, summary, _ = matcher.match_universal(cfg("base.csv"), cfg("target.csv"), ["K1", "K2", "K3"], ["V"],
+                                                      os.path.join(tmp, mode), {"key_mode": mode, "output_format": "csv"},
+                                                      None, {})
+            assert bool(calls) == (mode == "hash"), f"{mode}: hash join {'not ' if mode == 'hash' else ''}used"
+            results[mode] = pd.read_csv(out, dtype=str, keep_default_na=False)["V"].tolist()
+        assert results["auto"] == results["factorize"] == results["hash"]
+        assert results["auto"][:3] == ["0", "", "2"]
+    finally:
+        matcher._hash_row_indexer = orig
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: auto never hashes; key_mode='hash' is an explicit opt-in with the same result.")
+
+
+if __name__ == "__main__":
+    test_factorized_keys()
+    test_hashed_keys()
+    test_hash_collisions()
+    test_key_index()
+    test_key_modes()
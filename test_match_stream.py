@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+import pandas as pd
+from matcher import match_universal
+
+
+def _make_files(tmp):
+    base = pd.DataFrame({
+        "사번": [str(1000 + i) for i in range(25)],
+        "이름": [f"직원{i}" for i in range(25)],
+    })
+    target = pd.DataFrame({
+        "사번": [str(1000 + i) for i in range(0, 25, 2)],
+        "부서": [f"부서{i}" for i in range(0, 25, 2)],
+    })
+    base.to_csv(os.path.join(tmp, "base.csv"), index=False, encoding="utf-8-sig")
+    target.to_csv(os.path.join(tmp, "target.csv"), index=False, encoding="utf-8-sig")
+    cfg = lambda name: {"type": "file", "path": os.path.join(tmp, name), "sheet": "CSV", "header": 1}
+    return cfg("base.csv"), cfg("target.csv")
+
+
+def _run(b_cfg, t_cfg, out_dir, options):
+    out, summary, preview = match_universal(b_cfg, t_cfg, ["사번"], ["부서"], out_dir, options, None, {})
+    if out.endswith(".xlsx"):
+        return pd.read_excel(out, dtype=str, keep_default_na=False), summary
+    return pd.read_csv(out, dtype=str, keep_default_na=False, encoding="utf-8-sig"), summary
+
+
+def test_stream_matches_in_memory():
+    print("\n--- Streaming (Chunk) Match ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        df_s, summary_s = _run(b_cfg, t_cfg, os.path.join(tmp, "out_s"), {"stream": True, "chunk_rows": 4})
+        print(summary_s)
+        assert len(df_s) == 25
+        assert df_s["부서"].ne("").sum() == 13
+        assert "25건 중 13건" in summary_s
+
+        out_m, summary_m, _ = match_universal(b_cfg, t_cfg, ["사번"], ["부서"], os.path.join(tmp, "out_m"),
+                                              {"stream": False}, None, {})
+        df_m = pd.read_excel(out_m, dtype=str, keep_default_na=False)
+        assert summary_m == summary_s
+        assert (df_m.values == df_s.values).all()
+        df_c, summary_c = _run(b_cfg, t_cfg, os.path.join(tmp, "out_c"),
+                               {"stream": True, "chunk_rows": 4, "output_format": "csv"})
+        assert summary_c == summary_s and (df_c.values == df_s.values).all()
+        print("PASS: Streaming result correct.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_stream_xlsx_base():
+    print("\n--- Streaming Match (xlsx base) ---")
+    import openpyxl
+    tmp = tempfile.mkdtemp()
+    try:
+        # read_excel turns the text keys "00000".. into numbers; streamed chunks must agree
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["사번", "재직"])
+        for i in range(6):
+            ws.append([f"{i:05d}", None if i == 3 else i % 2 == 0])
+        wb.save(os.path.join(tmp, "base.xlsx"))
+        pd.DataFrame({"사번": [str(i) for i in range(6)], "부서": [f"부서{i}" for i in range(6)]}).to_csv(
+            os.path.join(tmp, "target.csv"), index=False, encoding="utf-8-sig")
+        b_cfg = {"type": "file", "path": os.path.join(tmp, "base.xlsx"), "sheet": 0, "header": 1}
+        t_cfg = {"type": "file", "path": os.path.join(tmp, "target.csv"), "sheet": "CSV", "header": 1}
+
+        df_m, summary_m = _run(b_cfg, t_cfg, os.path.join(tmp, "out_m"), {"stream": False})
+        assert df_m["사번"].tolist() == [str(i) for i in range(6)] and df_m["부서"].ne("").all()
+        for fmt in ("xlsx", "csv"):
+            df_s, summary_s = _run(b_cfg, t_cfg, os.path.join(tmp, "out_" + fmt),
+                                   {"stream": True, "chunk_rows": 4, "output_format": fmt})
+            assert summary_s == summary_m and df_s.equals(df_m)
+        print("PASS: Streamed xlsx base matches like the in-memory path.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_stream_xlsx_sheets():
+    print("\n--- Streaming xlsx (row limit) ---")
+    import excel_io
+    tmp = tempfile.mkdtemp()
+    max_rows = excel_io.XLSX_MAX_ROWS
+    excel_io.XLSX_MAX_ROWS = 11  # 10 data rows per sheet
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        out, _, _ = match_universal(b_cfg, t_cfg, ["사번"], ["부서"], os.path.join(tmp, "out"),
+                                    {"stream": True, "chunk_rows": 4}, None, {})
+        assert out.endswith(".xlsx")
+        sheets = pd.read_excel(out, sheet_name=None, dtype=str, keep_default_na=False)
+        assert list(sheets) == ["matched", "matched_2", "matched_3"]
+        df = pd.concat(sheets.values(), ignore_index=True)
+        assert [len(d) for d in sheets.values()] == [10, 10, 5]
+        assert df["사번"].tolist() == [str(1000 + i) for i in range(25)] and df["부서"].ne("").sum() == 13
+    finally:
+        excel_io.XLSX_MAX_ROWS = max_rows
+        shutil.rmtree(tmp, ignore_errors=True)
+    print("PASS: Streamed chunks appended to xlsx sheets.")
+
+
+def test_stream_cancel():
+    print("\n--- Streaming Cancel ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        for fmt in ("csv", "xlsx"):
+            calls = {"n": 0}
+
+            def cancel_check():
+                calls["n"] += 1
+                return calls["n"] > 4
+
+            out_dir = os.path.join(tmp, f"out_{fmt}")
+            try:
+                match_universal(b_cfg, t_cfg, ["사번"], ["부서"], out_dir,
+                                {"stream": True, "chunk_rows": 4, "output_format": fmt}, None, {},
+                                cancel_check=cancel_check)
+            except InterruptedError:
+                pass
+            else:
+                raise AssertionError("cancel_check was ignored")
+            # no truncated result is left behind
+            assert os.listdir(out_dir) == [], os.listdir(out_dir)
+        print("PASS: Cancelled between chunks, partial results removed.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_columnar_output():
+    print("\n--- Parquet / Feather Output ---")
+    import pyarrow.parquet as pq
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg, t_cfg = _make_files(tmp)
+        pd.DataFrame({"사번": [str(1000 + i) for i in range(0, 25, 2)], "부서": [f"부서{i}" for i in range(0, 25, 2)],
+                      "점수": list(range(13))}).to_csv(t_cfg["path"], index=False, encoding="utf-8-sig")
+        for fmt in ("parquet", "feather"):
+            read = pd.read_parquet if fmt == "parquet" else pd.read_feather
+            out, summary, _ = match_universal(b_cfg, t_cfg, ["사번"], ["부서", "점수"], os.path.join(tmp, fmt),
+                                              {"output_format": fmt, "typed_load": True}, None, {})
+            assert out.endswith(f".{fmt}") and "25건 중 13건" in summary
+            df = read(out)
+            # typed columns keep their dtype: numbers stay numbers, unmatched rows missing
+            assert str(df["점수"].dtype) == "Int64" and df["점수"].notna().sum() == 13
+            assert df["점수"].sum() == sum(range(13)) and df["부서"].ne("").sum() == 13
+
+            out_s, summary_s, _ = match_universal(b_cfg, t_cfg, ["사번"], ["부서", "점수"], os.path.join(tmp, fmt + "_s"),
+                                                  {"output_format": fmt, "stream": True, "chunk_rows": 4}, None, {})
+            assert out_s.endswith(f".{fmt}") and summary_s == summary
+            df_s = read(out_s)
+            assert df_s["부서"].tolist() == df["부서"].tolist() and len(df_s) == 25
+            if fmt == "parquet":
+                assert pq.ParquetFile(out_s).metadata.num_row_groups == 7   # one per streamed chunk
+        print("PASS: Columnar results keep dtypes (in memory and streamed).")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_stream_matches_in_memory()
+    test_stream_xlsx_base()
+    test_stream_xlsx_sheets()
+    test_stream_cancel()
+    test_columnar_output()
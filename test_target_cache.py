@@ -0,0 +1,54 @@
+import os
+import time
+import shutil
+import tempfile
+import pandas as pd
+from matcher import match_universal
+
+
+def _write(tmp, name, df):
+    path = os.path.join(tmp, name)
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+    return {"type": "file", "path": path, "sheet": "CSV", "header": 1}
+
+
+def _match(b_cfg, t_cfg, out_dir, rules=None, messages=None):
+    progress = (lambda m, v=None: messages.append(m)) if messages is not None else None
+    out, summary, _ = match_universal(b_cfg, t_cfg, ["ID"], ["Grade"], out_dir, {}, rules, {}, progress)
+    return pd.read_excel(out, dtype=str, keep_default_na=False)
+
+
+def test_prepared_target_cache():
+    print("\n--- Prepared Target Cache ---")
+    tmp = tempfile.mkdtemp()
+    try:
+        b_cfg = _write(tmp, "base.csv", pd.DataFrame({"ID": ["1", "2", "3"], "Name": ["a", "b", "c"]}))
+        t_cfg = _write(tmp, "target.csv", pd.DataFrame({"ID": ["1", "2"], "Grade": ["A", "B"]}))
+        out_dir = os.path.join(tmp, "out")
+
+        cold = _match(b_cfg, t_cfg, out_dir)
+        messages = []
+        warm = _match(b_cfg, t_cfg, out_dir, messages=messages)
+        assert any("[Cache]" in m for m in messages), "warm run did not use the cache"
+        assert (cold.values == warm.values).all()
+        print("PASS: Warm run reused the prepared target.")
+
+        # Different replacement rules -> different cache entry
+        messages = []
+        ruled = _match(b_cfg, t_cfg, out_dir, rules={"Grade": {"A": "Z"}}, messages=messages)
+        assert not any("[Cache]" in m for m in messages)
+        assert ruled["Grade"].tolist() == ["Z", "B", ""]
+        print("PASS: Replacement rules are part of the cache key.")
+
+        # Changing the file invalidates the entry
+        time.sleep(0.01)
+        _write(tmp, "target.csv", pd.DataFrame({"ID": ["1", "2", "3"], "Grade": ["C", "D", "E"]}))
+        changed = _match(b_cfg, t_cfg, out_dir)
+        assert changed["Grade"].tolist() == ["C", "D", "E"]
+        print("PASS: Modified target file was re-read.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_prepared_target_cache()
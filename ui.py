@@ -1095,10 +1095,47 @@ class MultiFileDialog(tk.Toplevel):
         # Deep copy to allow cancellation
         self.files = copy.deepcopy(current_files) if current_files else [] 
         
+        # sheet names and headers are read in the background as soon as files are listed
+        self._scanning = 0
+
         # UI Components
         self._init_ui()
+        self._prescan()
         self._render_file_list()
 
+    def _prescan(self, files=None, render=True):
+        """Warm the header/sheet cache (excel_io.prescan_files) for the given files, then re-render."""
+        files = [dict(f) for f in (self.files if files is None else files)]
+        if not files:
+            return
+        if not render:
+            # sheet/header changed on a listed file: only the cache needs the new header
+            threading.Thread(target=self._warm_cache, args=(files,), daemon=True).start()
+            return
+        self._scanning += 1
+
+        def _task():
+            self._warm_cache(files)
+
+            def _done():
+                self._scanning -= 1
+                if self.winfo_exists():
+                    self._render_file_list()
+            try:
+                self.after(0, _done)
+            except (tk.TclError, RuntimeError):
+                pass  # dialog closed meanwhile
+
+        threading.Thread(target=_task, daemon=True).start()
+
+    @staticmethod
+    def _warm_cache(files):
+        try:
+            from excel_io import prescan_files
+            prescan_files(files)
+        except Exception as e:
+            print(f"Header prescan failed: {e}")
+
     def _init_ui(self):
         # Header
         header = tk.Frame(self, bg="#f8f9fa", pady=int(15 * self.scale))
@@ -1173,19 +1210,24 @@ class MultiFileDialog(tk.Toplevel):
 
             # 4. Sheet Selector (Right of Info)
             sheets = f.get('sheets', [])
+            loading = False
             if not sheets:
-                try:
-                    from excel_io import get_sheet_names
-                    sheets = get_sheet_names(f['path'])
-                    f['sheets'] = sheets
-                    if not f.get('sheet') and sheets:
-                        f['sheet'] = sheets[0]
-                except:
-                    sheets = ["Load Error"]
+                if self._scanning:
+                    # the prescan re-renders the list when it is done
+                    sheets, loading = ["불러오는 중..."], True
+                else:
+                    try:
+                        from excel_io import cached_sheet_names
+                        sheets = cached_sheet_names(f['path'])
+                        f['sheets'] = sheets
+                        if not f.get('sheet') and sheets:
+                            f['sheet'] = sheets[0]
+                    except:
+                        sheets = ["Load Error"]
             
-            current_sheet = f.get('sheet', (sheets[0] if sheets else ""))
+            current_sheet = sheets[0] if loading else f.get('sheet', (sheets[0] if sheets else ""))
             
-            combo = ttk.Combobox(row, values=sheets, state="readonly", width=15)
+            combo = ttk.Combobox(row, values=sheets, state="disabled" if loading else "readonly", width=15)
             combo.set(current_sheet)
             combo.pack(side="right", padx=5)
             combo.bind("<<ComboboxSelected>>", lambda e, idx=i, c=combo: self._update_sheet(idx, c.get()))
@@ -1213,6 +1255,14 @@ class MultiFileDialog(tk.Toplevel):
 
     def _update_sheet(self, idx, val):
         self.files[idx]['sheet'] = val
+        self._prescan([self.files[idx]], render=False)
+
+    def _update_header(self, idx, val):
+        try:
+            self.files[idx]['header'] = max(1, int(val))
+        except (TypeError, ValueError, tk.TclError):
+            return
+        self._prescan([self.files[idx]], render=False)
         
     def _open_mapping(self, idx):
         f = self.files[idx]
@@ -1220,10 +1270,10 @@ class MultiFileDialog(tk.Toplevel):
             show_custom_alert(self, "경고", "먼저 시트를 선택해야 합니다.", "warning")
             return
             
-        # Fetch headers for this file/sheet
+        # Fetch headers for this file/sheet (instant once prescanned)
         try:
-            from excel_io import read_header_file
-            headers = read_header_file(f['path'], f['sheet'], f.get('header', 1))
+            from excel_io import cached_header
+            headers = cached_header(f['path'], f['sheet'], f.get('header', 1))
             
             # Map Base Keys -> Target Columns
             # We want current_mapping to be Base -> Target
@@ -1250,8 +1300,8 @@ class MultiFileDialog(tk.Toplevel):
             return
             
         try:
-            from excel_io import read_header_file
-            headers = read_header_file(f['path'], f['sheet'], f.get('header', 1))
+            from excel_io import cached_header
+            headers = cached_header(f['path'], f['sheet'], f.get('header', 1))
             
             dlg = BatchColumnSelectDialog(self, headers, f.get('fetch_cols'))
             self.wait_window(dlg)
@@ -1280,13 +1330,13 @@ class MultiFileDialog(tk.Toplevel):
         self.unified_btn["text"] = "분석 중..."
         self.unified_btn["state"] = "disabled"
 
+        files = [dict(f) for f in self.files]
+
         def _task():
             try:
-                from excel_io import read_header_file
-                all_file_headers = []
-                for f in self.files:
-                    h = read_header_file(f['path'], f['sheet'], f.get('header', 1))
-                    all_file_headers.append(set(h))
+                from excel_io import prescan_files
+                # concurrent, and cache hits for files the prescan already read
+                all_file_headers = [set(h) for _, h in prescan_files(files)]
                 
                 # Intersection of all headers
                 common_cols = set.intersection(*all_file_headers) if all_file_headers else set()
@@ -1335,6 +1385,7 @@ class MultiFileDialog(tk.Toplevel):
             added_count += 1
             
         if added_count > 0:
+            self._prescan(self.files[-added_count:])
             self._render_file_list()
         
     def _remove_file(self, idx):
@@ -1872,6 +1923,8 @@ class App(BaseApp):
         self.target_presets: dict[str, list[str]] = {}
         self.base_presets: dict[str, list[str]] = {}
         self.opt_fuzzy = tk.BooleanVar(value=True)
+        self.opt_fuzzy_jamo = tk.BooleanVar(value=False)
+        self.opt_fuzzy_review = tk.BooleanVar(value=False)
         self.opt_color = tk.BooleanVar(value=True)
         self.opt_top10 = tk.BooleanVar(value=False)
         self.opt_match_only = tk.BooleanVar(value=False)
@@ -2297,6 +2350,14 @@ class App(BaseApp):
         fuzzy_check = ttk.Checkbutton(opt_frame, text="오타 보정 (Fuzzy Match)", variable=self.opt_fuzzy)
         fuzzy_check.pack(side="left", padx=(0, 10))
         ToolTip(fuzzy_check, "오타를 자동으로 보정합니다\n예: '홍길동' ≈ '홍길둥' (유사도 90% 이상)")
+
+        jamo_check = ttk.Checkbutton(opt_frame, text="한글 자모 단위 보정", variable=self.opt_fuzzy_jamo)
+        jamo_check.pack(side="left", padx=(0, 10))
+        ToolTip(jamo_check, "오타 보정 시 한글을 자모 단위로 비교합니다\n예: '박희본' ≈ '박회본' (모음 하나만 다름)")
+
+        review_check = ttk.Checkbutton(opt_frame, text="유사 후보 검토 시트", variable=self.opt_fuzzy_review)
+        review_check.pack(side="left", padx=(0, 10))
+        ToolTip(review_check, "오타 보정 시 키마다 상위 3개 후보와 유사도를 'fuzzy_review' 시트에 기록합니다\n(유사도 60% 이상 후보)")
         
         color_check = ttk.Checkbutton(opt_frame, text="색상 강조 (Highlight)", variable=self.opt_color)
         color_check.pack(side="left", padx=(0, 10))
@@ -3116,6 +3177,8 @@ class App(BaseApp):
 
             options = {
                 "fuzzy": self.opt_fuzzy.get(),
+                "fuzzy_jamo": self.opt_fuzzy_jamo.get(),
+                "fuzzy_top_k": 3 if self.opt_fuzzy_review.get() else 0,
                 "color": self.opt_color.get(),
                 "top10": self.opt_top10.get(),
                 "match_only": self.opt_match_only.get()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 try:
     from rapidfuzz import process, fuzz
@@ -74,7 +75,9 @@ def smart_format(val, col_name=None) -> str:
         
     return s
 
-def get_fuzzy_mapper(base_keys: pd.Series, target_keys: pd.Series, threshold: int = 90, progress_callback=None) -> dict:
+def get_fuzzy_mapper(base_keys: pd.Series, target_keys: pd.Series, threshold: int = 90, progress_callback=None,
+                     cancel_check=lambda: False, jamo: bool = False, processes: int = None) -> dict:
+    """Target key -> closest base key (fuzzy_engine.top_matches) for target keys without an exact match."""
     if not RAPIDFUZZ_AVAILABLE or base_keys is None or target_keys is None: return {}
     if base_keys.empty or target_keys.empty: return {}
     base_choices = base_keys.dropna().astype(str).unique().tolist()
@@ -84,29 +87,72 @@ def get_fuzzy_mapper(base_keys: pd.Series, target_keys: pd.Series, threshold: in
     base_set = set(base_choices)
     target_choices = [t for t in target_choices if t and t not in base_set]
     
-    # SAFETY: Avoid N*M explosion (Limit to 50M comparisons for responsiveness)
-    if not target_choices or (len(base_choices) * len(target_choices) > 50000000):
+    if not target_choices:
          return {} 
 
-    mapper = {}
-    total = len(target_choices)
-    for i, t_key in enumerate(target_choices):
-        if progress_callback and i % 100 == 0:
-            progress_callback(i, total)
-            
-        m = process.extractOne(t_key, base_choices, scorer=fuzz.token_sort_ratio)
-        if not m: continue
-        best, score, _ = m
-        if score >= threshold and t_key != best:
-            mapper[t_key] = best
-    return mapper
+    from fuzzy_engine import top_matches
+    pos, _ = top_matches(target_choices, base_choices, 1, threshold, progress_callback=progress_callback,
+                         cancel_check=cancel_check, jamo=jamo, processes=processes)
+    return {t_key: base_choices[p] for t_key, p in zip(target_choices, pos[:, 0].tolist())
+            if p >= 0 and t_key != base_choices[p]}
 
 import re
+# control characters Excel (openpyxl) refuses in cell text
+_ILLEGAL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F]')
+
 def remove_illegal_chars(val):
     """Remove characters that are illegal in Excel (openpyxl)"""
     if not isinstance(val, str):
         return val
-    return re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F]', '', val)
+    return _ILLEGAL_CHARS.sub('', val)
+
+def _str_values(values):
+    """(mask, values) of the str entries of an object array."""
+    values = np.asarray(values, dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return np.ones(len(values), dtype=bool), values
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    return is_str, values[is_str]
+
+def _has_illegal(strs) -> bool:
+    # one regex scan over the joined text: clean columns (nearly all of them) stop here
+    return len(strs) > 0 and _ILLEGAL_CHARS.search("\n".join(strs)) is not None
+
+def _dirty_values(values) -> np.ndarray:
+    """Positions of the distinct values that hold illegal characters."""
+    is_str, strs = _str_values(values)
+    if not _has_illegal(strs):
+        return np.array([], dtype=np.intp)
+    hit = np.fromiter((_ILLEGAL_CHARS.search(v) is not None for v in strs), dtype=bool, count=len(strs))
+    return np.flatnonzero(is_str)[hit]
+
+def remove_illegal_chars_series(series: pd.Series) -> pd.Series:
+    """
+    remove_illegal_chars for a whole column. Clean columns come back unchanged (no copy)
+    after one scan of their text; otherwise only the distinct values holding an illegal
+    character are cleaned and their rows rewritten, through the value codes.
+    Categorical and string columns keep their dtype.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if not len(_dirty_values(series.cat.categories)):
+            return series
+        return recode_categories(series, lambda u: u.map(remove_illegal_chars))
+    is_text = isinstance(series.dtype, pd.StringDtype)
+    if series.dtype != object and not is_text:
+        return series
+    if not _has_illegal(_str_values(series.to_numpy(dtype=object))[1]):
+        return series
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype=object)
+    dirty = _dirty_values(uniques)
+    cleaned = np.empty(len(uniques), dtype=object)
+    cleaned[dirty] = [_ILLEGAL_CHARS.sub('', uniques[i]) for i in dirty]
+    rows = np.isin(codes, dirty)
+    values = series.to_numpy(dtype=object, copy=True)
+    values[rows] = cleaned[codes[rows]]
+    out = pd.Series(values, index=series.index, name=series.name)
+    # compact (arrow-backed) strings stay compact
+    return out.astype(series.dtype) if is_text else out
 
 def vectorize_norm(series: pd.Series) -> pd.Series:
     """Vectorized version of norm() for high performance on large datasets."""
@@ -164,9 +210,26 @@ def vectorize_smart_format(series: pd.Series, col_name: str) -> pd.Series:
         
     return s
 
+def recode_categories(series: pd.Series, func, na="") -> pd.Series:
+    """
+    Applies func to the categories of a categorical Series only (never to the rows).
+    Categories that end up equal share one code; missing values become `na`.
+    """
+    cats = pd.Series(series.cat.categories.astype(object))
+    new_values = pd.Series(list(func(cats)) + [na], dtype=object)
+    new_codes, uniques = pd.factorize(new_values)
+    # code -1 (missing) picks up the trailing `na` slot
+    codes = new_codes[series.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=series.index, name=series.name)
+
 def apply_expert_norm(series: pd.Series) -> pd.Series:
     """Breakthrough: Normalize unique values only. 100x faster for 1M rows with repeating data."""
     if series.empty: return series
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return recode_categories(series, vectorize_norm)
+    if series.dtype != 'object':
+        # typed columns (Int64, Float64, datetime): map as objects so NA keys hit the mapping too
+        series = series.astype(object)
     u = series.unique()
     u_norm = vectorize_norm(pd.Series(u))
     mapping = dict(zip(u, u_norm))
@@ -175,9 +238,13 @@ def apply_expert_norm(series: pd.Series) -> pd.Series:
 def apply_expert_format(series: pd.Series, col_name: str) -> pd.Series:
     """Breakthrough: Format unique values only. High performance for millions of rows."""
     if series.empty: return series
-    if series.dtype != 'object' and "월정료" not in str(col_name):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return recode_categories(series, lambda u: vectorize_smart_format(u, col_name))
+    is_text = isinstance(series.dtype, pd.StringDtype)
+    if series.dtype != 'object' and not is_text and "월정료" not in str(col_name):
         return series.astype(str)
     u = series.unique()
-    u_fmt = vectorize_smart_format(pd.Series(u), col_name)
+    u_fmt = vectorize_smart_format(pd.Series(u, dtype=object), col_name)
     mapping = dict(zip(u, u_fmt))
-    return series.map(mapping)
+    # compact (arrow-backed) strings stay compact
+    return series.map(mapping).astype(series.dtype) if is_text else series.map(mapping)
@@ -566,17 +566,22 @@ def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir,
     joined.columns = [remove_illegal_chars(str(c)) for c in joined.columns]
     
     total = len(joined)
-    save_as_csv = total > 50000
+    # options["output_format"]: "xlsx" (CSV above 50,000 rows), "csv", "parquet", "feather"
+    out_format = str(options.get("output_format") or "xlsx").lower()
+    if out_format not in ("xlsx", "csv", "parquet", "feather"):
+        raise ValueError(f"지원하지 않는 결과 형식입니다: {out_format}")
+    columnar = out_format in ("parquet", "feather")
+    save_as_csv = out_format == "csv" or (out_format == "xlsx" and total > 50000)
 
     # Sanitize entire dataframe ONLY if saving to Excel (openpyxl/xlsxwriter requirement)
     from utils import vectorize_remove_illegal_chars
-    if not save_as_csv:
+    if not save_as_csv and not columnar:
         log_progress("데이터 저장 준비 중 (Excel 특수문자 제거)...", 95)
         _debug_log("Sanitizing data for Excel...")
         for col in joined.select_dtypes(include=['object']).columns:
             joined[col] = vectorize_remove_illegal_chars(joined[col])
     else:
-        log_progress("대량 데이터 모드: 특수문자 제거 건너뜀 (CSV)...", 95)
+        log_progress(f"특수문자 제거 건너뜀 ({out_format.upper() if columnar else 'CSV'})...", 95)
 
     if total:
         # vectorized matched count: any non-empty in take_cols
@@ -608,14 +613,20 @@ def _finalize_match(joined, base_cols, take_cols, options, base_config, out_dir,
     safe = os.path.basename(str(suffix)).split(".")[0]
     ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    ext = ".csv" if save_as_csv else ".xlsx"
+    ext = f".{out_format}" if columnar else (".csv" if save_as_csv else ".xlsx")
     out_path = os.path.join(out_dir, f"result_{safe}_{ts}{ext}")
     
     log_progress(f"최종 결과 저장 중: {os.path.basename(out_path)}", 97)
     _debug_log(f"Saving start: {out_path}")
 
     try:
-        if save_as_csv:
+        if out_format == "parquet":
+            # one row group per 100,000 rows so readers can skip / stream groups
+            joined.to_parquet(out_path, index=False, row_group_size=100_000)
+        elif out_format == "feather":
+            # uncompressed record batches: the file can be memory-mapped as is
+            joined.reset_index(drop=True).to_feather(out_path, compression="uncompressed", chunksize=100_000)
+        elif save_as_csv:
             joined.to_csv(out_path, index=False, encoding="utf-8-sig")
         else:
             try:
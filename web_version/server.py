@@ -79,6 +79,7 @@ async def process_match(
     match_only: bool = Form(False),
     fuzzy: bool = Form(False),
     top10: bool = Form(False),
+    output_format: str = Form("xlsx"),
     base_file_path: Optional[str] = Form(None),
     target_file_path: Optional[str] = Form(None),
 ):
@@ -136,7 +137,8 @@ async def process_match(
     options = {
         "fuzzy": fuzzy,
         "match_only": match_only,
-        "top10": top10
+        "top10": top10,
+        "output_format": output_format,
     }
     
     try:
@@ -164,13 +166,20 @@ async def process_match(
         traceback.print_exc()
         return {"error": str(e)}
 
+MEDIA_TYPES = {
+    '.csv': 'text/csv',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.parquet': 'application/vnd.apache.parquet',
+    '.feather': 'application/vnd.apache.arrow.file',
+}
+
 @app.get("/download/{session_id}/{filename}")
 async def download_result(session_id: str, filename: str):
     file_path = os.path.join(OUTPUT_DIR, session_id, filename)
     if not os.path.exists(file_path):
         return {"error": "File not found"}
         
-    media_type = 'text/csv' if filename.endswith('.csv') else 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    media_type = MEDIA_TYPES.get(os.path.splitext(filename)[1].lower(), 'application/octet-stream')
     return FileResponse(file_path, filename=filename, media_type=media_type)
 
 if __name__ == "__main__":